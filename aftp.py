@@ -0,0 +1,130 @@
+import os
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+from pftp import PersistentFTPClient
+
+load_dotenv()
+
+KEEPALIVE_INTERVAL = 30  # Seconds of idle time before the session is health-checked
+
+# Set FTP_INLINE=1 to run FTP calls directly on the event loop (the old behaviour), for comparison
+FTP_INLINE = os.getenv("FTP_INLINE") == "1"
+
+
+class FTPMetrics:
+    """
+    Time spent on FTP calls, split into time the event loop was blocked
+    and total wall time of the call.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.loop_seconds = 0.0
+        self.call_seconds = 0.0
+        self.max_loop_seconds = 0.0
+
+    def record(self, loop_seconds, call_seconds, failed=False):
+        self.calls += 1
+        self.errors += int(failed)
+        self.loop_seconds += loop_seconds
+        self.call_seconds += call_seconds
+        self.max_loop_seconds = max(self.max_loop_seconds, loop_seconds)
+
+    def summary(self):
+        """One-line summary for the console."""
+        return (f"{self.calls} calls ({self.errors} failed), {self.call_seconds:.2f}s in FTP, "
+                f"{self.loop_seconds:.3f}s blocking the event loop (max {self.max_loop_seconds * 1000:.1f}ms)")
+
+
+class AsyncFTPClient:
+    """
+    Asyncio front-end for PersistentFTPClient.
+    Every call runs on one dedicated worker thread, so the session is never used
+    concurrently and a slow or hung FTP host can't stall the Discord event loop.
+    """
+
+    def __init__(self, client=None, keepalive_interval=KEEPALIVE_INTERVAL, inline=FTP_INLINE):
+        self.client = client or PersistentFTPClient()
+        self.keepalive_interval = keepalive_interval
+        self.inline = inline
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ftp")
+        self.metrics = FTPMetrics()
+        self.last_used = 0.0
+        self.keepalive_task = None
+
+    async def run(self, func, *args):
+        """Runs a blocking PersistentFTPClient call on the FTP worker thread."""
+        self.last_used = time.monotonic()
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+
+        if self.inline:
+            try:
+                return func(*args)
+            finally:
+                elapsed = time.perf_counter() - started
+                self.metrics.record(elapsed, elapsed)
+
+        future = loop.run_in_executor(self.executor, self._timed, func, args)
+        loop_seconds = time.perf_counter() - started
+        failed = True
+        call_seconds = 0.0
+        try:
+            result, call_seconds = await future
+            failed = False
+            return result
+        finally:
+            self.metrics.record(loop_seconds, call_seconds, failed)
+
+    @staticmethod
+    def _timed(func, args):
+        started = time.perf_counter()
+        result = func(*args)
+        return result, time.perf_counter() - started
+
+    async def get_size(self, remote_path):
+        return await self.run(self.client.get_size, remote_path)
+
+    async def get_mtime(self, remote_path):
+        return await self.run(self.client.get_mtime, remote_path)
+
+    async def download_range(self, remote_path, callback, offset=0):
+        """Streams a remote file to callback from offset. The callback runs on the FTP thread."""
+        return await self.run(self.client.download_range, remote_path, callback, offset)
+
+    async def download_file(self, remote_path, local_dir="logs", local_file_name=None):
+        return await self.run(self.client.download_file, remote_path, local_dir, local_file_name)
+
+    async def list_dir(self, path="."):
+        return await self.run(self.client.list_dir, path)
+
+    async def upload_file(self, local_path, remote_path=None):
+        return await self.run(self.client.upload_file, local_path, remote_path)
+
+    async def keepalive(self):
+        """Health-checks the session with NOOP whenever it has been idle, reconnecting if needed."""
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            if time.monotonic() - self.last_used < self.keepalive_interval:
+                continue
+
+            try:
+                await self.run(self.client.ensure_connection)
+            except Exception as e:
+                print(f"⚠️ FTP health check failed: {e}")
+
+    def start_keepalive(self):
+        """Starts the health-check task if it isn't already running."""
+        if self.keepalive_task is None or self.keepalive_task.done():
+            self.keepalive_task = asyncio.get_running_loop().create_task(self.keepalive())
+        return self.keepalive_task
+
+    async def close(self):
+        """Stops the health check and closes the session."""
+        if self.keepalive_task:
+            self.keepalive_task.cancel()
+        await self.run(self.client.disconnect)
+        self.executor.shutdown(wait=False)
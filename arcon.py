@@ -0,0 +1,216 @@
+import os
+import asyncio
+from dotenv import load_dotenv
+from rcon import RconClient
+
+load_dotenv()
+
+READ_CHUNK_SIZE = 65536
+RESPONSE_TERMINATOR = b"\x00"  # Ends every response of a server that frames them, like the commands it receives
+READ_GAP = 0.15  # Seconds of silence that end an unframed response, once it looks complete
+MAX_READ_GAP = 1.0  # A command's gap doubles up to this each time its response's tail arrives late
+
+# How an unframed response of these commands ends; until it does, more is known to be coming
+COMMAND_TRAILERS = {
+    "getplayerdata": b"\n",
+    "playerlist": b"\n",
+    "serverdetails": b"\n",
+}
+
+# Commands whose responses can span many TCP segments get more time for the first byte
+COMMAND_TIMEOUTS = {
+    "getplayerdata": 10,
+    "playerlist": 8,
+}
+
+
+class AsyncRconClient:
+    """
+    asyncio-streams RCON client for The Isle Evrima, with the same command API as RconClient.
+    Responses are read into a reusable buffer until they end: at the 0x00 terminator, as soon
+    as it arrives. Once the server has terminated a response, every response is read to its
+    terminator. Without one, a response ends when the server goes quiet for the read gap,
+    but never before its command's trailer (COMMAND_TRAILERS). A response known to be
+    incomplete is never returned: if the rest doesn't arrive in time it is a timeout.
+    Bytes still waiting when the next command is sent are the late tail of the previous
+    response: they are discarded, and that command waits longer for silence from then on.
+    """
+
+    command_byte_map = RconClient.command_byte_map
+
+    def __init__(self, host=None, port=None, password=None, timeout=5, read_gap=READ_GAP):
+        self.host = host or os.getenv("SERVER_IP")
+        self.port = int(port or os.getenv("RCON_PORT"))
+        self.password = password or os.getenv("RCON_PW")
+        self.timeout = timeout
+        self.read_gap = read_gap
+        self.read_gaps = {}  # command name -> read gap, once a response of it was cut short
+        self.last_command = None
+        self.framed = False  # The server terminates its responses with RESPONSE_TERMINATOR
+        self.reader = None
+        self.writer = None
+        self.is_authorized = False
+        self.buffer = bytearray()
+        self.lock = asyncio.Lock()  # One command in flight per connection
+
+    @property
+    def is_connected(self):
+        #  A connection the server closed while idle shows up as EOF before anything is written
+        return self.writer is not None and not self.writer.is_closing() and not self.reader.at_eof()
+
+    async def connect(self):
+        """Opens and authorizes a connection. Returns True straight away if one is already open."""
+        if self.is_connected and self.is_authorized:
+            return True
+
+        if not self.host or not self.port or not self.password:
+            print("❌ RCON credentials missing! Set SERVER_IP, RCON_PORT, and RCON_PW in .env")
+            return False
+
+        await self.disconnect()
+        try:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), timeout=self.timeout
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            print(f"❌ Connection failed: {e}")
+            await self.disconnect()
+            return False
+
+        return await self.authorize()
+
+    async def authorize(self):
+        """Authenticates the RCON session with the server."""
+        if self.is_authorized:
+            return True
+
+        try:
+            response = await self._exchange(b'\x01' + self.password.encode() + b'\x00', self.timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            print(f"❌ Authorization failed: {e}")
+            await self.disconnect()
+            return False
+
+        if "Accepted" in response:
+            print("✅ Authentication successful.")
+            self.is_authorized = True
+            return True
+
+        print(f"❌ Authentication failed. Server response: {response}")
+        await self.disconnect()
+        return False
+
+    async def disconnect(self):
+        """Closes the connection safely."""
+        writer = self.writer
+        self.reader = None
+        self.writer = None
+        self.is_authorized = False
+
+        if writer:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except OSError as e:
+                print(f"⚠️ Error disconnecting: {e}")
+
+    async def _discard_late_bytes(self):
+        """Drops bytes that already arrived without waiting for more. Returns how many there were."""
+        discarded = 0
+        while True:
+            read = asyncio.ensure_future(self.reader.read(READ_CHUNK_SIZE))
+            await asyncio.sleep(0)  # A read with data buffered completes in its first step
+            if not read.done():
+                read.cancel()
+                await asyncio.wait({read})  # Frees the reader for the next read
+                return discarded
+
+            chunk = read.result()
+            if not chunk:
+                raise ConnectionResetError("RCON server closed the connection")
+            discarded += len(chunk)
+
+    def _may_be_complete(self, trailer):
+        """False while the buffered response is known to be cut short."""
+        return not self.framed and (trailer is None or self.buffer.endswith(trailer))
+
+    async def _read_response(self, timeout, read_gap=None, trailer=None):
+        """
+        Reads one response into the reusable buffer: waits up to `timeout` for the first
+        bytes, then reads until the terminator. An unframed response that may be complete
+        also ends after `read_gap` of silence; one that can't be waits up to `timeout` for more.
+        """
+        read_gap = read_gap or self.read_gap
+        self.buffer.clear()
+
+        chunk = await asyncio.wait_for(self.reader.read(READ_CHUNK_SIZE), timeout=timeout)
+        if not chunk:
+            raise ConnectionResetError("RCON server closed the connection")
+        self.buffer += chunk
+
+        while not self.buffer.endswith(RESPONSE_TERMINATOR):
+            may_be_complete = self._may_be_complete(trailer)
+            try:
+                chunk = await asyncio.wait_for(self.reader.read(READ_CHUNK_SIZE),
+                                               timeout=read_gap if may_be_complete else timeout)
+            except asyncio.TimeoutError:
+                if may_be_complete:
+                    break
+                raise
+            if not chunk:
+                if may_be_complete:
+                    break
+                raise ConnectionResetError("RCON server closed the connection mid-response")
+            self.buffer += chunk
+
+        if self.buffer.endswith(RESPONSE_TERMINATOR):
+            self.framed = True
+            del self.buffer[-len(RESPONSE_TERMINATOR):]
+        return self.buffer.decode('utf-8', errors='ignore')
+
+    async def _exchange(self, packet, timeout, read_gap=None, trailer=None):
+        self.writer.write(packet)
+        await self.writer.drain()
+        return await self._read_response(timeout, read_gap, trailer)
+
+    async def send_command(self, command_name, command_data="", timeout=None):
+        """
+        Sends a mapped command to the server safely.
+        - command_name: The name of the command (e.g., 'announce', 'kick', 'ban')
+        - command_data: Additional data for the command (e.g., message, player ID)
+        - timeout: Seconds to wait for the first byte of the response (per-command default)
+        """
+        if command_name not in self.command_byte_map:
+            return f"❌ Unknown command: {command_name}"
+
+        timeout = timeout or COMMAND_TIMEOUTS.get(command_name, self.timeout)
+        command_byte = self.command_byte_map[command_name]
+        packet = b'\x02' + bytes([command_byte]) + command_data.encode() + b'\x00'
+
+        async with self.lock:
+            if not self.is_connected or not self.is_authorized:
+                print("🔄 Attempting to reconnect to RCON server...")
+                if not await self.connect():
+                    return "❌ Cannot send command. Failed to reconnect."
+
+            try:
+                #  Anything already waiting belongs to the previous response, which was read too early
+                late = await self._discard_late_bytes()
+                if late and self.last_command:
+                    gap = min(self.read_gaps.get(self.last_command, self.read_gap) * 2, MAX_READ_GAP)
+                    self.read_gaps[self.last_command] = gap
+                    print(f"⚠️ Discarded {late} late bytes of a {self.last_command} response; "
+                          f"its read gap is now {gap * 1000:.0f}ms")
+
+                self.last_command = command_name
+                response = await self._exchange(packet, timeout, self.read_gaps.get(command_name),
+                                                COMMAND_TRAILERS.get(command_name))
+            except asyncio.TimeoutError:
+                #  A late response would be read as the answer to the next command
+                await self.disconnect()
+                return "⚠️ Timeout: No response received."
+            except OSError as e:
+                await self.disconnect()
+                return f"❌ Socket error: {e}"
+
+        return response if response else f"{command_name} Command Sent."
@@ -10,9 +10,16 @@ from commands.admin.clear_channel_messages import setup_clear_command
 from commands.other.restarts import setup_restarts_command
 from commands.patreon.unlock_specie import setup_unlock_command
 from commands.admin.rcon_send_command import setup_rcon_command
+from commands.account.set_server_target import setup_set_server_target_command
+from commands.account.get_target import setup_get_target_command
+from commands.storage.storage import setup_storage_command
+from commands.storage.claim_voucher import setup_claim_voucher_command
+from commands.storage.delete_voucher import setup_delete_voucher_command
 
-from scripts.ftp.ftp_get_command_logs import get_command_logs
-from scripts.rcon.rcon_manage_dino_roster import update_dino_roster
+from database.mirror import MIRROR
+from scripts.ftp.ftp_get_command_logs import CHANNEL_ID as ADMIN_CHANNEL_ID
+from utils.discord.send_messages import send_channel_message
+from scripts.servers.server_group import SERVERS
 from scripts.rcon.send_server_restart_announcement import send_restart_announcements
 
 load_dotenv()
@@ -33,13 +40,22 @@ async def on_ready():
     except Exception as e:
         print(f'Failed to sync commands: {e}')
 
-    # Start background tasks
-    bot.loop.create_task(get_command_logs(bot))
-    bot.loop.create_task(update_dino_roster(bot))
+    # Serve pairings and vouchers from the local mirror, syncing with Supabase in the background
+    async def report_sync_failure(table_name, key, op, error):
+        await send_channel_message(bot, ADMIN_CHANNEL_ID,
+                                   f"❌ Supabase keeps rejecting {op} of {table_name} `{key}`. "
+                                   f"It is kept in the local mirror until fixed:\n```{error}```")
 
-    # Schedule the restart announcements
-    scheduler.add_job(send_restart_announcements, 'cron', hour=11, minute=50, timezone='America/Chicago')
-    scheduler.add_job(send_restart_announcements, 'cron', hour=22, minute=50, timezone='America/Chicago')
+    MIRROR.on_failure = report_sync_failure
+    MIRROR.start()
+
+    # Start every game server's workers (RCON, log ingestion, roster, command logs) and pairing
+    SERVERS.start(bot)
+
+    # Schedule the restart announcements on every server
+    for group in SERVERS.groups.values():
+        scheduler.add_job(send_restart_announcements, 'cron', hour=11, minute=50, timezone='America/Chicago', args=[group])
+        scheduler.add_job(send_restart_announcements, 'cron', hour=22, minute=50, timezone='America/Chicago', args=[group])
     
     scheduler.start()
 
@@ -50,5 +66,10 @@ setup_clear_command(bot)
 setup_restarts_command(bot)
 setup_unlock_command(bot)
 setup_rcon_command(bot)
+setup_set_server_target_command(bot)
+setup_get_target_command(bot)
+setup_storage_command(bot)
+setup_claim_voucher_command(bot)
+setup_delete_voucher_command(bot)
 
 bot.run(os.getenv('DISCORD_TOKEN'))
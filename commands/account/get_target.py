@@ -0,0 +1,14 @@
+import discord
+from discord.ext import commands
+from utils.discord.send_messages import send_ephemeral_message
+from scripts.servers.server_group import SERVERS
+
+def setup_get_target_command(bot: commands.Bot):
+    @bot.tree.command(name='get_target', description='Show which game server your commands act on.')
+    async def get_target(interaction: discord.Interaction):
+        group = SERVERS.target_for(interaction.user.id)
+        await send_ephemeral_message(
+            interaction,
+            f"🎯 Your commands act on **{group.name}**. {group.status_message()}\n"
+            "Use `/set_server_target` to change it."
+        )
@@ -2,12 +2,12 @@ import discord
 import uuid
 import datetime
 import os
-import asyncio
 from dotenv import load_dotenv
 from discord.ext import commands
-from supabase_client import supabase
-from utils.discord.send_messages import send_ephemeral_message, send_channel_message, send_dm
-from utils.discord.check_pairing_status import check_pairing_status
+from database.pairings import PAIRINGS
+from database.pairing_cache import PAIRING_CACHE
+from utils.discord.send_messages import send_ephemeral_message, send_channel_message
+from scripts.ftp.pairing_service import PAIRING_SERVICE
 
 load_dotenv()
 
@@ -20,13 +20,6 @@ def setup_pair_command(bot: commands.Bot):
         discord_username = interaction.user.name
         pair_code = f"FD-PAIR-{str(uuid.uuid4())}"
 
-        data = {
-            "discord_id": discord_id,
-            "pair_code": pair_code,
-            "status": "pending",
-            "created_at": datetime.datetime.now().isoformat()
-        }
-
         embed = discord.Embed(
             title="🦖 Foxy Dino Account Pairing\n\n",
             color=discord.Color.green()
@@ -43,15 +36,14 @@ def setup_pair_command(bot: commands.Bot):
         try:
 
             # Insert the pair request into the database
-            insert_pair = supabase.table('pairings').insert(data).execute()
+            insert_pair = await PAIRINGS.create_pending(discord_id, pair_code, datetime.datetime.now().isoformat())
+            PAIRING_CACHE.invalidate(discord_id)
             await send_channel_message(bot, CHANNEL_ID, f"**{discord_username}** {(discord_id)} attempt: **{pair_code}**")
             
-            if insert_pair.data:
+            if insert_pair:
+                # The pairing service DMs the user when the code shows up in chat or expires
+                PAIRING_SERVICE.register(discord_id, pair_code)
                 await send_ephemeral_message(interaction, embed=embed)
-                await asyncio.sleep(10)  # Wait 10 seconds before checking the pairing status
-                
-
-                await check_pairing_status(bot, discord_id, pair_code)
 
             else:
                 await send_ephemeral_message(interaction, "Failed to create pair request.")
@@ -0,0 +1,26 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+from utils.discord.send_messages import send_ephemeral_message
+from scripts.servers.server_group import SERVERS
+
+def setup_set_server_target_command(bot: commands.Bot):
+
+    async def server_autocomplete(interaction: discord.Interaction, current: str):
+        """Suggests the names of the servers this bot manages."""
+        return [
+            app_commands.Choice(name=name, value=name)
+            for name in SERVERS.groups if current.lower() in name.lower()
+        ]
+
+    @bot.tree.command(name='set_server_target', description='Choose which game server your commands act on.')
+    @app_commands.autocomplete(server=server_autocomplete)
+    async def set_server_target(interaction: discord.Interaction, server: str):
+        if not SERVERS.set_target(interaction.user.id, server):
+            await send_ephemeral_message(
+                interaction,
+                f"⚠️ **Unknown server `{server}`.** Choose one of: {', '.join(SERVERS.groups)}"
+            )
+            return
+
+        await send_ephemeral_message(interaction, f"✅ Your commands now act on **{server}**.")
@@ -5,7 +5,8 @@ import os
 from dotenv import load_dotenv
 from discord import app_commands
 from discord.ext import commands
-from scripts.rcon.setup_rcon import setup_rcon
+from scripts.rcon.rcon_session import PRIORITY_ADMIN
+from scripts.servers.server_group import SERVERS
 from utils.discord.send_messages import send_ephemeral_message, send_channel_message
 
 load_dotenv()
@@ -25,19 +26,36 @@ def setup_rcon_command(bot: commands.Bot):
             for cmd in COMMANDS if current.lower() in cmd.lower()
         ]
 
+    async def server_autocomplete(interaction: discord.Interaction, current: str):
+        """Suggests the names of the servers this bot manages."""
+        return [
+            app_commands.Choice(name=name, value=name)
+            for name in SERVERS.groups if current.lower() in name.lower()
+        ]
+
     @bot.tree.command(name='rcon', description='Send RCON command via Discord.')
-    @app_commands.autocomplete(command=rcon_autocomplete)
-    async def rcon(interaction: discord.Interaction, command: str, message: str = None):
+    @app_commands.autocomplete(command=rcon_autocomplete, server=server_autocomplete)
+    async def rcon(interaction: discord.Interaction, command: str, message: str = None, server: str = None):
         # If the command requires a message but none is provided, show an error
         if command in MESSAGE_REQUIRED_COMMANDS and (message is None or message.strip() == ""):
             await send_ephemeral_message(interaction, f"⚠️ **A message is required for the `{command}` command!**")
             return
 
-        rcon_client = setup_rcon()
-        if rcon_client.connect():
-            # Send the RCON command with or without a message
-            response = rcon_client.send_command(command, command_data=message or "")
+        # The named server, or the admin's own target
+        group = SERVERS.get(server) if server else SERVERS.target_for(interaction.user.id)
+        if group is None:
+            await send_ephemeral_message(interaction, f"⚠️ **Unknown server `{server}`.**")
+            return
+
+        # Reply straight away while the server is restarting or unreachable
+        if not group.is_available:
+            await send_ephemeral_message(interaction, group.status_message())
+            return
+
+        # Send the RCON command with or without a message
+        response = await group.send_command(command, message or "", priority=PRIORITY_ADMIN)
 
+        if not response.startswith("❌ Cannot send command"):
             await send_ephemeral_message(
                 interaction,
                 f"Response: \n```{response}```"
@@ -0,0 +1,30 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+from utils.discord.send_messages import send_ephemeral_message
+from database.client import DatabaseError
+from database.dinosaurs import DINOSAURS, species_of
+from commands.storage.storage import voucher_autocomplete
+
+async def claim_voucher(interaction: discord.Interaction, voucher_id: str):
+    """Redeems exactly one of the user's vouchers and tells them which dino it was."""
+    try:
+        dino = await DINOSAURS.claim(voucher_id.strip(), str(interaction.user.id))
+    except DatabaseError as e:
+        await send_ephemeral_message(interaction, f"❌ Database error:\n```{e}```")
+        return
+
+    if not dino:
+        await send_ephemeral_message(interaction, "❌ You have no stored dinosaur with that voucher. It may already be claimed.")
+        return
+
+    await send_ephemeral_message(
+        interaction,
+        f"✅ Your {species_of(dino)} (growth {dino.get('growth')}) has been re-spawned."
+    )
+
+def setup_claim_voucher_command(bot: commands.Bot):
+    @bot.tree.command(name="claim_voucher", description="Redeem one of your vouchers to retrieve that dinosaur.")
+    @app_commands.autocomplete(voucher=voucher_autocomplete)
+    async def claim(interaction: discord.Interaction, voucher: str):
+        await claim_voucher(interaction, voucher)
@@ -0,0 +1,23 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+from utils.discord.send_messages import send_ephemeral_message
+from database.client import DatabaseError
+from database.dinosaurs import DINOSAURS, species_of
+from commands.storage.storage import voucher_autocomplete
+
+def setup_delete_voucher_command(bot: commands.Bot):
+    @bot.tree.command(name="delete_voucher", description="Discard one of your vouchers without retrieving the dinosaur.")
+    @app_commands.autocomplete(voucher=voucher_autocomplete)
+    async def delete_voucher(interaction: discord.Interaction, voucher: str):
+        try:
+            dino = await DINOSAURS.delete(voucher.strip(), str(interaction.user.id))
+        except DatabaseError as e:
+            await send_ephemeral_message(interaction, f"❌ Database error:\n```{e}```")
+            return
+
+        if not dino:
+            await send_ephemeral_message(interaction, "❌ You have no stored dinosaur with that voucher.")
+            return
+
+        await send_ephemeral_message(interaction, f"🗑️ Your {species_of(dino)} voucher has been deleted.")
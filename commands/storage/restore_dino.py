@@ -1,20 +1,27 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from supabase_client import supabase
+from utils.discord.send_messages import send_ephemeral_message
+from database.client import DatabaseError
+from database.dinosaurs import DINOSAURS
+from commands.storage.storage import voucher_autocomplete
+from commands.storage.claim_voucher import claim_voucher
 
 def setup_restore_dino_command(bot: commands.Bot):
     @bot.tree.command(name="restore_dino", description="Redeem a voucher to retrieve your stored dinosaur.")
-    async def voucher(interaction: discord.Interaction):
-        discord_id = str(interaction.user.id)
-        response = supabase.table("dinosaurs").select("*").eq("discord_id", discord_id).limit(1).execute()
+    @app_commands.autocomplete(voucher=voucher_autocomplete)
+    async def voucher(interaction: discord.Interaction, voucher: str = None):
+        # Without a voucher, the most recently stored dino is restored; only that one voucher is used up
+        if not voucher:
+            try:
+                dinos, _ = await DINOSAURS.list_for_owner(str(interaction.user.id), limit=1)
+            except DatabaseError as e:
+                await send_ephemeral_message(interaction, f"⏳ {e}. Try again in a moment.")
+                return
 
-        if not response.data:
-            await interaction.response.send_message("❌ You have no stored dinosaurs.", ephemeral=True)
-            return
+            if not dinos:
+                await send_ephemeral_message(interaction, "❌ You have no stored dinosaurs.")
+                return
+            voucher = dinos[0]["id"]
 
-        dino = response.data[0]
-
-        await interaction.response.send_message(f"✅ Your {dino['species']} (growth {dino['growth']}) has been re-spawned.", ephemeral=True)
-
-        supabase.table("dinosaurs").delete().eq("discord_id", discord_id).eq("species", dino['species']).execute()
+        await claim_voucher(interaction, voucher)
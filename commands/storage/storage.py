@@ -0,0 +1,82 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+from utils.discord.send_messages import send_ephemeral_message
+from database.client import DatabaseError
+from database.dinosaurs import DINOSAURS, PAGE_SIZE, species_of
+
+# Seconds the page buttons keep working
+PAGES_TIMEOUT = 300
+
+def format_voucher(dino):
+    """One line describing a stored dino and its voucher."""
+    stored_at = (dino.get("stored_at") or "")[:16].replace("T", " ")
+    return (
+        f"**{species_of(dino)}** · growth {dino.get('growth') or 0:.2f} · health {dino.get('health') or 0:.2f} "
+        f"· stamina {dino.get('stamina') or 0:.2f} · {stored_at}\n`{dino['id']}`"
+    )
+
+async def voucher_autocomplete(interaction: discord.Interaction, current: str):
+    """Suggests the user's own vouchers, newest first, matching by id or species."""
+    dinos = await DINOSAURS.search_for_owner(str(interaction.user.id), current)
+    return [
+        app_commands.Choice(name=f"{species_of(dino)} · growth {dino.get('growth') or 0:.2f} · {dino['id'][:8]}",
+                            value=dino["id"])
+        for dino in dinos
+    ]
+
+
+class StoragePages(discord.ui.View):
+    """Previous/next buttons over a user's vouchers, one cursor per visited page."""
+
+    def __init__(self, discord_id, species, total):
+        super().__init__(timeout=PAGES_TIMEOUT)
+        self.discord_id = discord_id
+        self.species = species
+        self.total = total
+        self.cursors = [None]  # Cursor of every page visited so far
+        self.next_cursor = None
+
+    async def render(self):
+        dinos, self.next_cursor = await DINOSAURS.list_for_owner(self.discord_id, self.cursors[-1], self.species)
+        self.previous_page.disabled = len(self.cursors) == 1
+        self.next_page.disabled = self.next_cursor is None
+
+        embed = discord.Embed(title="🦖 Your stored dinosaurs", color=discord.Color.green())
+        embed.description = "\n\n".join(format_voucher(dino) for dino in dinos) or "No vouchers on this page."
+        pages = max(1, -(-self.total // PAGE_SIZE))
+        embed.set_footer(text=f"Page {len(self.cursors)} of {pages} · {self.total} voucher(s)")
+        return embed
+
+    async def interaction_check(self, interaction: discord.Interaction):
+        return str(interaction.user.id) == self.discord_id
+
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.cursors.pop()
+        await interaction.response.edit_message(embed=await self.render(), view=self)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.cursors.append(self.next_cursor)
+        await interaction.response.edit_message(embed=await self.render(), view=self)
+
+
+def setup_storage_command(bot: commands.Bot):
+    @bot.tree.command(name="storage", description="List your stored dinosaurs and their vouchers.")
+    @app_commands.describe(species="Only list this species")
+    async def storage(interaction: discord.Interaction, species: str = None):
+        discord_id = str(interaction.user.id)
+        try:
+            total = await DINOSAURS.count_for_owner(discord_id, species)
+            if not total:
+                await send_ephemeral_message(interaction, "❌ You have no stored dinosaurs.")
+                return
+
+            pages = StoragePages(discord_id, species, total)
+            embed = await pages.render()
+        except DatabaseError as e:
+            await send_ephemeral_message(interaction, f"⏳ {e}. Try again in a moment.")
+            return
+
+        await interaction.response.send_message(embed=embed, view=pages, ephemeral=True)
@@ -1,44 +1,33 @@
-import re
 import discord
 from discord.ext import commands
 import os
 import asyncio
 import sys
 import datetime
-from postgrest.exceptions import APIError
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.discord.verify_paired import verify_paired
-from supabase_client import supabase
-from scripts.rcon.setup_rcon import setup_rcon
-
-rcon_client = setup_rcon()
-
-# Regex pattern to parse dino stats from RCON response
-DINO_STATS_PATTERN = re.compile(
-    r"\[.*\] PlayerDataName: (.*?), PlayerID: (\d+), .*? Class: (.*?), Growth: ([\d.]+), "
-    r"Health: ([\d.]+), Stamina: ([\d.]+), Hunger: ([\d.]+), Thirst: ([\d.]+)"
-)
-
-def rcon_fetch_dino_data(steam_id):
-    """Fetch dino stats via RCON using Steam ID."""
-    if not rcon_client.connect():
-        return None
-
-    response = rcon_client.send_command("getplayerdata", steam_id)
-    rcon_client.disconnect()
-
-    if not response or "No response received" in response:
-        return None
-
-    match = DINO_STATS_PATTERN.search(response)
-    if match:
+from database.client import DatabaseError
+from database.dinosaurs import DINOSAURS
+from scripts.servers.server_group import SERVERS, DEFAULT_SERVER
+from scripts.rcon.player_snapshot import POLL_INTERVAL
+
+# Oldest player snapshot accepted when storing. The voucher keeps the dino's stats, so they
+# can't be much older than the last poll, but a store shouldn't cost a getplayerdata of its own:
+# deaths and joins already refresh the snapshot, so within a poll it's still the same dino
+SNAPSHOT_MAX_AGE = POLL_INTERVAL
+
+async def rcon_fetch_dino_data(steam_id, server=DEFAULT_SERVER):
+    """Fetch dino stats for a Steam ID from a server's shared live player snapshot."""
+    player = await server.fetch_player(steam_id, SNAPSHOT_MAX_AGE)
+    if player:
         return {
             "steam_id": steam_id,
-            "dino_class": match.group(3),
-            "growth": float(match.group(4)),
-            "health": float(match.group(5)),
-            "stamina": float(match.group(6)),
+            "dino_class": player.dino_class,
+            "species": player.species,
+            "growth": player.growth,
+            "health": player.health,
+            "stamina": player.stamina,
             "stored_at": datetime.datetime.utcnow().isoformat()
         }
 
@@ -58,11 +47,20 @@ async def store_dino(interaction=None, discord_id=None):
             print(error_message)
         return
 
+    # No point waiting on RCON while the user's server is restarting or unreachable
+    server = SERVERS.target_for(discord_id)
+    if not server.is_available:
+        if interaction:
+            await interaction.response.send_message(server.status_message(), ephemeral=True)
+        else:
+            print(server.status_message())
+        return
+
     if interaction:
         await interaction.response.send_message(f"⏳ Fetching dino stats...", ephemeral=True)
 
     # Fetch dino data via RCON
-    dino_data = rcon_fetch_dino_data(steam_id)
+    dino_data = await rcon_fetch_dino_data(steam_id, server)
     
     if not dino_data:
         if interaction:
@@ -81,11 +79,11 @@ async def store_dino(interaction=None, discord_id=None):
     dino_data["discord_id"] = discord_id  # Attach discord_id for database storage
 
     try:
-        response = supabase.table("dinosaurs").insert(dino_data).execute()
-        if response.data:
+        stored = await DINOSAURS.insert(dino_data)
+        if stored:
             success_message = (
                 f"✅ Dino stored successfully!\n"
-                f"🔖 **Voucher**\n ```{response.data[0]['id']}```"
+                f"🔖 **Voucher**\n ```{stored['id']}```"
             )
             if interaction:
                 await interaction.followup.send(success_message, ephemeral=True)
@@ -96,7 +94,7 @@ async def store_dino(interaction=None, discord_id=None):
                 await interaction.followup.send("❌ Failed to store dino. Try again later.", ephemeral=True)
             else:
                 print("❌ Failed to store dino.")
-    except APIError as e:
+    except DatabaseError as e:
         error_msg = f"❌ Database error:\n```{e}```"
         if interaction:
             await interaction.followup.send(error_msg, ephemeral=True)
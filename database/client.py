@@ -0,0 +1,135 @@
+import os
+import random
+import asyncio
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+SUPABASE_URL = os.getenv("SUPABASE_URL")
+SUPABASE_KEY = os.getenv("SUPABASE_KEY")
+
+MAX_CONNECTIONS = 20  # Pooled HTTP connections shared by every caller
+MAX_KEEPALIVE = 10
+CALL_TIMEOUT = 5  # Seconds per attempt, from sending the request to reading the whole response
+RETRIES = 2  # Extra attempts after a transient failure (network error, timeout, 502/503/504)
+RETRY_BACKOFF = 0.25  # Seconds before the first retry, doubled for each one after
+RETRY_STATUSES = {502, 503, 504}
+
+
+class DatabaseError(Exception):
+    """A Supabase call that failed for good: rejected by PostgREST, or still failing after retries."""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+def eq(value):
+    """PostgREST equality filter value."""
+    return f"eq.{value}"
+
+
+class SupabaseRest:
+    """
+    Async PostgREST client for the Supabase tables, sharing one pooled HTTP connection set.
+    Each call has its own timeout, and calls that are safe to repeat are retried with
+    backoff on transient failures, so a slow database can't block the event loop
+    and one caller's retries never hold up another's request.
+    """
+
+    def __init__(self, url=SUPABASE_URL, key=SUPABASE_KEY, max_connections=MAX_CONNECTIONS,
+                 timeout=CALL_TIMEOUT, retries=RETRIES):
+        self.url = f"{(url or '').rstrip('/')}/rest/v1"
+        self.key = key
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.retries = retries
+        self.client = None
+
+    def _client(self):
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                base_url=self.url,
+                headers={"apikey": self.key or "", "Authorization": f"Bearer {self.key or ''}"},
+                limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=MAX_KEEPALIVE),
+                timeout=self.timeout,
+            )
+        return self.client
+
+    async def request(self, method, table, params=None, json=None, prefer=None, retry=True, timeout=None):
+        """
+        Sends one PostgREST request and returns the decoded rows (or None for an empty body).
+        Only pass retry=True for requests that are safe to repeat.
+        """
+        headers = {"Prefer": prefer} if prefer else None
+        timeout = timeout or self.timeout
+        attempts = 1 + (self.retries if retry else 0)
+
+        for attempt in range(attempts):
+            try:
+                response = await asyncio.wait_for(
+                    self._client().request(method, f"/{table}", params=params, json=json, headers=headers),
+                    timeout,
+                )
+            except (httpx.TransportError, asyncio.TimeoutError) as e:
+                error = DatabaseError(f"{method} {table} failed: {str(e) or type(e).__name__}")
+            else:
+                if response.status_code < 400:
+                    return response.json() if response.content else None
+                error = DatabaseError(f"{method} {table} returned {response.status_code}: {response.text}",
+                                      response.status_code)
+                if response.status_code not in RETRY_STATUSES:
+                    raise error
+
+            if attempt + 1 < attempts:
+                delay = RETRY_BACKOFF * 2 ** attempt
+                await asyncio.sleep(delay / 2 + random.uniform(0, delay / 2))
+        raise error
+
+    async def select(self, table, columns="*", filters=None, order=None, limit=None, offset=None, timeout=None):
+        params = {"select": columns, **(filters or {})}
+        if order:
+            params["order"] = order
+        if limit:
+            params["limit"] = limit
+        if offset:
+            params["offset"] = offset
+        return await self.request("GET", table, params, timeout=timeout) or []
+
+    async def insert(self, table, rows, upsert_on=None, timeout=None):
+        """
+        Inserts rows and returns them as stored. With upsert_on (a unique column), an existing
+        row is merged instead, which makes the insert safe to retry.
+        """
+        prefer = "return=representation"
+        params = None
+        if upsert_on:
+            prefer += ",resolution=merge-duplicates"
+            params = {"on_conflict": upsert_on}
+        return await self.request("POST", table, params, json=rows, prefer=prefer,
+                                  retry=upsert_on is not None, timeout=timeout) or []
+
+    async def update(self, table, values, filters, retry=False, timeout=None):
+        """
+        Updates matching rows and returns them. Pass retry=True only if applying the update twice
+        changes nothing and the caller doesn't rely on the returned rows.
+        """
+        return await self.request("PATCH", table, filters, json=values, prefer="return=representation",
+                                  retry=retry, timeout=timeout) or []
+
+    async def delete(self, table, filters, retry=False, timeout=None):
+        """
+        Deletes matching rows and returns them. A retried delete returns no rows if the first
+        attempt went through, so pass retry=True only if the caller ignores them.
+        """
+        return await self.request("DELETE", table, filters, prefer="return=representation",
+                                  retry=retry, timeout=timeout) or []
+
+    async def close(self):
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+
+DATABASE = SupabaseRest()
@@ -0,0 +1,112 @@
+import json
+import uuid
+import base64
+from .client import DATABASE, DatabaseError, eq
+from .mirror import MIRROR
+from scripts.rcon.player_data import species_from_class
+
+TABLE = "dinosaurs"
+PAGE_SIZE = 10
+
+
+def species_of(dino):
+    """A stored dino's species, whichever column it was stored under."""
+    return species_from_class(dino.get("species") or dino.get("dino_class") or "") or "Unknown"
+
+
+def encode_cursor(dino):
+    """Opaque position just after this dino in an owner's newest-first listing."""
+    position = json.dumps([dino.get("stored_at") or "", dino["id"]])
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        stored_at, voucher_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return str(stored_at), str(voucher_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+class DinosaurRepository:
+    """
+    The voucher ledger: dinosaurs stored with /store_dino, each row's id being its voucher.
+    Reads come from the local mirror once it holds a copy of the table, Supabase until then;
+    writes always go through the mirror's outbox. Listings page by (stored_at, id) on the
+    owner indexes, and a claim or delete removes exactly one voucher, atomically.
+    """
+
+    def __init__(self, database=DATABASE, mirror=MIRROR):
+        self.database = database
+        self.mirror = mirror
+
+    async def insert(self, dino_data):
+        """
+        Stores a dinosaur. Returns the stored row with its id.
+        The id is generated here, so a retried push lands on the same row.
+        """
+        return self.mirror.upsert(TABLE, {"id": str(uuid.uuid4()), **dino_data})
+
+    async def get(self, voucher_id, discord_id):
+        """A user's voucher, or None if it doesn't exist or belongs to someone else."""
+        if self.mirror.is_ready:
+            rows = self.mirror.select(TABLE, "id = ? AND discord_id = ?", (voucher_id, discord_id))
+        else:
+            rows = await self.database.select(TABLE, filters={"id": eq(voucher_id), "discord_id": eq(discord_id)})
+        return rows[0] if rows else None
+
+    async def list_for_owner(self, discord_id, cursor=None, species=None, limit=PAGE_SIZE):
+        """
+        One page of a user's vouchers, newest first, optionally of one species.
+        Returns (rows, cursor of the next page or None).
+        """
+        if not self.mirror.is_ready:
+            raise DatabaseError("Voucher storage is still loading")
+
+        where, params = "discord_id = ?", [discord_id]
+        if species:
+            where += " AND species = ?"
+            params.append(species)
+        if cursor:
+            where += " AND (stored_at, id) < (?, ?)"
+            params.extend(decode_cursor(cursor))
+
+        rows = self.mirror.select(TABLE, where, params, order="stored_at DESC, id DESC", limit=limit + 1)
+        if len(rows) > limit:
+            return rows[:limit], encode_cursor(rows[limit - 1])
+        return rows, None
+
+    async def count_for_owner(self, discord_id, species=None):
+        if not self.mirror.is_ready:
+            raise DatabaseError("Voucher storage is still loading")
+        if species:
+            return self.mirror.count(TABLE, "discord_id = ? AND species = ?", (discord_id, species))
+        return self.mirror.count(TABLE, "discord_id = ?", (discord_id,))
+
+    async def search_for_owner(self, discord_id, text, limit=25):
+        """A user's newest vouchers whose id or species contains `text`, for autocomplete."""
+        if not self.mirror.is_ready:
+            return []
+        pattern = f"%{text}%"
+        return self.mirror.select(TABLE, "discord_id = ? AND (id LIKE ? OR species LIKE ?)",
+                                  (discord_id, pattern, pattern), order="stored_at DESC, id DESC", limit=limit)
+
+    async def _remove(self, voucher_id, discord_id):
+        """Removes one voucher owned by the user. Returns it, or None if there was no such voucher."""
+        if self.mirror.is_ready:
+            rows = self.mirror.delete(TABLE, "id = ? AND discord_id = ?", (voucher_id, discord_id),
+                                      {"discord_id": discord_id})
+        else:
+            rows = await self.database.delete(TABLE, {"id": eq(voucher_id), "discord_id": eq(discord_id)})
+        return rows[0] if rows else None
+
+    async def claim(self, voucher_id, discord_id):
+        """Redeems a voucher: removes it and returns the stored dino, or None if it was already claimed."""
+        return await self._remove(voucher_id, discord_id)
+
+    async def delete(self, voucher_id, discord_id):
+        """Discards a voucher without redeeming it. Returns the removed dino, or None."""
+        return await self._remove(voucher_id, discord_id)
+
+
+DINOSAURS = DinosaurRepository()
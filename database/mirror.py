@@ -0,0 +1,359 @@
+import os
+import json
+import time
+import random
+import sqlite3
+import asyncio
+from .client import DATABASE, DatabaseError, eq
+from .write_behind import WRITES
+from scripts.rcon.player_data import species_from_class
+
+MIRROR_FILE = os.path.join("data", "mirror.db")
+
+PULL_INTERVAL = 300  # Seconds between full refreshes from Supabase
+PULL_PAGE_SIZE = 1000  # Rows per request while refreshing
+PUSH_BATCH = 500  # Outbox entries sent per push
+MAX_ATTEMPTS = 5  # Rejected pushes before an outbox entry is given up on
+BASE_BACKOFF = 1  # Seconds before pushing again after Supabase was unreachable
+MAX_BACKOFF = 60
+
+#  Outbox entry states
+PENDING = 0
+PUSHED = 1  # Kept until a refresh that started afterwards has completed, see _apply()
+FAILED = 2  # Rejected MAX_ATTEMPTS times; the local row is kept and an admin is told, see push()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pairings (
+    pair_code TEXT PRIMARY KEY,
+    discord_id TEXT,
+    steam_id TEXT,
+    status TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pairings_discord_id ON pairings (discord_id, status);
+CREATE INDEX IF NOT EXISTS pairings_steam_id ON pairings (steam_id);
+CREATE INDEX IF NOT EXISTS pairings_status ON pairings (status, discord_id);
+
+CREATE TABLE IF NOT EXISTS dinosaurs (
+    id TEXT PRIMARY KEY,
+    discord_id TEXT,
+    species TEXT,
+    stored_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS dinosaurs_owner ON dinosaurs (discord_id, stored_at, id);
+--  Replaces dinosaurs_owner_species (discord_id, species), which older mirrors still have
+DROP INDEX IF EXISTS dinosaurs_owner_species;
+CREATE INDEX IF NOT EXISTS dinosaurs_owner_species_stored ON dinosaurs (discord_id, species, stored_at, id);
+
+CREATE TABLE IF NOT EXISTS outbox (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name TEXT NOT NULL,
+    key TEXT NOT NULL,
+    op TEXT NOT NULL,
+    conditions TEXT,
+    state INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS outbox_state ON outbox (state, seq);
+CREATE INDEX IF NOT EXISTS outbox_key ON outbox (table_name, key);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class MirrorTable:
+    """A mirrored Supabase table: its key and the columns copied out of each row for indexing."""
+    __slots__ = ("name", "key", "columns")
+
+    def __init__(self, name, key, columns):
+        self.name = name
+        self.key = key
+        self.columns = columns  # column -> function(row) returning its value
+
+    def values(self, row):
+        return [str(row[self.key])] + [column(row) for column in self.columns.values()] + [json.dumps(row, default=str)]
+
+
+TABLES = {
+    "pairings": MirrorTable("pairings", "pair_code", {
+        "discord_id": lambda row: row.get("discord_id"),
+        "steam_id": lambda row: row.get("steam_id"),
+        "status": lambda row: row.get("status"),
+    }),
+    "dinosaurs": MirrorTable("dinosaurs", "id", {
+        "discord_id": lambda row: row.get("discord_id"),
+        #  Older rows only have the raw class (BP_Stegosaurus_C); every refresh rewrites them normalized
+        "species": lambda row: species_from_class(row.get("species") or row.get("dino_class") or ""),
+        "stored_at": lambda row: row.get("stored_at") or "",  # Never NULL, so (stored_at, id) cursors compare
+    }),
+}
+
+
+class LocalMirror:
+    """
+    SQLite (WAL) copy of the Supabase pairings and dinosaurs tables, so lookups are local
+    index reads and the bot keeps working while Supabase is slow or down.
+
+    Local writes apply immediately and queue an outbox entry in the same transaction;
+    a background task pushes the outbox in order (upserts through the write-behind batcher,
+    deletes with their conditions) and periodically refreshes every table from Supabase.
+    Conflicts: a row with local changes not yet pushed, or made after a refresh began,
+    keeps its local version; everything else takes the Supabase version, including deletions.
+    Pushes are idempotent upserts on the table key, and conditional deletes
+    (e.g. only a still-pending pairing) let a change made upstream win over a stale local one.
+    A change Supabase keeps rejecting is never dropped: its row stays protected locally
+    and `on_failure` is told, so nothing a user was promised disappears silently.
+    """
+
+    def __init__(self, path=MIRROR_FILE, database=DATABASE, writes=WRITES, pull_interval=PULL_INTERVAL):
+        self.path = path
+        self.database = database
+        self.writes = writes
+        self.pull_interval = pull_interval
+        self.db = None
+        self.ready = False
+        self.wakeup = asyncio.Event()
+        self.pulled_at = 0
+        self.on_failure = None  # Awaited with (table_name, key, op, error) when a change is given up on
+        self.task = None
+
+    def _connect(self):
+        if self.db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self.db = sqlite3.connect(self.path)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.executescript(SCHEMA)
+            pulled = {name for name, in self.db.execute("SELECT name FROM sync_state WHERE name LIKE 'pulled:%'")}
+            self.ready = pulled >= {f"pulled:{name}" for name in TABLES}
+        return self.db
+
+    @property
+    def is_ready(self):
+        """True once every table has been copied from Supabase at least once, on this or an earlier run."""
+        self._connect()
+        return self.ready
+
+    #  Local reads and writes
+
+    def get(self, table_name, key):
+        """A row by its key, or None."""
+        table = TABLES[table_name]
+        found = self._connect().execute(f"SELECT data FROM {table.name} WHERE {table.key} = ?", (str(key),)).fetchone()
+        return json.loads(found[0]) if found else None
+
+    def select(self, table_name, where="1", params=(), order=None, limit=None, offset=None):
+        """Rows matching an SQL condition on the table's indexed columns."""
+        sql = f"SELECT data FROM {TABLES[table_name].name} WHERE {where}"
+        if order:
+            sql += f" ORDER BY {order}"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+            if offset:
+                sql += f" OFFSET {int(offset)}"
+        return [json.loads(data) for data, in self._connect().execute(sql, params)]
+
+    def count(self, table_name, where="1", params=()):
+        return self._connect().execute(f"SELECT COUNT(*) FROM {TABLES[table_name].name} WHERE {where}", params).fetchone()[0]
+
+    def _queue(self, table, key, op, conditions=None, state=PENDING):
+        self.db.execute("INSERT INTO outbox (table_name, key, op, conditions, state) VALUES (?, ?, ?, ?, ?)",
+                        (table.name, str(key), op, json.dumps(conditions) if conditions else None, state))
+        if state == PENDING:
+            self.wakeup.set()
+
+    def has_pending(self, table_name, key):
+        """True while a local change to the row hasn't reached Supabase yet."""
+        return self._connect().execute("SELECT 1 FROM outbox WHERE table_name = ? AND key = ? AND state = ? LIMIT 1",
+                                       (table_name, str(key), PENDING)).fetchone() is not None
+
+    def store(self, table_name, row):
+        """
+        Saves a row Supabase already holds, e.g. the result of a conditional update made there directly.
+        Recorded as an already pushed change, so a refresh that started earlier can't overwrite it.
+        """
+        table = TABLES[table_name]
+        db = self._connect()
+        with db:
+            self._write(table, row)
+            self._queue(table, row[table.key], "upsert", state=PUSHED)
+        return row
+
+    def _write(self, table, row):
+        columns = ", ".join(table.columns)
+        self.db.execute(
+            f"INSERT OR REPLACE INTO {table.name} ({table.key}, {columns}, data) "
+            f"VALUES ({', '.join('?' * (len(table.columns) + 2))})",
+            table.values(row))
+
+    def upsert(self, table_name, row):
+        """Writes a row locally, merged over the stored one, and queues it for Supabase. Returns the merged row."""
+        table = TABLES[table_name]
+        db = self._connect()
+        with db:
+            merged = {**(self.get(table_name, row[table.key]) or {}), **row}
+            self._write(table, merged)
+            self._queue(table, row[table.key], "upsert")
+        return merged
+
+    def delete(self, table_name, where, params=(), conditions=None):
+        """
+        Deletes the rows matching an SQL condition locally and queues their deletion in Supabase,
+        where it only applies if `conditions` (column -> value) still hold. Returns the deleted rows.
+        """
+        table = TABLES[table_name]
+        db = self._connect()
+        with db:
+            deleted = db.execute(f"DELETE FROM {table.name} WHERE {where} RETURNING data", params).fetchall()
+            rows = [json.loads(data) for data, in deleted]
+            for row in rows:
+                self._queue(table, row[table.key], "delete", conditions)
+        return rows
+
+    #  Sync with Supabase
+
+    async def _push_entry(self, table_name, key, op, conditions):
+        table = TABLES[table_name]
+        if op == "delete":
+            filters = {column: eq(value) for column, value in (json.loads(conditions) if conditions else {}).items()}
+            await self.database.delete(table.name, {table.key: eq(key), **filters}, retry=True)
+            return
+
+        row = self.get(table_name, key)
+        if row is not None:  # Deleted again since; that later entry does the work
+            await self.writes.upsert(table.name, row, upsert_on=table.key)
+
+    async def push(self):
+        """
+        Sends queued changes to Supabase, oldest first. Returns False if Supabase was unreachable,
+        leaving the rest queued for the next try.
+        """
+        entries = self._connect().execute(
+            "SELECT seq, table_name, key, op, conditions FROM outbox WHERE state = ? ORDER BY seq LIMIT ?",
+            (PENDING, PUSH_BATCH)).fetchall()
+        if not entries:
+            return True
+
+        #  Only the latest change to a row needs to go out; upserts push the row as it is now
+        latest = {}
+        for seq, table_name, key, op, conditions in entries:
+            seqs = latest.pop((table_name, key), (None, []))[1]
+            latest[(table_name, key)] = ((table_name, key, op, conditions), seqs + [seq])
+
+        groups = list(latest.values())
+        results = await asyncio.gather(*(self._push_entry(*entry) for entry, _ in groups), return_exceptions=True)
+
+        reachable = True
+        failures = []
+        with self.db:
+            for (entry, seqs), result in zip(groups, results):
+                marks = ",".join("?" * len(seqs))
+                if result is None:
+                    self.db.execute(f"UPDATE outbox SET state = ? WHERE seq IN ({marks})", (PUSHED, *seqs))
+                    #  A later change to the row went through, which settles earlier ones given up on
+                    self.db.execute("UPDATE outbox SET state = ? WHERE table_name = ? AND key = ? AND state = ?",
+                                    (PUSHED, entry[0], entry[1], FAILED))
+                elif isinstance(result, DatabaseError) and result.status is not None and result.status < 500:
+                    print(f"⚠️ Supabase rejected {entry[2]} of {entry[0]} {entry[1]}: {result}")
+                    states = self.db.execute(f"UPDATE outbox SET attempts = attempts + 1, "
+                                             f"state = CASE WHEN attempts + 1 >= ? THEN ? ELSE state END "
+                                             f"WHERE seq IN ({marks}) RETURNING state",
+                                             (MAX_ATTEMPTS, FAILED, *seqs)).fetchall()
+                    if (FAILED,) in states:
+                        failures.append((*entry[:3], result))
+                else:
+                    reachable = False
+
+        for table_name, key, op, error in failures:
+            print(f"❌ Gave up syncing {op} of {table_name} {key}; kept locally: {error}")
+            if self.on_failure:
+                try:
+                    await self.on_failure(table_name, key, op, error)
+                except Exception as e:
+                    print(f"❌ Error reporting a failed database sync: {e}")
+
+        if reachable and len(entries) == PUSH_BATCH:
+            self.wakeup.set()  # More waiting
+        return reachable
+
+    def _apply(self, table, rows, start_seq):
+        """Replaces the local table with a refreshed copy, keeping rows with local changes Supabase may not have."""
+        db = self.db
+        protected = {key for key, in db.execute(
+            "SELECT key FROM outbox WHERE table_name = ? AND (state IN (?, ?) OR seq > ?)",
+            (table.name, PENDING, FAILED, start_seq))}
+        upstream = {str(row[table.key]): row for row in rows}
+        local = {key for key, in db.execute(f"SELECT {table.key} FROM {table.name}")}
+
+        with db:
+            for key, row in upstream.items():
+                if key not in protected:
+                    self._write(table, row)
+            db.executemany(f"DELETE FROM {table.name} WHERE {table.key} = ?",
+                           [(key,) for key in local - upstream.keys() - protected])
+            #  Pushed before this refresh started, so Supabase's copy already includes them
+            db.execute("DELETE FROM outbox WHERE table_name = ? AND state = ? AND seq <= ?",
+                       (table.name, PUSHED, start_seq))
+            db.execute("INSERT OR REPLACE INTO sync_state (name, value) VALUES (?, ?)",
+                       (f"pulled:{table.name}", str(time.time())))
+
+    async def pull(self):
+        """Refreshes every table from Supabase."""
+        for table in TABLES.values():
+            start_seq = self._connect().execute("SELECT COALESCE(MAX(seq), 0) FROM outbox").fetchone()[0]
+            rows = []
+            while True:
+                #  Keyset pages: rows deleted upstream meanwhile can't shift later pages and hide rows from them
+                filters = {table.key: f"gt.{rows[-1][table.key]}"} if rows else None
+                page = await self.database.select(table.name, filters=filters, order=table.key, limit=PULL_PAGE_SIZE)
+                rows += page
+                if len(page) < PULL_PAGE_SIZE:
+                    break
+            self._apply(table, rows, start_seq)
+
+        self.ready = True
+        self.pulled_at = time.monotonic()
+        print(f"🔹 Local mirror refreshed: {self.count('pairings')} pairings, {self.count('dinosaurs')} dinosaurs.")
+
+    async def run(self):
+        """Pushes local changes as they happen and refreshes from Supabase periodically."""
+        backoff = BASE_BACKOFF
+        while True:
+            try:
+                if time.monotonic() - self.pulled_at >= self.pull_interval or not self.ready:
+                    #  Push first, so the refresh already includes our own changes
+                    if await self.push():
+                        await self.pull()
+                self.wakeup.clear()
+                if not await self.push():
+                    raise DatabaseError("Supabase unreachable")
+                backoff = BASE_BACKOFF
+            except Exception as e:
+                print(f"⚠️ Database sync paused, retrying in {backoff}s: {e}")
+                await asyncio.sleep(backoff + random.uniform(0, backoff / 2))
+                backoff = min(backoff * 2, MAX_BACKOFF)
+                continue
+
+            remaining = self.pull_interval - (time.monotonic() - self.pulled_at)
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), max(remaining, 0))
+            except asyncio.TimeoutError:
+                pass
+
+    def failed(self):
+        """Changes Supabase kept rejecting, as (table_name, key, op, attempts), oldest first."""
+        return self._connect().execute(
+            "SELECT table_name, key, op, attempts FROM outbox WHERE state = ? ORDER BY seq", (FAILED,)).fetchall()
+
+    def start(self):
+        """Starts syncing with Supabase if it isn't already running."""
+        self._connect()
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self.run())
+
+
+MIRROR = LocalMirror()
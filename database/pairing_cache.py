@@ -0,0 +1,128 @@
+import time
+import asyncio
+from collections import OrderedDict
+from .pairings import PAIRINGS
+
+MAX_ENTRIES = 50_000  # Least recently used users are dropped beyond this
+POSITIVE_TTL = 3600  # Seconds a completed pairing is trusted before asking again
+NEGATIVE_TTL = 30  # Seconds "not paired" or "still pending" is remembered; these change as soon as a code is typed
+WARM_PAGE_SIZE = 1000  # Completed pairings loaded per request at startup
+
+
+class PairingCache:
+    """
+    Discord ID <-> Steam ID lookups without a database round-trip for every command.
+    Completed pairings are kept for an hour, missing or pending ones for half a minute,
+    and the least recently used entries are evicted past a size limit. The pairing service
+    writes through on completion and invalidates on expiry, and every completed pairing
+    is loaded in bulk at startup. Concurrent misses for the same user share one query.
+    """
+
+    def __init__(self, repository=PAIRINGS, max_entries=MAX_ENTRIES, positive_ttl=POSITIVE_TTL,
+                 negative_ttl=NEGATIVE_TTL, clock=time.monotonic):
+        self.repository = repository
+        self.max_entries = max_entries
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self.entries = OrderedDict()  # discord_id -> (pairing row or None, expires_at)
+        self.discord_ids = {}  # steam_id -> discord_id, for completed pairings in the cache
+        self.loading = {}  # discord_id -> task fetching it
+        self.hits = 0
+        self.misses = 0
+        self.task = None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def put(self, discord_id, pairing):
+        """Caches a user's pairing row, or None for a user with no pairing."""
+        completed = pairing is not None and pairing.get("status") == "completed"
+        ttl = self.positive_ttl if completed else self.negative_ttl
+
+        self.invalidate(discord_id)
+        self.entries[discord_id] = (pairing, self.clock() + ttl)
+        if completed:
+            self.discord_ids[pairing["steam_id"]] = discord_id
+
+        while len(self.entries) > self.max_entries:
+            self.invalidate(next(iter(self.entries)))
+
+    def complete(self, discord_id, steam_id):
+        """Write-through for a pairing that was just completed."""
+        self.put(discord_id, {"steam_id": steam_id, "status": "completed"})
+
+    def invalidate(self, discord_id):
+        """Forgets a user, so their next lookup goes to the database."""
+        self.loading.pop(discord_id, None)  # A query already in flight may predate the change
+        pairing, _ = self.entries.pop(discord_id, (None, None))
+        if pairing is not None and self.discord_ids.get(pairing.get("steam_id")) == discord_id:
+            del self.discord_ids[pairing["steam_id"]]
+
+    def cached(self, discord_id):
+        """(found, pairing) from the cache alone, refreshing the entry's LRU position on a hit."""
+        entry = self.entries.get(discord_id)
+        if entry is None:
+            return False, None
+        if entry[1] <= self.clock():
+            self.invalidate(discord_id)
+            return False, None
+
+        self.entries.move_to_end(discord_id)
+        return True, entry[0]
+
+    async def _load(self, discord_id):
+        pairing = await self.repository.get_by_discord_id(discord_id)
+        if self.loading.get(discord_id) is asyncio.current_task():
+            self.put(discord_id, pairing)  # Not invalidated while the query ran
+        return pairing
+
+    def _loaded(self, discord_id, task):
+        if self.loading.get(discord_id) is task:
+            del self.loading[discord_id]
+
+    async def get(self, discord_id):
+        """A user's pairing row (steam_id, status), or None if they never paired."""
+        found, pairing = self.cached(discord_id)
+        if found:
+            self.hits += 1
+            return pairing
+
+        self.misses += 1
+        task = self.loading.get(discord_id)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._load(discord_id))
+            task.add_done_callback(lambda task: self._loaded(discord_id, task))
+            self.loading[discord_id] = task
+        return await asyncio.shield(task)
+
+    def discord_id_for(self, steam_id):
+        """The Discord ID paired with a Steam ID, if that pairing is cached."""
+        discord_id = self.discord_ids.get(steam_id)
+        if discord_id is None or not self.cached(discord_id)[0]:
+            return None
+        return discord_id
+
+    async def warm(self, page_size=WARM_PAGE_SIZE):
+        """Loads every completed pairing, one page at a time."""
+        loaded = 0
+        try:
+            while loaded < self.max_entries:
+                rows = await self.repository.list_completed(page_size, loaded)
+                for row in rows:
+                    if row["discord_id"] not in self.entries:
+                        self.put(row["discord_id"], {"steam_id": row["steam_id"], "status": row["status"]})
+                loaded += len(rows)
+                if len(rows) < page_size:
+                    break
+        except Exception as e:
+            print(f"⚠️ Could not warm the pairing cache: {e}")
+        print(f"🔹 Pairing cache warmed with {loaded} completed pairings.")
+
+    def start(self):
+        """Warms the cache in the background, unless that already ran."""
+        if self.task is None or self.task.cancelled():
+            self.task = asyncio.get_running_loop().create_task(self.warm())
+
+
+PAIRING_CACHE = PairingCache()
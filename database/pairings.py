@@ -0,0 +1,73 @@
+from .client import DATABASE, DatabaseError, eq
+from .mirror import MIRROR
+
+TABLE = "pairings"
+
+
+class PairingRepository:
+    """
+    Discord-to-Steam account pairings, one row per /pair request.
+    Reads come from the local mirror once it holds a copy of the table, Supabase until then;
+    writes always go through the mirror's outbox.
+    """
+
+    def __init__(self, database=DATABASE, mirror=MIRROR):
+        self.database = database
+        self.mirror = mirror
+
+    async def get_by_discord_id(self, discord_id):
+        """A user's pairing row (steam_id, status), or None if they never paired. A completed one wins over a retry."""
+        if self.mirror.is_ready:
+            rows = self.mirror.select(TABLE, "discord_id = ?", (discord_id,), order="status", limit=1)
+        else:
+            rows = await self.database.select(TABLE, "steam_id, status", {"discord_id": eq(discord_id)},
+                                              order="status", limit=1)
+        return rows[0] if rows else None
+
+    async def create_pending(self, discord_id, pair_code, created_at):
+        """Stores a new pair request. Returns the stored row."""
+        return self.mirror.upsert(TABLE, {
+            "discord_id": discord_id,
+            "pair_code": pair_code,
+            "status": "pending",
+            "created_at": created_at,
+        })
+
+    async def complete(self, discord_id, pair_code, steam_id):
+        """
+        Links the Steam ID to a pair code if it is still pending. False if it expired or was
+        completed elsewhere first. Its correctness depends on the row's current state, so it is
+        a conditional update in Supabase itself, never batched or queued.
+        """
+        if self.mirror.has_pending(TABLE, pair_code) and not await self.mirror.push():
+            raise DatabaseError("Supabase unreachable, the pair request hasn't been saved there yet")
+
+        rows = await self.database.update(TABLE, {"steam_id": steam_id, "status": "completed"},
+                                          {"pair_code": eq(pair_code), "status": eq("pending")})
+        for row in rows:
+            self.mirror.store(TABLE, {**(self.mirror.get(TABLE, pair_code) or {}), **row})
+        return bool(rows)
+
+    async def delete_pending(self, pair_code):
+        """Removes a pair request that was never completed, unless it got completed meanwhile."""
+        if self.mirror.is_ready:
+            self.mirror.delete(TABLE, "pair_code = ? AND status = 'pending'", (pair_code,), {"status": "pending"})
+        else:
+            await self.database.delete(TABLE, {"pair_code": eq(pair_code), "status": eq("pending")}, retry=True)
+
+    async def list_completed(self, limit, offset=0):
+        """One page of completed pairings (discord_id, steam_id, status), in a stable order."""
+        if self.mirror.is_ready:
+            return self.mirror.select(TABLE, "status = 'completed'", order="discord_id, pair_code",
+                                      limit=limit, offset=offset)
+        return await self.database.select(TABLE, "discord_id, steam_id, status", {"status": eq("completed")},
+                                          order="discord_id", limit=limit, offset=offset)
+
+    async def list_pending(self):
+        """Every pending pair request (discord_id, pair_code, created_at)."""
+        if self.mirror.is_ready:
+            return self.mirror.select(TABLE, "status = 'pending'")
+        return await self.database.select(TABLE, "discord_id, pair_code, created_at", {"status": eq("pending")})
+
+
+PAIRINGS = PairingRepository()
@@ -0,0 +1,94 @@
+import asyncio
+from .client import DATABASE, DatabaseError
+
+FLUSH_WINDOW = 0.05  # Seconds writes wait for company before going out
+MAX_BATCH = 500  # Rows per request; bigger groups are split
+
+
+class PendingWrite:
+    """One queued row and the future its caller is waiting on."""
+    __slots__ = ("row", "future")
+
+    def __init__(self, row, future):
+        self.row = row
+        self.future = future
+
+
+class WriteBehind:
+    """
+    Groups inserts and upserts that arrive within a short window into one bulk PostgREST
+    request per table, conflict column and column set, instead of one round-trip per row.
+    Each caller awaits its own row as stored (with its id), so commands still get their voucher.
+    Every write is an upsert on a unique key chosen by the caller (a client-generated id or
+    a pair code), which makes a retried batch merge into the rows it already wrote
+    rather than duplicate them. A batch PostgREST rejects is retried row by row,
+    so one bad row only fails its own caller.
+    """
+
+    def __init__(self, database=DATABASE, window=FLUSH_WINDOW, max_batch=MAX_BATCH):
+        self.database = database
+        self.window = window
+        self.max_batch = max_batch
+        self.groups = {}  # (table, upsert_on, columns) -> [PendingWrite]
+        self.wakeup = asyncio.Event()
+        self.batches = 0
+        self.rows = 0
+        self.task = None
+
+    async def upsert(self, table, row, upsert_on):
+        """Queues a row and returns it as stored. Raises DatabaseError if it couldn't be written."""
+        future = asyncio.get_running_loop().create_future()
+        key = (table, upsert_on, tuple(sorted(row)))
+        self.groups.setdefault(key, []).append(PendingWrite(row, future))
+        self.wakeup.set()
+        self.start()
+        return await future
+
+    async def _write(self, table, upsert_on, writes):
+        """Writes one batch and resolves its futures by the conflict column."""
+        try:
+            stored = await self.database.insert(table, [write.row for write in writes], upsert_on=upsert_on)
+        except Exception as e:
+            if len(writes) > 1 and isinstance(e, DatabaseError) and e.status is not None and e.status < 500:
+                #  Rejected rather than unreachable: find the offending rows without failing the rest
+                await asyncio.gather(*(self._write(table, upsert_on, [write]) for write in writes))
+                return
+            for write in writes:
+                if not write.future.done():
+                    write.future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.rows += len(writes)
+        by_key = {row.get(upsert_on): row for row in stored}
+        for write in writes:
+            if not write.future.done():
+                write.future.set_result(by_key.get(write.row.get(upsert_on)))
+
+    async def flush(self):
+        """Writes everything queued so far."""
+        groups, self.groups = self.groups, {}
+        self.wakeup.clear()
+        batches = [
+            self._write(table, upsert_on, writes[start:start + self.max_batch])
+            for (table, upsert_on, _), writes in groups.items()
+            for start in range(0, len(writes), self.max_batch)
+        ]
+        await asyncio.gather(*batches)
+
+    async def run(self):
+        while True:
+            await self.wakeup.wait()
+            await asyncio.sleep(self.window)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"❌ Error flushing database writes: {e}")
+
+    def start(self):
+        """Starts the flusher if it isn't already running."""
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self.run())
+
+
+WRITES = WriteBehind()
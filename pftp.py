@@ -65,6 +65,44 @@ class PersistentFTPClient:
             print(f"❌ Error downloading file: {e}")
         return None
 
+    def get_size(self, remote_path):
+        """Return the size of a remote file in bytes (SIZE), or None if unavailable."""
+        if not self.ensure_connection():
+            return None
+
+        try:
+            self.ftp.voidcmd("TYPE I")
+            return self.ftp.size(remote_path)
+        except Exception as e:
+            print(f"❌ Could not get size of {remote_path}: {e}")
+            return None
+
+    def get_mtime(self, remote_path):
+        """Return the remote modification time (MDTM) as a YYYYMMDDHHMMSS string, or None."""
+        if not self.ensure_connection():
+            return None
+
+        try:
+            response = self.ftp.sendcmd(f"MDTM {remote_path}")
+            return response[4:].strip()
+        except Exception:
+            # MDTM is optional on some hosts, SIZE alone is enough to tail
+            return None
+
+    def download_range(self, remote_path, callback, offset=0):
+        """Stream a remote file to callback starting at a byte offset (REST)."""
+        if not self.ensure_connection():
+            return False
+
+        try:
+            self.ftp.retrbinary(f"RETR {remote_path}", callback, rest=offset or None)
+            return True
+        except error_perm as e:
+            print(f"❌ FTP permission error: {e}")
+        except Exception as e:
+            print(f"❌ Error downloading {remote_path} from offset {offset}: {e}")
+        return False
+
     def list_dir(self, path="."):
         """List files in a directory on the FTP server."""
         if not self.ensure_connection():
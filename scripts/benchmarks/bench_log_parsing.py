@@ -0,0 +1,205 @@
+"""
+Benchmarks shipping log parsing: the old per-line regex search against the
+category classifier in scripts/ftp/log_parser.py.
+Both sides parse the same categories and must find the same number of events. The
+command + chat workload is the one the classifier first replaced; the full workload
+adds the join, leave and death lines the roster listens to.
+
+Usage (from the repository root):
+    python -m scripts.benchmarks.bench_log_parsing --size-mb 300
+"""
+import os
+import re
+import sys
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+
+from scripts.ftp.log_events import AdminCommandEvent, ChatEvent, PlayerJoinEvent, PlayerLeaveEvent, PlayerDeathEvent
+from scripts.ftp.log_parser import parse_line, CATEGORY_PARSERS
+
+# Patterns as they were used before the classifier, searched on every decoded line
+LEGACY_COMMAND_PATTERN = re.compile(r"\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2})\]\[LogTheIsleCommandData\]: ([^\[]+) \[([0-9]{17})\] used command: (.+) at: (.+)")
+LEGACY_CHAT_PATTERN = re.compile(r"\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2})\]\[LogTheIsleChatData\].*?\[([0-9]{17})\]: (.*)")
+#  Join, leave and death lines written the same way, so both sides do the same work
+LEGACY_JOIN_PATTERN = re.compile(r"\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2})\]\[LogTheIsleJoinData\]: (.*?) \[([0-9]{17})\] (Joined|Left) The Server(.*)")
+LEGACY_KILL_PATTERN = re.compile(r"\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2})\]\[LogTheIsleKillData\]: .*?\[([0-9]{17})\] (.*)")
+LEGACY_DINO_PATTERN = re.compile(r"Dino: ([^,]*)")
+LEGACY_VICTIM_PATTERN = re.compile(r" - Killed the following player: .*?\[([0-9]{17})\](.*)")
+
+COMMAND_AND_CHAT = (b"CommandData", b"ChatData")
+
+SPECIES = ["Stegosaurus", "Omniraptor", "Troodon", "Deinosuchus", "Herrerasaurus", "Gallimimus"]
+
+
+def legacy_dino_class(text):
+    dino_match = LEGACY_DINO_PATTERN.search(text)
+    return dino_match.group(1).strip() if dino_match else ""
+
+
+def legacy_parse_line(raw_line, offset, full=True):
+    """The pre-classifier hot path: decode every line, then search each pattern in turn."""
+    line = raw_line.decode("utf-8", errors="replace")
+
+    command_match = LEGACY_COMMAND_PATTERN.search(line)
+    if command_match:
+        return AdminCommandEvent(
+            command_match.group(1), offset, command_match.group(2).strip(), command_match.group(3),
+            command_match.group(4).strip(), command_match.group(5).strip(),
+        )
+
+    chat_match = LEGACY_CHAT_PATTERN.search(line)
+    if chat_match:
+        return ChatEvent(chat_match.group(1), offset, chat_match.group(2), chat_match.group(3).strip())
+    if not full:
+        return None
+
+    join_match = LEGACY_JOIN_PATTERN.search(line)
+    if join_match:
+        timestamp, name, steam_id, action, rest = join_match.groups()
+        if action == "Joined":
+            return PlayerJoinEvent(timestamp, offset, steam_id, name.strip(), legacy_dino_class(rest))
+        return PlayerLeaveEvent(timestamp, offset, steam_id, name.strip(), "whilst not being safelogged" not in rest)
+
+    kill_match = LEGACY_KILL_PATTERN.search(line)
+    if kill_match:
+        timestamp, steam_id, rest = kill_match.groups()
+        victim_match = LEGACY_VICTIM_PATTERN.search(rest)
+        if victim_match:
+            return PlayerDeathEvent(timestamp, offset, victim_match.group(1), legacy_dino_class(victim_match.group(2)), steam_id)
+        return PlayerDeathEvent(timestamp, offset, steam_id, legacy_dino_class(rest), "")
+    return None
+
+
+def legacy_command_and_chat(raw_line, offset):
+    return legacy_parse_line(raw_line, offset, full=False)
+
+
+def classifier_command_and_chat(raw_line, offset, parsers={category: CATEGORY_PARSERS[category] for category in COMMAND_AND_CHAT}):
+    return parse_line(raw_line, offset, parsers)
+
+
+def synthetic_line(rng, second):
+    """Builds one log line with a realistic mix of categories."""
+    timestamp = f"2025.03.27-{(second // 3600) % 24:02d}.{(second // 60) % 60:02d}.{second % 60:02d}"
+    steam_id = f"7656119{rng.randrange(10 ** 10):010d}"
+    species = rng.choice(SPECIES)
+    roll = rng.random()
+
+    if roll < 0.55:
+        return f"[{timestamp}]LogNet: Verbose: UChannel::ReceivedSequencedBunch: Bunch.bOpen={rng.randrange(2)} ChIndex={rng.randrange(4096)}\n"
+    if roll < 0.72:
+        return f"[{timestamp}][LogTheIsleKillData]: Player [{steam_id}] Dino: BP_{species}_C, Male, 0.74 - Died from Natural cause\n"
+    if roll < 0.75:
+        victim_steam_id = f"7656119{rng.randrange(10 ** 10):010d}"
+        return (f"[{timestamp}][LogTheIsleKillData]: Player [{steam_id}] Dino: BP_{species}_C, Male, 0.74 - "
+                f"Killed the following player: Other, [{victim_steam_id}], Dino: BP_Troodon_C, Gender: Female, Growth: 0.5\n")
+    if roll < 0.84:
+        return f"[{timestamp}][LogTheIsleJoinData]: Player [{steam_id}] Joined The Server. Save file found Dino: BP_{species}_C, Gender: Female, Growth: 1.000000\n"
+    if roll < 0.88:
+        return f"[{timestamp}][LogTheIsleJoinData]: Player [{steam_id}] Left The Server whilst being safelogged, Was playing as: {species}\n"
+    if roll < 0.97:
+        if rng.random() < 0.01:
+            return f"[{timestamp}][LogTheIsleChatData]: [Global] Player [{steam_id}]: FD-PAIR-{rng.randrange(16 ** 8):08x}-1a2b-3c4d\n"
+        return f"[{timestamp}][LogTheIsleChatData]: [Global] Player [{steam_id}]: anyone seen a {species.lower()} near the lake?\n"
+    return (f"[{timestamp}][LogTheIsleCommandData]: Admin [{steam_id}] used command: Heal at: "
+            f"Player, [{steam_id}], Class: {species}, Gender: Male, Previous value: 0.250000%, New value: 100.000000%\n")
+
+
+def generate_log(path, size_mb, seed=1):
+    """Writes a synthetic shipping log of roughly size_mb megabytes."""
+    rng = random.Random(seed)
+    target = size_mb * 1024 * 1024
+    written = 0
+    second = 0
+
+    with open(path, "w", encoding="utf-8") as log_file:
+        while written < target:
+            chunk = "".join(synthetic_line(rng, second + i) for i in range(10000))
+            log_file.write(chunk)
+            written += len(chunk)
+            second += 10000
+
+
+def run_parser(path, parser, limit=None):
+    """Parses the raw file line by line, like the ingestion does, and returns (lines, events, seconds)."""
+    lines = matches = offset = 0
+    start = time.perf_counter()
+
+    with open(path, "rb") as log_file:
+        for raw_line in log_file:
+            offset += len(raw_line)
+            if parser(raw_line, offset) is not None:
+                matches += 1
+            lines += 1
+            if limit and lines >= limit:
+                break
+
+    return lines, matches, time.perf_counter() - start
+
+
+def measure_allocations(path, parser, limit):
+    """Returns (peak KiB, retained KiB) allocated while parsing the first `limit` lines."""
+    tracemalloc.start()
+    try:
+        run_parser(path, parser, limit)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024, current / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark shipping log parsing")
+    parser.add_argument("--size-mb", type=int, default=300, help="Size of the synthetic log to generate")
+    parser.add_argument("--path", type=str, default=None, help="Use an existing log file instead of generating one")
+    parser.add_argument("--alloc-lines", type=int, default=200000, help="Lines parsed under tracemalloc")
+    parser.add_argument("--min-speedup", type=float, default=1.2,
+                        help="Exit non-zero if the classifier isn't at least this many times faster on either workload")
+    args = parser.parse_args()
+
+    path = args.path
+    generated = path is None
+    if generated:
+        fd, path = tempfile.mkstemp(suffix=".log", prefix="bench-shipping-")
+        os.close(fd)
+        print(f"🔹 Generating {args.size_mb} MB synthetic log at {path}...")
+        generate_log(path, args.size_mb)
+
+    workloads = (
+        ("command + chat", legacy_command_and_chat, classifier_command_and_chat),
+        ("all categories", legacy_parse_line, parse_line),
+    )
+    speedups = {}
+    try:
+        for workload, legacy, classifier in workloads:
+            print(f"\n🔹 {workload}")
+            results = {}
+            for name, func in (("legacy regex", legacy), ("classifier", classifier)):
+                lines, matches, seconds = run_parser(path, func)
+                peak_kib, retained_kib = measure_allocations(path, func, args.alloc_lines)
+                results[name] = (lines / seconds, matches)
+                print(f"{name:>12}: {lines:,} lines, {matches:,} events in {seconds:.2f}s "
+                      f"({lines / seconds:,.0f} lines/s), peak {peak_kib:,.0f} KiB, retained {retained_kib:,.0f} KiB "
+                      f"over {args.alloc_lines:,} lines")
+
+            if results["legacy regex"][1] != results["classifier"][1]:
+                print("❌ Classifier and legacy regexes disagree on the number of events")
+                sys.exit(1)
+
+            speedups[workload] = results["classifier"][0] / results["legacy regex"][0]
+            print(f"⚡ Speedup: {speedups[workload]:.2f}x")
+    finally:
+        if generated:
+            os.remove(path)
+
+    for workload, speedup in speedups.items():
+        if speedup < args.min_speedup:
+            print(f"❌ {workload} speedup {speedup:.2f}x is below the required {args.min_speedup:.2f}x")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
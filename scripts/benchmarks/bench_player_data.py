@@ -0,0 +1,110 @@
+"""
+Benchmarks getplayerdata parsing and species aggregation: the old per-line regexes
+from the roster loop against the typed parser in scripts/rcon/player_data.py.
+
+Usage (from the repository root):
+    python -m scripts.benchmarks.bench_player_data --players 200
+"""
+import re
+import sys
+import time
+import random
+import argparse
+
+from scripts.rcon.player_data import parse_player_data, parse_player_list
+
+# Patterns as they were used by get_dino_population, searched on every line
+LEGACY_DINO_PATTERN = re.compile(r"Class: BP_(\w+)_C")
+LEGACY_HEALTH_PATTERN = re.compile(r"Health: ([0-9.]+)")
+LEGACY_STEAM_ID_PATTERN = re.compile(r"PlayerID: (\d{17})")
+
+SPECIES = ["Stegosaurus", "Omniraptor", "Troodon", "Deinosuchus", "Herrerasaurus", "Gallimimus",
+           "Pachycephalosaurus", "Tenontosaurus", "Carnotaurus", "Dilophosaurus"]
+
+
+def synthetic_payloads(players, seed=1):
+    """Builds matching playerlist and getplayerdata responses for `players` players."""
+    rng = random.Random(seed)
+    steam_ids = [f"7656119{rng.randrange(10 ** 10):010d}" for _ in range(players)]
+
+    player_list = "PlayerList\n" + "".join(f"{steam_id},Player{i}\n" for i, steam_id in enumerate(steam_ids))
+    player_data = "".join(
+        f"[2025.03.27-12.00.00] PlayerDataName: Player{i}, PlayerID: {steam_id}, "
+        f"Location: X={rng.uniform(-5e5, 5e5):.3f} Y={rng.uniform(-5e5, 5e5):.3f} Z={rng.uniform(0, 2e4):.3f}, "
+        f"Class: BP_{rng.choice(SPECIES)}_C, Growth: {rng.random():.6f}, Health: {rng.choice([0.0, rng.random()]):.6f}, "
+        f"Stamina: {rng.random():.6f}, Hunger: {rng.random():.6f}, Thirst: {rng.random():.6f}\n"
+        for i, steam_id in enumerate(steam_ids)
+    )
+    return player_list, player_data
+
+
+def legacy_counts(player_list, player_data):
+    """The pre-parser hot path: three regex searches and a float() per line."""
+    online_steam_ids = set(re.findall(r"(\d{17})", player_list))
+    dino_count = {}
+    for line in player_data.split("\n"):
+        dino_match = LEGACY_DINO_PATTERN.search(line)
+        health_match = LEGACY_HEALTH_PATTERN.search(line)
+        steam_id_match = LEGACY_STEAM_ID_PATTERN.search(line)
+
+        if dino_match and health_match and steam_id_match:
+            if float(health_match.group(1)) > 0.00 and steam_id_match.group(1) in online_steam_ids:
+                dino_count[dino_match.group(1)] = dino_count.get(dino_match.group(1), 0) + 1
+    return dino_count
+
+
+def parser_counts(player_list, player_data):
+    """Typed parse, playerlist filter and columnar count."""
+    table = parse_player_data(player_data, parse_player_list(player_list))
+    return dict(table.species_counts())
+
+
+def time_it(func, player_list, player_data, rounds, repeats=5):
+    """Returns the best mean milliseconds per call over `repeats` runs of `rounds` calls."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            func(player_list, player_data)
+        best = min(best, (time.perf_counter() - start) / rounds * 1000)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark getplayerdata parsing and aggregation")
+    parser.add_argument("--players", type=int, default=200, help="Players in the synthetic payload")
+    parser.add_argument("--rounds", type=int, default=500, help="Parses per timed run")
+    parser.add_argument("--min-speedup", type=float, default=1.1,
+                        help="Exit non-zero if the parser isn't at least this many times faster than the legacy regexes")
+    args = parser.parse_args()
+
+    player_list, player_data = synthetic_payloads(args.players)
+    print(f"🔹 {args.players} players, {len(player_data.encode()):,} byte getplayerdata payload")
+
+    if legacy_counts(player_list, player_data) != parser_counts(player_list, player_data):
+        print("❌ Parser and legacy regexes disagree on species counts")
+        sys.exit(1)
+
+    results = {}
+    for name, func in (("legacy regex", legacy_counts), ("typed parser", parser_counts)):
+        results[name] = time_it(func, player_list, player_data, args.rounds)
+        print(f"{name:>12}: {results[name]:.3f} ms per parse + aggregate")
+
+    table = parse_player_data(player_data)
+    steam_id = table.steam_ids[-1]
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        table.species_counts()
+        table.meeting(growth=0.75, stamina=1.0)
+        table.get(steam_id)
+    print(f"{'aggregate':>12}: {(time.perf_counter() - start) / args.rounds * 1000:.3f} ms per count + threshold scan + lookup")
+
+    speedup = results["legacy regex"] / results["typed parser"]
+    print(f"⚡ Speedup: {speedup:.2f}x")
+    if speedup < args.min_speedup:
+        print(f"❌ Speedup {speedup:.2f}x is below the required {args.min_speedup:.2f}x")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
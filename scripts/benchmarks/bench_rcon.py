@@ -0,0 +1,164 @@
+"""
+Benchmarks the RCON stack end to end against the local fake server in scripts/dev/fake_rcon_server.py:
+per-command latency, session throughput with concurrent callers, and roster-cycle time
+(snapshot refresh + roster decision), at 10, 100 and 500 players by default.
+Every latency and throughput response is checked against what the server sent, and responses
+cut short at the read gap (truncated) or carrying another response's bytes (misattributed) are counted.
+
+Usage (from the repository root):
+    python -m scripts.benchmarks.bench_rcon --players 10 100 500
+    python -m scripts.benchmarks.bench_rcon --latency 0.02 --drop-rate 0.01
+    python -m scripts.benchmarks.bench_rcon --stall 0.3 --stall-rate 0.2
+    python -m scripts.benchmarks.bench_rcon --unframed
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+from collections import Counter
+
+#  The RCON modules build their process-wide singletons on import; the benchmark makes its own sessions
+os.environ.setdefault("RCON_PORT", "0")
+
+from arcon import AsyncRconClient, READ_GAP
+from scripts.dev.fake_rcon_server import FakeRconServer, SPECIES, SEGMENT_DELAY
+from scripts.rcon.rcon_session import RconSession, is_error_response
+from scripts.rcon.player_snapshot import PlayerSnapshotService
+from scripts.rcon.roster_controller import RosterController
+
+LATENCY_COMMANDS = ("serverdetails", "playerlist", "getplayerdata")
+ROSTER_CAPS = {species: 10 if i % 2 else None for i, species in enumerate(SPECIES)}
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def summarize(samples):
+    """p50/p95/max in milliseconds."""
+    return (f"p50 {percentile(samples, 0.5) * 1000:7.1f}ms  p95 {percentile(samples, 0.95) * 1000:7.1f}ms  "
+            f"max {max(samples) * 1000:7.1f}ms")
+
+
+def classify(server, command_name, response):
+    """'ok', 'error', 'truncated' (a prefix of what was sent) or 'misattributed' (anything else)."""
+    if is_error_response(response):
+        return "error"
+    expected = server.respond(command_name, "").decode()
+    if response == expected:
+        return "ok"
+    return "truncated" if response and expected.startswith(response) else "misattributed"
+
+
+def format_outcomes(outcomes):
+    return f"errors {outcomes['error']}  truncated {outcomes['truncated']}  misattributed {outcomes['misattributed']}"
+
+
+async def measure_latency(session, server, command_name, rounds):
+    """Seconds per call for `rounds` sequential calls, and a Counter of how the responses checked out."""
+    samples, outcomes = [], Counter()
+    for _ in range(rounds):
+        started = time.perf_counter()
+        response = await session.send_command(command_name)
+        samples.append(time.perf_counter() - started)
+        outcomes[classify(server, command_name, response)] += 1
+    return samples, outcomes
+
+
+async def measure_throughput(session, server, callers, seconds):
+    """Commands per second through the session with `callers` concurrent callers, and their outcomes."""
+    deadline = time.perf_counter() + seconds
+    completed = 0
+    outcomes = Counter()
+
+    async def caller():
+        nonlocal completed
+        while time.perf_counter() < deadline:
+            response = await session.send_command("serverdetails")
+            outcomes[classify(server, "serverdetails", response)] += 1
+            completed += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(callers)))
+    return completed / (time.perf_counter() - started), outcomes
+
+
+async def measure_roster_cycle(session, rounds):
+    """Seconds per snapshot refresh + roster update, as the roster loop runs it."""
+    snapshots = PlayerSnapshotService(session)
+    controller = RosterController(session, ROSTER_CAPS)
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        snapshot = await snapshots.refresh()
+        await controller.update(snapshot.alive_counts())
+        samples.append(time.perf_counter() - started)
+    return samples, controller.updates_sent
+
+
+async def bench_players(players, args):
+    server = FakeRconServer(players, latency=args.latency, jitter=args.jitter,
+                            drop_rate=args.drop_rate, disconnect_rate=args.disconnect_rate,
+                            segment_delay=args.segment_delay, stall=args.stall, stall_rate=args.stall_rate,
+                            framed=not args.unframed)
+    async with server:
+        client = AsyncRconClient("127.0.0.1", server.port, server.password, timeout=args.timeout, read_gap=args.read_gap)
+        session = RconSession(client)
+        if not await client.connect():
+            print("❌ Couldn't connect to the fake server")
+            sys.exit(1)
+
+        payload = len(server.respond("getplayerdata", ""))
+        print(f"\n🔹 {players} players, {payload:,} byte getplayerdata payload")
+
+        for command_name in LATENCY_COMMANDS:
+            samples, outcomes = await measure_latency(session, server, command_name, args.rounds)
+            print(f"{command_name:>14}: {summarize(samples)}  {format_outcomes(outcomes)}")
+
+        throughput, outcomes = await measure_throughput(session, server, args.callers, args.seconds)
+        print(f"{'throughput':>14}: {throughput:,.1f} commands/s with {args.callers} concurrent callers  "
+              f"{format_outcomes(outcomes)}")
+
+        samples, updates_sent = await measure_roster_cycle(session, args.rounds)
+        print(f"{'roster cycle':>14}: {summarize(samples)}  updateplayables sent {updates_sent}")
+
+        await client.disconnect()
+        session.task.cancel()
+
+
+async def run(args):
+    print(f"🔹 read gap {args.read_gap * 1000:.0f}ms, injected latency {args.latency * 1000:.0f}ms "
+          f"(+{args.jitter * 1000:.0f}ms jitter), drop rate {args.drop_rate}, disconnect rate {args.disconnect_rate}, "
+          f"segment delay {args.segment_delay * 1000:.0f}ms, stall {args.stall * 1000:.0f}ms at rate {args.stall_rate}, "
+          f"{'unframed' if args.unframed else 'framed'} responses")
+    for players in args.players:
+        await bench_players(players, args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RCON latency, throughput and roster cycles")
+    parser.add_argument("--players", type=int, nargs="+", default=[10, 100, 500], help="Player counts to run")
+    parser.add_argument("--rounds", type=int, default=20, help="Calls per latency and roster-cycle measurement")
+    parser.add_argument("--callers", type=int, default=8, help="Concurrent callers for the throughput run")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Length of the throughput run")
+    parser.add_argument("--read-gap", type=float, default=READ_GAP, help="Client read gap, in seconds")
+    parser.add_argument("--timeout", type=float, default=2.0, help="Client timeout, in seconds")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the server waits before responding")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Up to this many more seconds, at random")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Fraction of commands never answered")
+    parser.add_argument("--disconnect-rate", type=float, default=0.0, help="Fraction of commands answered by disconnecting")
+    parser.add_argument("--segment-delay", type=float, default=SEGMENT_DELAY, help="Seconds between response segments")
+    parser.add_argument("--stall", type=float, default=0.0,
+                        help="Seconds a stalled response pauses midway; unframed, above the read gap it gets cut short")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="Fraction of multi-segment responses that stall")
+    parser.add_argument("--unframed", action="store_true",
+                        help="Server doesn't end responses with 0x00, so the client falls back to the read gap")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Local stand-in for Supabase's PostgREST API, for testing the database layer and its
+sync without a Supabase project. Serves /rest/v1/<table> with the subset the bot uses:
+select, eq./gt./in. filters, order, limit, offset, bulk insert, upsert with on_conflict
+(Prefer: resolution=merge-duplicates), PATCH and DELETE with Prefer: return=representation.
+Rows live in memory; latency and outages can be injected.
+
+Usage (from the repository root):
+    python -m scripts.dev.fake_postgrest --port 54321
+then run the bot with SUPABASE_URL=http://127.0.0.1:54321 SUPABASE_KEY=anything.
+"""
+import json
+import asyncio
+import argparse
+from collections import Counter
+from urllib.parse import urlsplit, parse_qsl
+
+#  Unique column per table, as in the Supabase schema
+TABLE_KEYS = {"pairings": "pair_code", "dinosaurs": "id"}
+
+REASONS = {200: "OK", 201: "Created", 204: "No Content", 400: "Bad Request", 404: "Not Found",
+           409: "Conflict", 503: "Service Unavailable"}
+RESERVED_PARAMS = {"select", "order", "limit", "offset", "on_conflict", "columns"}
+
+
+def matches(row, filters):
+    """True if a row passes every eq./gt./in. filter."""
+    for column, condition in filters:
+        operator, _, value = condition.partition(".")
+        actual = "" if row.get(column) is None else str(row.get(column))
+        if operator == "eq" and actual != value:
+            return False
+        if operator == "gt" and not (row.get(column) is not None and actual > value):
+            return False
+        if operator == "in" and actual not in value.strip("()").split(","):
+            return False
+        if operator == "is" and value == "null" and row.get(column) is not None:
+            return False
+    return True
+
+
+class FakePostgrest:
+    """
+    An asyncio HTTP server answering PostgREST requests from in-memory tables.
+    - latency: seconds added before every response
+    - available: when False every request gets a 503, like Supabase being down
+    Requests received are counted in `requests`, per method and table.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, table_keys=TABLE_KEYS):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.table_keys = table_keys
+        self.tables = {name: [] for name in table_keys}
+        self.available = True
+        self.requests = Counter()
+        self.connections = set()
+        self.handlers = set()
+        self.server = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def rows(self, table, filters=()):
+        return [row for row in self.tables.setdefault(table, []) if matches(row, filters)]
+
+    def select(self, table, params, filters):
+        rows = self.rows(table, filters)
+        for order in reversed(params.get("order", "").split(",") if params.get("order") else []):
+            column, _, direction = order.partition(".")
+            rows.sort(key=lambda row: (row.get(column) is None, str(row.get(column))), reverse=direction == "desc")
+
+        offset = int(params.get("offset", 0))
+        rows = rows[offset:offset + int(params["limit"])] if "limit" in params else rows[offset:]
+
+        columns = [column.strip() for column in params.get("select", "*").split(",")]
+        if "*" in columns:
+            return rows
+        return [{column: row.get(column) for column in columns} for row in rows]
+
+    def insert(self, table, body, params, prefer):
+        """Inserts rows, merging into existing ones on the conflict column if asked to."""
+        rows = body if isinstance(body, list) else [body]
+        key = params.get("on_conflict") or self.table_keys.get(table)
+        merge = "resolution=merge-duplicates" in prefer
+        stored = []
+        existing = {str(row.get(key)): row for row in self.tables.setdefault(table, [])} if key else {}
+
+        for row in rows:
+            current = existing.get(str(row.get(key))) if key else None
+            if current is not None and not merge:
+                return 409, {"message": f"duplicate key value violates unique constraint on {key}"}
+            if current is not None:
+                current.update(row)
+                stored.append(current)
+            else:
+                row = dict(row)
+                self.tables[table].append(row)
+                if key:
+                    existing[str(row.get(key))] = row
+                stored.append(row)
+        return 201, stored
+
+    def handle_request(self, method, path, params, filters, body, prefer):
+        """(status, rows) for one request."""
+        if not self.available:
+            return 503, {"message": "Service unavailable"}
+        if not path.startswith("/rest/v1/"):
+            return 404, {"message": "Not found"}
+
+        table = path[len("/rest/v1/"):]
+        self.requests[f"{method} {table}"] += 1
+
+        if method == "GET":
+            return 200, self.select(table, params, filters)
+        if method == "POST":
+            return self.insert(table, body, params, prefer)
+        if method == "PATCH":
+            rows = self.rows(table, filters)
+            for row in rows:
+                row.update(body)
+            return 200, rows
+        if method == "DELETE":
+            rows = self.rows(table, filters)
+            self.tables[table] = [row for row in self.tables[table] if not any(row is match for match in rows)]
+            return 200, rows
+        return 400, {"message": f"Unsupported method {method}"}
+
+    async def _respond(self, writer, status, payload, representation):
+        if status < 300 and not representation and not isinstance(payload, dict):
+            status, data = (204 if status == 200 else status), b""
+        else:
+            data = json.dumps(payload).encode()
+
+        headers = [f"HTTP/1.1 {status} {REASONS.get(status, '')}", f"Content-Length: {len(data)}"]
+        if data:
+            headers.append("Content-Type: application/json")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode() + data)
+        await writer.drain()
+
+    async def handle(self, reader, writer):
+        self.connections.add(writer)
+        self.handlers.add(asyncio.current_task())
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    return
+
+                method, target, _ = request_line.decode().split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                body = json.loads(await reader.readexactly(length)) if length else None
+
+                url = urlsplit(target)
+                pairs = parse_qsl(url.query, keep_blank_values=True)
+                params = {name: value for name, value in pairs if name in RESERVED_PARAMS}
+                filters = [(name, value) for name, value in pairs if name not in RESERVED_PARAMS]
+                prefer = headers.get("prefer", "")
+
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                status, payload = self.handle_request(method, url.path, params, filters, body, prefer)
+                await self._respond(writer, status, payload, method == "GET" or "return=representation" in prefer)
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self.connections.discard(writer)
+            self.handlers.discard(asyncio.current_task())
+            writer.close()
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            for writer in list(self.connections):
+                writer.close()
+            await asyncio.gather(*self.handlers, return_exceptions=True)
+            await self.server.wait_closed()
+            self.server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+
+async def serve(args):
+    server = FakePostgrest(args.host, args.port, args.latency)
+    await server.start()
+    print(f"🔹 Fake PostgREST on {server.url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a fake Supabase PostgREST API")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=54321)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added before every response")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
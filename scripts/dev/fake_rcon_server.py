@@ -0,0 +1,233 @@
+"""
+Local stand-in for an Evrima RCON server, for testing and benchmarking without a live game server.
+Speaks the same protocol as AsyncRconClient: 0x01 <password> 0x00 to authorize, then
+0x02 <command byte> <data> 0x00 per command, with bytes from RconClient.command_byte_map.
+Responses end with 0x00 too, unless started with framed=False (--unframed), which leaves
+the client to find their ends by silence.
+playerlist and getplayerdata answer for `players` synthetic players, written in several
+TCP segments like the real server does, and latency, dropped responses, disconnects and
+stalls between segments can be injected per command.
+
+Usage (from the repository root):
+    python -m scripts.dev.fake_rcon_server --players 100 --port 8888
+then run the bot with RCON_IP=127.0.0.1 RCON_PORT=8888 RCON_PASSWORD=password.
+"""
+import random
+import asyncio
+import argparse
+from collections import Counter
+
+from rcon import RconClient
+
+SPECIES = ["Stegosaurus", "Omniraptor", "Troodon", "Deinosuchus", "Herrerasaurus", "Gallimimus",
+           "Pachycephalosaurus", "Tenontosaurus", "Carnotaurus", "Dilophosaurus", "Maiasaura"]
+
+SEGMENT_SIZE = 1400  # Bytes per write, about one TCP segment
+SEGMENT_DELAY = 0.002  # Default seconds between segments of one response, well under the client's read gap
+
+COMMAND_NAMES = {command_byte: name for name, command_byte in RconClient.command_byte_map.items()}
+
+
+def synthetic_players(count, seed=1):
+    """Steam ID, name, species, growth, health, stamina, hunger and thirst for `count` players."""
+    rng = random.Random(seed)
+    return [
+        (f"7656119{rng.randrange(10 ** 10):010d}", f"Player{i}", rng.choice(SPECIES), rng.random(),
+         rng.choice([0.0, rng.random(), 1.0]), rng.random(), rng.random(), rng.random())
+        for i in range(count)
+    ]
+
+
+def player_list_response(players):
+    return "PlayerList\n" + "".join(f"{steam_id},{name},\n" for steam_id, name, *_ in players)
+
+
+def player_data_response(players, seed=1):
+    rng = random.Random(seed)
+    return "".join(
+        f"[2025.03.27-12.00.00] PlayerDataName: {name}, PlayerID: {steam_id}, "
+        f"Location: X={rng.uniform(-5e5, 5e5):.3f} Y={rng.uniform(-5e5, 5e5):.3f} Z={rng.uniform(0, 2e4):.3f}, "
+        f"Class: BP_{species}_C, Growth: {growth:.6f}, Health: {health:.6f}, "
+        f"Stamina: {stamina:.6f}, Hunger: {hunger:.6f}, Thirst: {thirst:.6f}\n"
+        for steam_id, name, species, growth, health, stamina, hunger, thirst in players
+    )
+
+
+class FakeRconServer:
+    """
+    An asyncio RCON server with synthetic players.
+    - latency/jitter: seconds added before every response
+    - drop_rate: fraction of commands that never get a response
+    - disconnect_rate: fraction of commands answered by closing the connection
+    - segment_delay: seconds between the segments of one response
+    - stall/stall_rate: a fraction of multi-segment responses pause for `stall` seconds
+      once, midway; above the client's read gap this cuts an unframed response short
+    - framed: end every response with 0x00
+    Commands received are counted in `commands`, per name.
+    """
+
+    def __init__(self, players=10, password="password", host="127.0.0.1", port=0,
+                 latency=0.0, jitter=0.0, drop_rate=0.0, disconnect_rate=0.0, seed=1,
+                 segment_delay=SEGMENT_DELAY, stall=0.0, stall_rate=0.0, framed=True):
+        self.password = password
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.disconnect_rate = disconnect_rate
+        self.segment_delay = segment_delay
+        self.stall = stall
+        self.stall_rate = stall_rate
+        self.framed = framed
+        self.rng = random.Random(seed)
+        self.seed = seed
+        self.commands = Counter()
+        self.connections = set()
+        self.handlers = set()
+        self.server = None
+        self.set_players(players)
+
+    def set_players(self, count):
+        """Replaces the synthetic players, e.g. to simulate people joining."""
+        self.players = synthetic_players(count, self.seed)
+        self.responses = {
+            "playerlist": player_list_response(self.players).encode(),
+            "getplayerdata": player_data_response(self.players, self.seed).encode(),
+            "serverdetails": (f"ServerDetails\nServerName: Fake Evrima, ServerPassword: , ServerMap: Gateway, "
+                              f"ServerMaxPlayers: 500, ServerCurrentPlayers: {count}\n").encode(),
+        }
+
+    def respond(self, command_name, command_data):
+        """The response body for one command."""
+        response = self.responses.get(command_name)
+        if response is not None:
+            return response
+        if command_name == "updateplayables":
+            return f"Updated playables: {command_data}".encode()
+        return f"{command_name} {command_data}".strip().encode()
+
+    async def _write(self, writer, response):
+        """Writes a response in segments, like a large response arriving over several packets."""
+        if self.framed:
+            response += b"\x00"
+        starts = range(0, len(response), SEGMENT_SIZE)
+        stall_at = starts[len(starts) // 2] if len(starts) > 1 and self.rng.random() < self.stall_rate else None
+        for start in starts:
+            if start:
+                await asyncio.sleep(self.stall if start == stall_at else self.segment_delay)
+            writer.write(response[start:start + SEGMENT_SIZE])
+            await writer.drain()
+
+    async def _packets(self, reader):
+        """Yields 0x00-terminated packets, however TCP splits or merges them."""
+        buffer = bytearray()
+        while True:
+            chunk = await reader.read(65536)
+            if not chunk:
+                return
+            buffer += chunk
+            while (end := buffer.find(b"\x00")) != -1:
+                packet = bytes(buffer[:end])
+                del buffer[:end + 1]
+                yield packet
+
+    async def handle(self, reader, writer):
+        self.connections.add(writer)
+        self.handlers.add(asyncio.current_task())
+        authorized = False
+        try:
+            async for packet in self._packets(reader):
+                if not packet:
+                    continue
+
+                if packet[0] == 0x01:
+                    authorized = packet[1:].decode(errors="ignore") == self.password
+                    await self._write(writer, b"Password Accepted" if authorized else b"Password Rejected")
+                    if not authorized:
+                        return
+                    continue
+
+                if packet[0] != 0x02 or len(packet) < 2 or not authorized:
+                    return
+
+                command_name = COMMAND_NAMES.get(packet[1], f"0x{packet[1]:02x}")
+                self.commands[command_name] += 1
+
+                delay = self.latency + self.rng.uniform(0, self.jitter)
+                if delay:
+                    await asyncio.sleep(delay)
+                if self.rng.random() < self.disconnect_rate:
+                    return
+                if self.rng.random() < self.drop_rate:
+                    continue
+
+                await self._write(writer, self.respond(command_name, packet[2:].decode(errors="ignore")))
+        except ConnectionError:
+            pass
+        finally:
+            self.connections.discard(writer)
+            self.handlers.discard(asyncio.current_task())
+            writer.close()
+
+    def disconnect_all(self):
+        """Drops every open connection, like the server going down for a restart."""
+        for writer in list(self.connections):
+            writer.close()
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            self.disconnect_all()
+            await asyncio.gather(*self.handlers, return_exceptions=True)
+            await self.server.wait_closed()
+            self.server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+
+async def serve(args):
+    server = FakeRconServer(args.players, args.password, args.host, args.port, args.latency, args.jitter,
+                            args.drop_rate, args.disconnect_rate, segment_delay=args.segment_delay,
+                            stall=args.stall, stall_rate=args.stall_rate, framed=not args.unframed)
+    await server.start()
+    print(f"🔹 Fake RCON server on {server.host}:{server.port} with {args.players} players")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a fake Evrima RCON server")
+    parser.add_argument("--players", type=int, default=100, help="Synthetic players online")
+    parser.add_argument("--password", type=str, default="password")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8888)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added before every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Up to this many more seconds, at random")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Fraction of commands never answered")
+    parser.add_argument("--disconnect-rate", type=float, default=0.0, help="Fraction of commands answered by disconnecting")
+    parser.add_argument("--segment-delay", type=float, default=SEGMENT_DELAY, help="Seconds between response segments")
+    parser.add_argument("--stall", type=float, default=0.0, help="Seconds a stalled response pauses midway")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="Fraction of multi-segment responses that stall")
+    parser.add_argument("--unframed", action="store_true", help="Don't end responses with 0x00")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
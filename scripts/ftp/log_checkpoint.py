@@ -0,0 +1,102 @@
+import os
+import json
+import hashlib
+
+# Local storage
+LOCAL_LOG_DIR = "logs"
+CHECKPOINT_FILE = os.path.join(LOCAL_LOG_DIR, "log_checkpoints.json")
+
+# The server starts a new log on every restart, so the first bytes identify the file
+FINGERPRINT_BYTES = 1024
+
+
+def log_fingerprint(path, length=FINGERPRINT_BYTES):
+    """
+    Hashes the first bytes of a log file.
+
+    Returns:
+        - hex digest once the file holds at least `length` bytes
+        - None while the file is still shorter than that
+    """
+    try:
+        with open(path, "rb") as log_file:
+            head = log_file.read(length)
+    except OSError:
+        return None
+
+    if len(head) < length:
+        return None
+    return hashlib.sha1(head).hexdigest()
+
+
+class CheckpointStore:
+    """
+    Durable per-consumer log positions: byte offset, log fingerprint and last event time.
+    Updates are kept in memory and written with a single atomic replace per commit().
+    """
+
+    def __init__(self, path=CHECKPOINT_FILE):
+        self.path = path
+        self.checkpoints = self._load()
+        self.dirty = False
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read log checkpoints, starting fresh: {e}")
+            return {}
+
+    def get(self, name):
+        """Returns the checkpoint dict for a consumer, or None if it has never committed."""
+        return self.checkpoints.get(name)
+
+    def update(self, name, offset, fingerprint, last_event_time=None):
+        """Moves a consumer's checkpoint in memory. Nothing is written until commit()."""
+        previous = self.checkpoints.get(name, {})
+        checkpoint = {
+            "offset": offset,
+            "fingerprint": fingerprint,
+            "last_event_time": last_event_time or previous.get("last_event_time"),
+        }
+
+        if checkpoint != previous:
+            self.checkpoints[name] = checkpoint
+            self.dirty = True
+
+    def is_valid(self, name, fingerprint, log_size, log_path=None):
+        """
+        Checks that a consumer's checkpoint points into the current log file.
+        A checkpoint saved while the log was shorter than FINGERPRINT_BYTES carries a hash of
+        the bytes before its offset instead, so it is checked against that prefix of `log_path`.
+        """
+        checkpoint = self.checkpoints.get(name)
+        if not checkpoint or checkpoint["offset"] > log_size or checkpoint["fingerprint"] is None:
+            return False  # No fingerprint can't be told apart from a different log
+        if checkpoint["fingerprint"] == fingerprint:
+            return True
+
+        return (log_path is not None and checkpoint["offset"] < FINGERPRINT_BYTES
+                and checkpoint["fingerprint"] == log_fingerprint(log_path, checkpoint["offset"]))
+
+    def commit(self):
+        """Writes all checkpoints atomically if anything changed since the last commit."""
+        if not self.dirty:
+            return
+
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(self.checkpoints, file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            print(f"❌ Could not save log checkpoints: {e}")
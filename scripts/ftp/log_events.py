@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class LogEvent:
+    """
+    Base class for events parsed from TheIsle-Shipping.log.
+    Events are shared between subscribers, treat them as read-only.
+    """
+    timestamp: str  # Raw log timestamp, e.g. 2025.03.27-20.29.22
+    offset: int  # Byte offset just past the line in the local log copy
+
+
+@dataclass(slots=True)
+class AdminCommandEvent(LogEvent):
+    """An admin used a command ([LogTheIsleCommandData])."""
+    admin_name: str
+    admin_steam_id: str
+    command: str
+    details: str
+
+
+@dataclass(slots=True)
+class ChatEvent(LogEvent):
+    """A player sent a chat message ([LogTheIsleChatData])."""
+    steam_id: str
+    message: str
+
+
+@dataclass(slots=True)
+class PlayerJoinEvent(LogEvent):
+    """A player joined the server ([LogTheIsleJoinData])."""
+    steam_id: str
+    player_name: str
+    dino_class: str  # Blueprint class of the save file, "" if the player has none
+
+
+@dataclass(slots=True)
+class PlayerLeaveEvent(LogEvent):
+    """A player left the server ([LogTheIsleJoinData])."""
+    steam_id: str
+    player_name: str
+    safelogged: bool
+
+
+@dataclass(slots=True)
+class PlayerDeathEvent(LogEvent):
+    """A player's dino died, of natural causes or killed by another player ([LogTheIsleKillData])."""
+    steam_id: str
+    dino_class: str
+    killer_steam_id: str  # "" unless another player did it
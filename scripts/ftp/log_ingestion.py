@@ -0,0 +1,235 @@
+import os
+import time
+import asyncio
+from collections import deque
+from dotenv import load_dotenv
+from .setup_ftp import setup_async_ftp
+from .log_tailer import LogTailer
+from .log_parser import parse_line
+from .log_reader import iter_log_lines, last_line_end
+from .log_checkpoint import CheckpointStore, log_fingerprint, FINGERPRINT_BYTES
+from utils.loop_lag import LOOP_LAG_MONITOR
+
+load_dotenv()
+
+FTP_LOG_PATH = os.getenv("FTP_LOG_PATH")
+
+# Local storage
+LOCAL_LOG_DIR = "logs"
+LOCAL_LOG_FILE = os.path.join(LOCAL_LOG_DIR, "TheIsle-Shipping.log")
+
+POLL_INTERVAL = 1  # Seconds between FTP polls
+METRICS_INTERVAL = 600  # Seconds between FTP / event loop metrics reports
+INGESTION_CHECKPOINT = "ingestion"  # Checkpoint name for the ingestion's own read position
+
+
+class LogSubscription:
+    """
+    A consumer's view of the log: a queue that only receives the event types it asked for.
+    Named subscriptions are durable: they resume from their checkpoint after a restart.
+    """
+
+    def __init__(self, ingestion, event_types, maxsize, name=None):
+        self.ingestion = ingestion
+        self.event_types = tuple(event_types)
+        self.queue = asyncio.Queue(maxsize)
+        self.name = name
+        self.delivered_offset = None  # Resolved by the ingestion on its next poll
+        self.in_flight = deque()  # (event, fingerprint) delivered but not yet acknowledged
+
+    async def get(self):
+        """Waits for the next matching event."""
+        return await self.queue.get()
+
+    async def get_batch(self):
+        """Waits for at least one event, then returns everything already queued."""
+        batch = [await self.queue.get()]
+        while not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        return batch
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.queue.get()
+
+    def ack(self, event):
+        """
+        Marks an event and everything delivered before it as processed,
+        committing the subscription's checkpoint once for the whole batch.
+        """
+        fingerprint = None
+        while self.in_flight:
+            delivered, fingerprint = self.in_flight.popleft()
+            if delivered is event:
+                break
+
+        if self.name:
+            fingerprint = fingerprint or self.ingestion._fingerprint_at(event.offset)
+            self.ingestion.checkpoints.update(self.name, event.offset, fingerprint, event.timestamp)
+            self.ingestion.checkpoints.commit()
+
+    def close(self):
+        """Stops receiving events."""
+        self.ingestion.unsubscribe(self)
+
+
+class LogIngestion:
+    """
+    Owns the shipping log download and turns new lines into typed events,
+    fanning them out to every subscription that asked for that event type.
+    """
+
+    def __init__(self, tailer, checkpoints, poll_interval=POLL_INTERVAL):
+        self.tailer = tailer
+        self.checkpoints = checkpoints
+        self.poll_interval = poll_interval
+        self.offset = None  # Byte offset just past the last complete line read
+        self.fingerprint = None  # Identifies the log file the offsets refer to
+        self.subscriptions = []
+        self._routes = {}  # Event type -> subscriptions interested in it
+        self.task = None
+        self.last_metrics_report = time.monotonic()
+
+    def subscribe(self, *event_types, name=None, maxsize=1000):
+        """
+        Registers a consumer for the given event types.
+        Pass a name to keep a durable checkpoint and resume after a restart; call ack() per batch.
+        """
+        subscription = LogSubscription(self, event_types, maxsize, name)
+        if not name:
+            subscription.delivered_offset = self.offset
+        self.subscriptions.append(subscription)
+        self._routes.clear()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """Removes a consumer. Safe to call more than once."""
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+            self._routes.clear()
+
+    def _subscribers_for(self, event_type):
+        routes = self._routes.get(event_type)
+        if routes is None:
+            routes = [sub for sub in self.subscriptions if issubclass(event_type, sub.event_types)]
+            self._routes[event_type] = routes
+        return routes
+
+    async def publish(self, event):
+        """Delivers an event to every interested subscription that hasn't seen it yet."""
+        for subscription in self._subscribers_for(type(event)):
+            if event.offset <= subscription.delivered_offset:
+                continue  # Already delivered before a rewind for another consumer
+
+            subscription.delivered_offset = event.offset
+            if subscription.name:
+                subscription.in_flight.append((event, self._fingerprint_at(event.offset)))
+            await subscription.queue.put(event)
+
+    def _fingerprint_at(self, offset):
+        """
+        The fingerprint to save with a checkpoint at `offset`. Until the log is long enough
+        for its own fingerprint, a hash of the bytes before the offset identifies it instead.
+        """
+        if self.fingerprint is not None:
+            return self.fingerprint
+        return log_fingerprint(self.tailer.local_path, min(offset, FINGERPRINT_BYTES))
+
+    def _resume_offset(self, name, default, log_size):
+        """Where a consumer should resume: its checkpoint, the start of a new log, or the default."""
+        if self.checkpoints.get(name) is None:
+            return default
+        if self.checkpoints.is_valid(name, self.fingerprint, log_size, self.tailer.local_path):
+            return self.checkpoints.get(name)["offset"]
+        return 0  # Checkpoint belongs to an older log, the current one is all new
+
+    def _sync_offsets(self, update):
+        """Handles rotation and resolves the start offset of new subscriptions."""
+        log_size = self.tailer.local_size()
+        rotated = update is not None and update.rotated or (self.offset or 0) > log_size
+
+        if rotated or self.fingerprint is None:
+            self.fingerprint = log_fingerprint(self.tailer.local_path)
+
+        if rotated:
+            self.offset = 0
+            for subscription in self.subscriptions:
+                subscription.delivered_offset = 0
+
+        if self.offset is None:
+            #  Without a checkpoint, start at the end of the log, but never in the middle of a line
+            start = last_line_end(self.tailer.local_path, log_size)
+            self.offset = self._resume_offset(INGESTION_CHECKPOINT, start, log_size)
+
+        for subscription in self.subscriptions:
+            if subscription.delivered_offset is None:
+                subscription.delivered_offset = self._resume_offset(subscription.name, self.offset, log_size)
+
+    def _save_checkpoints(self):
+        """Advances idle durable consumers to the read position and commits once for the poll."""
+        fingerprint = self._fingerprint_at(self.offset)
+        self.checkpoints.update(INGESTION_CHECKPOINT, self.offset, fingerprint)
+
+        for subscription in self.subscriptions:
+            subscription.delivered_offset = max(subscription.delivered_offset, self.offset)
+            if subscription.name and not subscription.in_flight:
+                self.checkpoints.update(subscription.name, self.offset, fingerprint)
+
+        self.checkpoints.commit()
+
+    def iter_new_events(self, start):
+        """Lazily parses complete lines in the local copy from a byte offset."""
+        for raw_line, end_offset in iter_log_lines(self.tailer.local_path, start):
+            self.offset = max(self.offset, end_offset)
+            event = parse_line(raw_line, end_offset)
+            if event:
+                yield event
+
+    async def poll_once(self):
+        """Fetches new log bytes and publishes the resulting events."""
+        update = await self.tailer.poll()
+        self._sync_offsets(update)
+
+        start = min([self.offset] + [sub.delivered_offset for sub in self.subscriptions])
+        for event in self.iter_new_events(start):
+            await self.publish(event)
+
+        self._save_checkpoints()
+
+    def report_metrics(self):
+        """Periodically prints how much event loop time FTP polling costs."""
+        if time.monotonic() - self.last_metrics_report < METRICS_INTERVAL:
+            return
+
+        self.last_metrics_report = time.monotonic()
+        print(f"📊 FTP: {self.tailer.ftp_client.metrics.summary()}; {LOOP_LAG_MONITOR.summary()}")
+        LOOP_LAG_MONITOR.reset()
+
+    async def run(self):
+        """Continuously polls the log and publishes new events."""
+        print("🔹 Log ingestion started...")
+
+        while True:
+            try:
+                await self.poll_once()
+            except Exception as e:
+                print(f"❌ Error in log ingestion: {e}")
+
+            self.report_metrics()
+            await asyncio.sleep(self.poll_interval)
+
+    def start(self):
+        """Starts the ingestion task if it isn't already running."""
+        if self.task is None or self.task.done():
+            self.tailer.ftp_client.start_keepalive()
+            LOOP_LAG_MONITOR.start()
+            self.task = asyncio.get_running_loop().create_task(self.run())
+        return self.task
+
+
+LOG_INGESTION = LogIngestion(
+    LogTailer(setup_async_ftp(), FTP_LOG_PATH, LOCAL_LOG_FILE),
+    CheckpointStore(),
+)
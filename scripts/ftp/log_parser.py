@@ -0,0 +1,187 @@
+from .log_events import AdminCommandEvent, ChatEvent, PlayerJoinEvent, PlayerLeaveEvent, PlayerDeathEvent
+
+# Every game event line carries a category tag right after the timestamp, e.g.
+# [2025.03.27-20.29.22][LogTheIsleCommandData]: ...
+# Tags are read from the raw bytes so lines nobody cares about are never decoded.
+CATEGORY_MARKER = b"[LogTheIsle"
+CATEGORY_START = len(CATEGORY_MARKER)
+TAG_POSITION = len("[2025.03.27-20.29.22]")
+
+COMMAND_SEPARATOR = " used command: "
+COMMAND_TARGET_SEPARATOR = " at: "
+JOINED_MARKER = " Joined The Server"
+LEFT_MARKER = " Left The Server"
+NOT_SAFELOGGED_MARKER = "whilst not being safelogged"
+DINO_FIELD = "Dino: "
+KILLED_MARKER = " - Killed the following player: "
+STEAM_ID_LENGTH = 17
+
+
+def classify_line(line):
+    """
+    Reads the [LogTheIsle...] category tag of a raw (bytes) line.
+
+    Returns:
+        - (category, end) where category is e.g. b"CommandData" and end is the index of the closing bracket
+        - (None, -1) for lines without a category tag
+    """
+    if line.startswith(CATEGORY_MARKER, TAG_POSITION):
+        start = TAG_POSITION
+    else:
+        start = line.find(CATEGORY_MARKER)
+        if start == -1:
+            return None, -1
+
+    end = line.find(b"]", start + CATEGORY_START)
+    if end == -1:
+        return None, -1
+
+    return line[start + CATEGORY_START:end], end
+
+
+def line_timestamp(line):
+    """Returns the leading [YYYY.MM.DD-HH.MM.SS] timestamp of a line."""
+    return line[1:20] if line.startswith("[") else ""
+
+
+def bracketed_steam_id_before(line, index):
+    """Returns the [SteamID] ending right before index, or None."""
+    start = index - STEAM_ID_LENGTH
+    if start < 1 or line[start - 1] != "[":
+        return None
+
+    steam_id = line[start:index]
+    return steam_id if steam_id.isdigit() else None
+
+
+def next_bracketed_steam_id(line, start):
+    """Returns (steam_id, index of its "[") for the first [SteamID] at or after start, or (None, -1)."""
+    bracket = line.find("[", start)
+    while bracket != -1:
+        closing = bracket + STEAM_ID_LENGTH + 1
+        if line[closing:closing + 1] == "]" and line[bracket + 1:closing].isdigit():
+            return line[bracket + 1:closing], bracket
+        bracket = line.find("[", bracket + 1)
+
+    return None, -1
+
+
+def dino_class_after(line, start):
+    """Returns the blueprint class following "Dino: " at or after start, or ""."""
+    field = line.find(DINO_FIELD, start)
+    if field == -1:
+        return ""
+
+    value_start = field + len(DINO_FIELD)
+    value_end = line.find(",", value_start)
+    return line[value_start:value_end if value_end != -1 else len(line)].strip()
+
+
+def parse_command(line, end, offset):
+    """
+    Parses a [LogTheIsleCommandData] line:
+    ...]: Admin [SteamID] used command: Heal at: Player, [SteamID], Class: ...
+    """
+    used = line.find(COMMAND_SEPARATOR, end)
+    if used == -1 or line[used - 1] != "]":
+        return None
+
+    admin_steam_id = bracketed_steam_id_before(line, used - 1)
+    if admin_steam_id is None:
+        return None
+
+    command_start = used + len(COMMAND_SEPARATOR)
+    target = line.find(COMMAND_TARGET_SEPARATOR, command_start)
+    if target == -1:
+        return None
+
+    return AdminCommandEvent(
+        line_timestamp(line),
+        offset,
+        line[end + 3:used - STEAM_ID_LENGTH - 2].strip(),
+        admin_steam_id,
+        line[command_start:target].strip(),
+        line[target + len(COMMAND_TARGET_SEPARATOR):].strip(),
+    )
+
+
+def parse_chat(line, end, offset):
+    """
+    Parses a [LogTheIsleChatData] line:
+    ...]: [Global] Player [SteamID]: message
+    """
+    separator = line.find("]: ", end + 1)
+    while separator != -1:
+        steam_id = bracketed_steam_id_before(line, separator)
+        if steam_id is not None:
+            return ChatEvent(line_timestamp(line), offset, steam_id, line[separator + 3:].strip())
+        separator = line.find("]: ", separator + 1)
+
+    return None
+
+
+def parse_join(line, end, offset):
+    """
+    Parses a [LogTheIsleJoinData] line:
+    ...]: Name [SteamID] Joined The Server. Save file found Dino: BP_Stegosaurus_C, Gender: Male, Growth: 1.000000
+    ...]: Name [SteamID] Left The Server whilst being safelogged, Was playing as: Stegosaurus, ...
+    """
+    steam_id, bracket = next_bracketed_steam_id(line, end + 1)
+    if steam_id is None:
+        return None
+
+    player_name = line[end + 3:bracket].strip()
+    after_id = bracket + STEAM_ID_LENGTH + 2
+    if line.startswith(JOINED_MARKER, after_id):
+        return PlayerJoinEvent(line_timestamp(line), offset, steam_id, player_name, dino_class_after(line, after_id))
+    if line.startswith(LEFT_MARKER, after_id):
+        return PlayerLeaveEvent(line_timestamp(line), offset, steam_id, player_name, NOT_SAFELOGGED_MARKER not in line)
+
+    return None
+
+
+def parse_kill(line, end, offset):
+    """
+    Parses a [LogTheIsleKillData] line:
+    ...]: Name [SteamID] Dino: BP_Troodon_C, Male, 0.74 - Died from Natural cause
+    ...]: Name [SteamID] Dino: BP_Troodon_C, Male, 0.74 - Killed the following player: Other, [SteamID], Dino: BP_Dryosaurus_C, ...
+    """
+    steam_id, bracket = next_bracketed_steam_id(line, end + 1)
+    if steam_id is None:
+        return None
+
+    killed = line.find(KILLED_MARKER, bracket)
+    if killed == -1:
+        return PlayerDeathEvent(line_timestamp(line), offset, steam_id, dino_class_after(line, bracket), "")
+
+    #  The first player is the killer; the victim follows the marker
+    victim_steam_id, victim_bracket = next_bracketed_steam_id(line, killed + len(KILLED_MARKER))
+    if victim_steam_id is None:
+        return None
+    return PlayerDeathEvent(line_timestamp(line), offset, victim_steam_id, dino_class_after(line, victim_bracket), steam_id)
+
+
+#  Category tag -> parser. Lines in any other category are skipped after the tag is read.
+CATEGORY_PARSERS = {
+    b"CommandData": parse_command,
+    b"ChatData": parse_chat,
+    b"JoinData": parse_join,
+    b"KillData": parse_kill,
+}
+
+
+def parse_line(raw_line, offset, parsers=CATEGORY_PARSERS):
+    """
+    Turns a raw (bytes) log line into a typed event, or None if nothing is interested in it.
+    `parsers` narrows the categories parsed, e.g. to benchmark a subset.
+    """
+    category, end = classify_line(raw_line)
+    parser = parsers.get(category)
+    if parser is None:
+        return None
+
+    line = raw_line.decode("utf-8", errors="replace")
+    if len(line) != len(raw_line):
+        #  Multi-byte characters shift indexes, find the tag again in the decoded line
+        end = line.find("]", line.find("[LogTheIsle"))
+    return parser(line, end, offset)
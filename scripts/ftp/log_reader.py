@@ -0,0 +1,60 @@
+import os
+
+# Longest line kept in memory at once; longer lines are skipped rather than buffered
+MAX_LINE_BYTES = 64 * 1024
+
+
+def iter_log_lines(path, offset=0, max_line_bytes=MAX_LINE_BYTES):
+    """
+    Lazily yields (raw_line, end_offset) for every complete line after offset.
+
+    A trailing line without a newline is still being written, so it is not
+    yielded; resume from the last end_offset to pick it up once it's complete.
+    Only one line is held in memory at a time, whatever the size of the file.
+    """
+    if not os.path.exists(path):
+        return
+
+    with open(path, "rb") as log_file:
+        log_file.seek(offset)
+
+        while True:
+            raw_line = log_file.readline(max_line_bytes)
+            if not raw_line.endswith(b"\n"):
+                if len(raw_line) < max_line_bytes:
+                    return  # End of file or partial trailing line
+
+                #  Oversized line: drop it but keep the offset moving past it
+                skipped = len(raw_line)
+                while raw_line and not raw_line.endswith(b"\n"):
+                    raw_line = log_file.readline(max_line_bytes)
+                    skipped += len(raw_line)
+                if not raw_line:
+                    return  # Still being written, retry from the same offset later
+
+                offset += skipped
+                print(f"⚠️ Skipped a {skipped} byte log line.")
+                continue
+
+            offset += len(raw_line)
+            yield raw_line, offset
+
+
+def last_line_end(path, size, chunk_bytes=MAX_LINE_BYTES):
+    """
+    The offset just past the last newline in the first `size` bytes, or 0 if there is none.
+    Reads backwards from `size`, so starting from here never begins halfway through a line.
+    """
+    if not os.path.exists(path):
+        return 0
+
+    with open(path, "rb") as log_file:
+        end = size
+        while end > 0:
+            start = max(end - chunk_bytes, 0)
+            log_file.seek(start)
+            newline = log_file.read(end - start).rfind(b"\n")
+            if newline != -1:
+                return start + newline + 1
+            end = start
+    return 0
@@ -0,0 +1,134 @@
+import os
+from collections import namedtuple
+
+# Bytes re-fetched from before the local end of file to verify the remote log is
+# still the same file (the server rewrites it from scratch on every restart)
+OVERLAP_BYTES = 256
+
+#  start/end are byte offsets of the newly appended region in the local copy
+TailUpdate = namedtuple("TailUpdate", ["start", "end", "rotated"])
+
+
+class _OverlapWriter:
+    """
+    Appends a REST download to the local copy, checking the leading overlap first.
+    If the overlap does not match the local tail the remote file was replaced,
+    and the rest of the transfer is discarded.
+    """
+
+    def __init__(self, file, expected_overlap):
+        self.file = file
+        self.expected = expected_overlap
+        self.received = bytearray()
+        self.mismatch = False
+        self.written = 0
+
+    def __call__(self, chunk):
+        if self.mismatch:
+            return
+
+        if len(self.received) < len(self.expected):
+            needed = len(self.expected) - len(self.received)
+            self.received += chunk[:needed]
+            chunk = chunk[needed:]
+
+            if len(self.received) < len(self.expected):
+                return
+            if bytes(self.received) != self.expected:
+                self.mismatch = True
+                return
+
+        if chunk:
+            self.file.write(chunk)
+            self.written += len(chunk)
+
+
+class LogTailer:
+    """
+    Keeps a local copy of a remote log file in sync by fetching only the bytes
+    appended since the last poll, instead of re-downloading the whole file.
+    Expects an AsyncFTPClient, so polling never blocks the event loop.
+    """
+
+    def __init__(self, ftp_client, remote_path, local_path, overlap=OVERLAP_BYTES):
+        self.ftp_client = ftp_client
+        self.remote_path = remote_path
+        self.local_path = local_path
+        self.overlap = overlap
+        self.last_mtime = None
+
+    def local_size(self):
+        """Size of the local copy in bytes (0 if it doesn't exist yet)."""
+        try:
+            return os.path.getsize(self.local_path)
+        except OSError:
+            return 0
+
+    def _read_local_tail(self, local_size):
+        start = max(local_size - self.overlap, 0)
+        with open(self.local_path, "rb") as file:
+            file.seek(start)
+            return start, file.read()
+
+    def _reset_local(self):
+        open(self.local_path, "wb").close()
+
+    async def _append_from(self, offset, expected_overlap):
+        os.makedirs(os.path.dirname(self.local_path) or ".", exist_ok=True)
+        with open(self.local_path, "ab") as file:
+            writer = _OverlapWriter(file, expected_overlap)
+            if not await self.ftp_client.download_range(self.remote_path, writer, offset):
+                return None
+        return writer
+
+    async def poll(self):
+        """
+        Fetches new remote bytes into the local copy.
+
+        Returns:
+            - TailUpdate(start, end, rotated) when new bytes were appended
+            - None if nothing changed or the remote couldn't be reached
+        """
+        remote_size = await self.ftp_client.get_size(self.remote_path)
+        if remote_size is None:
+            return None
+
+        remote_mtime = await self.ftp_client.get_mtime(self.remote_path)
+        local_size = self.local_size()
+
+        if remote_size == local_size and (remote_mtime is None or remote_mtime == self.last_mtime):
+            self.last_mtime = remote_mtime
+            return None
+
+        rotated = False
+        if remote_size < local_size:
+            #  Log was truncated or replaced after a server restart
+            print(f"🔄 Remote log shrank ({local_size} -> {remote_size} bytes), starting over.")
+            self._reset_local()
+            local_size = 0
+            rotated = True
+
+        if local_size:
+            overlap_start, expected = self._read_local_tail(local_size)
+        else:
+            overlap_start, expected = 0, b""
+
+        writer = await self._append_from(overlap_start, expected)
+        if writer is None:
+            return None
+
+        if writer.mismatch:
+            #  Same or larger size but different content: a new log replaced the old one
+            print("🔄 Remote log was replaced, starting over.")
+            self._reset_local()
+            local_size = 0
+            rotated = True
+            writer = await self._append_from(0, b"")
+            if writer is None:
+                return None
+
+        self.last_mtime = remote_mtime
+
+        if not writer.written and not rotated:
+            return None
+        return TailUpdate(local_size, local_size + writer.written, rotated)
@@ -0,0 +1,208 @@
+import re
+import asyncio
+import datetime
+from dotenv import load_dotenv
+from database.pairings import PAIRINGS
+from database.pairing_cache import PAIRING_CACHE
+from utils.timer_wheel import TimerWheel
+from utils.discord.send_messages import send_dm
+from .log_events import ChatEvent
+
+load_dotenv()
+
+PAIR_CODE_PREFIX = "FD-PAIR-"
+PAIR_TIMEOUT = 900  # Seconds a pair code stays valid (15 minutes)
+RETRY_DELAY = 30  # Seconds before a chat line whose pairing failed is tried again
+
+# Durable checkpoint name, so codes typed while the bot was down are still matched
+CHECKPOINT_NAME = "pairing"
+
+# Regex patterns
+PAIR_CODE_PATTERN = re.compile(r"FD-PAIR-[a-fA-F0-9\-]+")
+
+
+class PendingPair:
+    """A pair code waiting to be typed in game chat."""
+    __slots__ = ("discord_id", "pair_code")
+
+    def __init__(self, discord_id, pair_code):
+        self.discord_id = discord_id
+        self.pair_code = pair_code
+
+
+class PairingService:
+    """
+    Single long-lived watcher for every pending /pair request.
+    Pending codes live in a dict and expire through one timer wheel, so chat lines
+    are matched in O(1) and Supabase is only touched on a real match or expiry.
+    Chat is watched on every server's log ingestion passed to watch(), so a code works on any of them.
+    A chat line whose pairing failed is retried until it pairs or its code expires,
+    and the chat checkpoint never moves past it.
+    """
+
+    def __init__(self, ingestions=(), timeout=PAIR_TIMEOUT, cache=PAIRING_CACHE):
+        self.ingestions = list(ingestions)
+        self.cache = cache
+        self.timeout = timeout
+        self.pending = {}  # pair_code -> PendingPair
+        self.wheel = TimerWheel()
+        self.bot = None
+        self.loaded = asyncio.Event()  # Set once codes from before a restart are pending again
+        self.tasks = []
+
+    def register(self, discord_id, pair_code, timeout=None):
+        """Starts watching for a pair code in game chat."""
+        self.pending[pair_code] = PendingPair(discord_id, pair_code)
+        self.wheel.schedule(pair_code, self.timeout if timeout is None else timeout)
+
+    def forget(self, pair_code):
+        """Stops watching a pair code. Returns the PendingPair, or None if it wasn't pending."""
+        self.wheel.cancel(pair_code)
+        return self.pending.pop(pair_code, None)
+
+    async def handle_chat(self, event):
+        """Completes the pairing if a chat message contains a pending code."""
+        if PAIR_CODE_PREFIX not in event.message:
+            return False
+
+        pair_match = PAIR_CODE_PATTERN.search(event.message)
+        if not pair_match:
+            return False
+
+        pending = self.pending.get(pair_match.group())
+        if pending is None:
+            return False  # Unknown, expired or someone else's stale code
+
+        return await self.complete(pending, event.steam_id)
+
+    async def complete(self, pending, steam_id):
+        """Stores the Steam ID for a matched code and notifies the user."""
+        completed = await PAIRINGS.complete(pending.discord_id, pending.pair_code, steam_id)
+
+        self.forget(pending.pair_code)
+        self.cache.invalidate(pending.discord_id)
+        if not completed:
+            print(f"❌ No pending pair request found for code {pending.pair_code}")
+            return False
+
+        self.cache.complete(pending.discord_id, steam_id)
+        print(f"✅ Steam ID {steam_id} paired with code {pending.pair_code}")
+        await self.notify(pending.discord_id, (
+            "✅ **Your Foxy Dino account has been successfully paired!**\n\n"
+            "Keep your pair key safe for future reference.\n"
+            f"```{pending.pair_code}```"))
+        return True
+
+    async def expire(self, pair_code):
+        """Deletes an unused pair request once its time is up."""
+        pending = self.pending.pop(pair_code, None)
+        if pending is None:
+            return
+
+        await PAIRINGS.delete_pending(pair_code)
+        self.cache.invalidate(pending.discord_id)
+
+        await self.notify(pending.discord_id, "⚠️ Your pairing request has expired. You may try `/pair` again.")
+
+    async def notify(self, discord_id, message):
+        """DMs the user, never letting a Discord error stop the service."""
+        if not self.bot:
+            return
+        try:
+            await send_dm(self.bot, discord_id, message)
+        except Exception as e:
+            print(f"⚠️ Could not DM pairing result to {discord_id}: {e}")
+
+    async def load_pending(self):
+        """Re-registers pending codes created before a restart with their remaining time."""
+        try:
+            rows = await PAIRINGS.list_pending()
+        except Exception as e:
+            print(f"⚠️ Could not load pending pair codes: {e}")
+            return
+
+        cutoff = datetime.datetime.now() - datetime.timedelta(seconds=self.timeout)
+        for row in rows:
+            try:
+                created_at = datetime.datetime.fromisoformat(row["created_at"])
+                if created_at.tzinfo:
+                    created_at = created_at.astimezone().replace(tzinfo=None)
+            except (TypeError, ValueError):
+                created_at = cutoff
+
+            remaining = (created_at - cutoff).total_seconds()
+            self.register(row["discord_id"], row["pair_code"], timeout=max(remaining, 1))
+
+        print(f"🔹 Watching {len(self.pending)} pending pair codes.")
+
+    def watch(self, ingestion):
+        """Matches codes typed on this server too. Call before start()."""
+        if ingestion not in self.ingestions:
+            self.ingestions.append(ingestion)
+
+    async def try_handle_chat(self, event):
+        """handle_chat, reporting instead of raising. False if the event should be tried again."""
+        try:
+            await self.handle_chat(event)
+        except Exception as e:
+            print(f"❌ Error processing pairing chat, retrying in {RETRY_DELAY}s: {e}")
+            return False
+        return True
+
+    async def watch_chat(self, ingestion):
+        """Matches chat events from one server's log ingestion against pending codes."""
+        subscription = ingestion.subscribe(ChatEvent, name=CHECKPOINT_NAME)
+        unhandled = []  # Events whose pairing failed, oldest first
+        latest = None  # Newest event received
+        try:
+            #  A code typed while the bot was down must be pending before its chat line is replayed
+            await self.loaded.wait()
+            while True:
+                try:
+                    batch = await asyncio.wait_for(subscription.get_batch(), timeout=RETRY_DELAY if unhandled else None)
+                except asyncio.TimeoutError:
+                    batch = []
+
+                events = unhandled + batch
+                latest = batch[-1] if batch else latest
+                unhandled = [event for event in events if not await self.try_handle_chat(event)]
+
+                #  Acks are cumulative, so the checkpoint stops just before the oldest failure
+                if not unhandled:
+                    subscription.ack(latest)
+                elif unhandled[0] is not events[0]:
+                    subscription.ack(events[events.index(unhandled[0]) - 1])
+        finally:
+            subscription.close()
+
+    async def expire_codes(self):
+        """One ticker for every pending code's timeout, starting with codes left from before a restart."""
+        await self.load_pending()
+        self.loaded.set()
+        while True:
+            await asyncio.sleep(self.wheel.tick)
+            for pair_code in self.wheel.advance():
+                try:
+                    await self.expire(pair_code)
+                except Exception as e:
+                    print(f"❌ Error expiring pair code {pair_code}: {e}")
+
+    def start(self, bot):
+        """Starts the chat watcher and expiry ticker if they aren't already running."""
+        self.bot = bot
+        if self.tasks and not any(task.done() for task in self.tasks):
+            return
+
+        for task in self.tasks:
+            task.cancel()
+
+        self.cache.start()
+        self.loaded.clear()
+
+        loop = asyncio.get_running_loop()
+        self.tasks = [loop.create_task(self.watch_chat(ingestion)) for ingestion in self.ingestions]
+        self.tasks.append(loop.create_task(self.expire_codes()))
+
+
+#  Ingestions are added by the server supervisor, in-process or forwarded from worker processes
+PAIRING_SERVICE = PairingService()
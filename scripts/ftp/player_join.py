@@ -0,0 +1,123 @@
+import time
+import asyncio
+from ..rcon.rcon_session import RCON_SESSION, PRIORITY_ROSTER, is_error_response
+from ..rcon.player_data import parse_player_list
+from .log_ingestion import LOG_INGESTION
+from .log_events import PlayerJoinEvent, PlayerLeaveEvent
+
+RECONCILE_INTERVAL = 600  # Seconds between routine playerlist reconciliations
+MIN_RECONCILE_INTERVAL = 60  # Early reconciliations (on a suspected drift) are no more frequent than this
+
+
+class PlayerSessions:
+    """
+    Who is online, kept up to date from join and leave lines in the server log.
+    Lookups are O(1) and cost no RCON; the set is reconciled against playerlist
+    once at startup, every RECONCILE_INTERVAL, and early when a caller reports drift.
+    """
+
+    def __init__(self, ingestion, session, reconcile_interval=RECONCILE_INTERVAL):
+        self.ingestion = ingestion
+        self.session = session
+        self.reconcile_interval = reconcile_interval
+        self.online = {}  # steam_id -> player name ("" until a join line names them)
+        self.changed = None  # steam_id -> joined (True) or left (False), while a playerlist is in flight
+        self.reconciled_at = None
+        self.reconcile_requested = asyncio.Event()
+        self.drift_corrections = 0
+        self.tasks = []
+
+    @property
+    def is_reconciled(self):
+        """True once the set has been checked against playerlist at least once."""
+        return self.reconciled_at is not None
+
+    def is_online(self, steam_id):
+        return steam_id in self.online
+
+    def online_steam_ids(self):
+        """Live, read-only view of the online Steam IDs."""
+        return self.online.keys()
+
+    def handle(self, event):
+        """Applies a join or leave event."""
+        if isinstance(event, PlayerJoinEvent):
+            self.online[event.steam_id] = event.player_name
+        elif isinstance(event, PlayerLeaveEvent):
+            self.online.pop(event.steam_id, None)
+        else:
+            return
+
+        if self.changed is not None:
+            self.changed[event.steam_id] = isinstance(event, PlayerJoinEvent)
+
+    def request_reconcile(self):
+        """Asks for an early playerlist check, e.g. when getplayerdata shows someone we missed."""
+        self.reconcile_requested.set()
+
+    async def reconcile(self):
+        """
+        Corrects the online set from the server's playerlist. Returns False if RCON failed.
+        Players who joined or left while the playerlist was fetched are newer in the log, so they keep their state.
+        """
+        self.changed = {}
+        try:
+            response = await self.session.send_command("playerlist", priority=PRIORITY_ROSTER)
+        finally:
+            changed, self.changed = self.changed, None
+
+        if is_error_response(response):
+            print(f"❌ Unable to reconcile online players: {response}")
+            return False
+
+        steam_ids = parse_player_list(response)
+        absent = [steam_id for steam_id in self.online if steam_id not in steam_ids and steam_id not in changed]
+        missing = [steam_id for steam_id in steam_ids if steam_id not in self.online and steam_id not in changed]
+        for steam_id in absent:
+            del self.online[steam_id]
+        for steam_id in missing:
+            self.online[steam_id] = ""
+
+        if self.is_reconciled and (absent or missing):
+            self.drift_corrections += 1
+        self.reconciled_at = time.monotonic()
+        return True
+
+    async def watch_log(self):
+        """Tracks join and leave events from the shared log ingestion."""
+        subscription = self.ingestion.subscribe(PlayerJoinEvent, PlayerLeaveEvent)
+        try:
+            while True:
+                for event in await subscription.get_batch():
+                    self.handle(event)
+        finally:
+            subscription.close()
+
+    async def reconcile_periodically(self):
+        """Reconciles at startup, then routinely or on request, but never in quick succession."""
+        while True:
+            self.reconcile_requested.clear()  # A request made from here on triggers the next one
+            reconciled = await self.reconcile()
+            await asyncio.sleep(MIN_RECONCILE_INTERVAL)
+            if not reconciled:
+                continue
+
+            try:
+                await asyncio.wait_for(self.reconcile_requested.wait(),
+                                       self.reconcile_interval - MIN_RECONCILE_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        """Starts the log watcher and reconciler if they aren't already running."""
+        if self.tasks and not any(task.done() for task in self.tasks):
+            return
+
+        for task in self.tasks:
+            task.cancel()
+
+        loop = asyncio.get_running_loop()
+        self.tasks = [loop.create_task(self.watch_log()), loop.create_task(self.reconcile_periodically())]
+
+
+PLAYER_SESSIONS = PlayerSessions(LOG_INGESTION, RCON_SESSION)
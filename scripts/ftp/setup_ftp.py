@@ -1,4 +1,6 @@
 from ftp import FTPClient
+from pftp import PersistentFTPClient
+from aftp import AsyncFTPClient
 import os
 
 def setup_ftp():
@@ -10,3 +12,16 @@ def setup_ftp():
         password=os.getenv("FTP_PASS"),
         log_path=os.getenv("FTP_LOG_PATH"),
     )
+
+def setup_persistent_ftp():
+    """Returns a PersistentFTPClient instance using environment variables."""
+    return PersistentFTPClient(
+        host=os.getenv("FTP_HOST"),
+        port=os.getenv("FTP_PORT"),
+        username=os.getenv("FTP_USER"),
+        password=os.getenv("FTP_PASS"),
+    )
+
+def setup_async_ftp():
+    """Returns an AsyncFTPClient wrapping a persistent session from environment variables."""
+    return AsyncFTPClient(setup_persistent_ftp())
@@ -0,0 +1,202 @@
+import re
+from array import array
+from collections import Counter
+
+# One pattern for a whole getplayerdata entry, e.g.
+# PlayerDataName: Foqsi, PlayerID: 76561198000000000, Location: X=... Y=... Z=..., Class: BP_Stegosaurus_C,
+# Growth: 1.000000, Health: 1.000000, Stamina: 1.000000, Hunger: 1.000000, Thirst: 1.000000
+# findall() runs it over the full response in one call instead of several searches per line.
+# Growth and health are captured directly; the remaining stats are kept as one string
+# and only split when something reads them.
+# The fast pattern only knows that exact layout and uses single-character classes, which
+# the regex engine scans quickest. An entry it can't read (a comma in a name, a field the
+# server added) leaves the match count short of the entry count, and the whole response is
+# read again with the lenient pattern, which skips unknown fields a field at a time.
+PLAYER_DATA_PATTERN = re.compile(
+    r"PlayerDataName: ([^,]*), PlayerID: (\d{17})(?:, Location: [^,]*)?, Class: (BP_(\w+)_C|\w+), "
+    r"Growth: ([^,]*), Health: ([^,]*)(?:, (.*))?"
+)
+LENIENT_PLAYER_DATA_PATTERN = re.compile(
+    r"PlayerDataName: ([^\n]*?), PlayerID: (\d{17}), (?:[^,\n]*, )*?Class: (BP_(\w+)_C|\w+), "
+    r"(?:[^,\n]*, )*?Growth: ([\d.]+), (?:[^,\n]*, )*?Health: ([\d.]+)(?:, ([^\n]*))?"
+)
+PLAYER_DATA_ENTRY = "PlayerDataName: "
+STEAM_ID_PATTERN = re.compile(r"7656119\d{10}")  # Every individual account's Steam64 ID starts like this
+
+FIELD_SEPARATOR = ", "
+STAMINA_FIELD = "Stamina: "
+HUNGER_FIELD = "Hunger: "
+THIRST_FIELD = "Thirst: "
+
+
+def species_from_class(dino_class):
+    """BP_Stegosaurus_C -> Stegosaurus"""
+    if dino_class.startswith("BP_") and dino_class.endswith("_C"):
+        return dino_class[3:-2]
+    return dino_class
+
+
+def stat_value(stats, key):
+    """Reads one "Key: value" stat from the rest of a getplayerdata entry, 0 if missing."""
+    for field in stats.split(FIELD_SEPARATOR):
+        if field.startswith(key):
+            try:
+                return float(field[len(key):])
+            except ValueError:
+                break
+    return 0.0
+
+
+class PlayerRecord:
+    """One player's dino as reported by getplayerdata."""
+    __slots__ = ("name", "steam_id", "dino_class", "species", "growth", "health", "stamina", "hunger", "thirst")
+
+    def __init__(self, name, steam_id, dino_class, species, growth, health, stamina, hunger, thirst):
+        self.name = name
+        self.steam_id = steam_id
+        self.dino_class = dino_class
+        self.species = species
+        self.growth = growth
+        self.health = health
+        self.stamina = stamina
+        self.hunger = hunger
+        self.thirst = thirst
+
+    @property
+    def is_alive(self):
+        return self.health > 0.00
+
+    def meets(self, growth=0.0, stamina=0.0):
+        """True if the dino is at least this grown and this rested."""
+        return self.growth >= growth and self.stamina >= stamina
+
+    def __repr__(self):
+        return f"PlayerRecord({self.steam_id}, {self.species}, growth={self.growth}, health={self.health})"
+
+
+def _lazy_stat_column(name, key):
+    """Float array for a stat the roster never needs, split out of the entries on first read."""
+    def column(table):
+        values = table._columns.get(name)
+        if values is None:
+            values = table._columns[name] = array("d", [stat_value(stats, key) for stats in table._stats])
+        return values
+    return property(column, doc=f"{key[:-2]} of every player, as a float array.")
+
+
+def _float_or_zero(value):
+    try:
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
+class PlayerTable:
+    """
+    Parsed getplayerdata payload stored as columns: strings in tuples, stats in float arrays.
+    Species counts, alive filters and threshold checks run over whole columns,
+    and PlayerRecords are only built for the rows asked for.
+    """
+    __slots__ = ("names", "steam_ids", "dino_classes", "species", "health", "skipped",
+                 "_growth", "_stats", "_columns", "_index")
+
+    stamina = _lazy_stat_column("stamina", STAMINA_FIELD)
+    hunger = _lazy_stat_column("hunger", HUNGER_FIELD)
+    thirst = _lazy_stat_column("thirst", THIRST_FIELD)
+
+    def __init__(self, rows=(), skipped=0):
+        names, steam_ids, dino_classes, species, growth, health, stats = list(zip(*rows)) or ((),) * 7
+        self.names = names
+        self.steam_ids = steam_ids
+        self.dino_classes = dino_classes
+        self.species = tuple([blueprint or dino_class for blueprint, dino_class in zip(species, dino_classes)])
+        self._growth = growth  # Converted on first read; the roster only needs species and health
+        self.health = array("d", map(float, health))
+        self.skipped = skipped  # Entries left out because their Steam ID wasn't in the filter
+        self._stats = stats
+        self._columns = {}
+        self._index = None
+
+    @property
+    def growth(self):
+        """Growth of every player, as a float array. An unreadable growth reads as 0."""
+        values = self._columns.get("growth")
+        if values is None:
+            values = self._columns["growth"] = array("d", map(_float_or_zero, self._growth))
+        return values
+
+    def __len__(self):
+        return len(self.steam_ids)
+
+    def __iter__(self):
+        return map(self.record, range(len(self.steam_ids)))
+
+    def record(self, index):
+        """The PlayerRecord for one row."""
+        stats = self._stats[index]
+        return PlayerRecord(
+            self.names[index], self.steam_ids[index], self.dino_classes[index], self.species[index],
+            self.growth[index], self.health[index],
+            stat_value(stats, STAMINA_FIELD), stat_value(stats, HUNGER_FIELD), stat_value(stats, THIRST_FIELD),
+        )
+
+    def get(self, steam_id):
+        """The PlayerRecord for a Steam ID, or None if that player isn't in the table."""
+        if self._index is None:
+            self._index = {steam_id: index for index, steam_id in enumerate(self.steam_ids)}
+        index = self._index.get(steam_id)
+        return None if index is None else self.record(index)
+
+    def species_counts(self, alive_only=True):
+        """Players per species, by default counting only alive dinos."""
+        if not alive_only:
+            return Counter(self.species)
+        return Counter([species for species, health in zip(self.species, self.health) if health > 0.00])
+
+    def species_indexes(self):
+        """Row indexes of every player, grouped by species."""
+        by_species = {}
+        for index, species in enumerate(self.species):
+            by_species.setdefault(species, []).append(index)
+        return by_species
+
+    def meeting(self, growth=0.0, stamina=0.0):
+        """Steam IDs of every dino at least this grown and this rested."""
+        return [
+            steam_id for steam_id, record_growth, record_stamina in zip(self.steam_ids, self.growth, self.stamina)
+            if record_growth >= growth and record_stamina >= stamina
+        ]
+
+
+def _is_numeric(value):
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def parse_player_data(response, steam_ids=None):
+    """
+    Parses a getplayerdata response into a PlayerTable.
+    With `steam_ids` (e.g. from the playerlist), only those players are kept.
+    """
+    rows = PLAYER_DATA_PATTERN.findall(response)
+    if len(rows) != response.count(PLAYER_DATA_ENTRY):
+        rows = LENIENT_PLAYER_DATA_PATTERN.findall(response)
+    skipped = 0
+    if steam_ids is not None:
+        total = len(rows)
+        rows = [row for row in rows if row[1] in steam_ids]
+        skipped = total - len(rows)
+
+    try:
+        return PlayerTable(rows, skipped)
+    except ValueError:
+        #  A malformed health; drop just those entries
+        return PlayerTable([row for row in rows if _is_numeric(row[5])], skipped)
+
+
+def parse_player_list(response):
+    """Returns the set of Steam IDs in a playerlist response."""
+    return set(STEAM_ID_PATTERN.findall(response))
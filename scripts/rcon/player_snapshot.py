@@ -0,0 +1,200 @@
+import time
+import heapq
+import asyncio
+from types import MappingProxyType
+from .rcon_session import RCON_SESSION, PRIORITY_ROSTER, is_error_response
+from .player_data import PlayerTable, parse_player_data, parse_player_list
+from ..ftp.player_join import PLAYER_SESSIONS
+
+POLL_INTERVAL = 15  # Seconds between fallback refreshes while the server is active
+MAX_POLL_INTERVAL = 240  # Fallback refreshes back off to this while nothing happens
+MIN_REFRESH_INTERVAL = 2  # Requested refreshes are coalesced to at most one per this many seconds
+
+
+class PlayerSnapshot:
+    """
+    Immutable view of the server's players at one moment.
+    Only players in the playerlist are included, looked up by Steam ID or grouped by species.
+    """
+    __slots__ = ("version", "taken_at", "table", "_by_species")
+
+    def __init__(self, version, taken_at, table):
+        self.version = version
+        self.taken_at = taken_at
+        self.table = table
+        self._by_species = None
+
+    @property
+    def age(self):
+        """Seconds since the snapshot was taken."""
+        return time.monotonic() - self.taken_at
+
+    def player(self, steam_id):
+        """The PlayerRecord for a Steam ID, or None if that player isn't online."""
+        return self.table.get(steam_id)
+
+    @property
+    def by_species(self):
+        """Read-only mapping of species to the PlayerRecords playing it."""
+        if self._by_species is None:
+            self._by_species = MappingProxyType({
+                species: tuple(map(self.table.record, indexes))
+                for species, indexes in self.table.species_indexes().items()
+            })
+        return self._by_species
+
+    def alive_counts(self):
+        """Number of alive players per species."""
+        return self.table.species_counts(alive_only=True)
+
+
+EMPTY_SNAPSHOT = PlayerSnapshot(0, float("-inf"), PlayerTable())
+
+
+class PlayerSnapshotService:
+    """
+    Single owner of playerlist/getplayerdata polling.
+    Every reader shares the latest snapshot; a reader that needs fresher data asks for
+    a maximum age, and concurrent refresh requests are coalesced into one RCON round trip.
+    Refreshes are driven by request_refresh() (e.g. from log events), with a fallback poll
+    that doubles its interval while nothing happens and snaps back on activity.
+    """
+
+    def __init__(self, session, sessions=None, interval=POLL_INTERVAL, max_interval=MAX_POLL_INTERVAL,
+                 min_refresh_interval=MIN_REFRESH_INTERVAL):
+        self.session = session
+        self.sessions = sessions  # PlayerSessions, replaces the playerlist call once reconciled
+        self.base_interval = interval
+        self.interval = interval
+        self.max_interval = max_interval
+        self.min_refresh_interval = min_refresh_interval
+        self.snapshot = EMPTY_SNAPSHOT
+        self.refreshing = None  # Future of the refresh in flight, if any
+        self.updated = asyncio.Event()
+        self.requested = []  # Heap of monotonic times refreshes were requested for
+        self.wakeup = asyncio.Event()
+        self.retry_at = float("-inf")
+        self.task = None
+
+    async def _online_steam_ids(self, priority):
+        """Online Steam IDs from the log-fed session tracker, or from playerlist until it's reconciled."""
+        if self.sessions is not None and self.sessions.is_reconciled:
+            return self.sessions.online_steam_ids()
+
+        player_list_response = await self.session.send_command("playerlist", priority=priority)
+        if is_error_response(player_list_response):
+            raise ConnectionError(player_list_response)
+        return parse_player_list(player_list_response)
+
+    async def _fetch(self, priority):
+        """Builds a new snapshot from one getplayerdata call, filtered to the online players."""
+        online_steam_ids = await self._online_steam_ids(priority)
+
+        response = await self.session.send_command("getplayerdata", priority=priority)
+        if not response or is_error_response(response):
+            raise ConnectionError(response)
+
+        table = parse_player_data(response, online_steam_ids)
+        if table.skipped and self.sessions is not None and self.sessions.is_reconciled:
+            self.sessions.request_reconcile()  # Someone we don't know is online; maybe a missed join
+        return PlayerSnapshot(self.snapshot.version + 1, time.monotonic(), table)
+
+    async def _refresh(self, priority):
+        try:
+            self.snapshot = await self._fetch(priority)
+        except Exception as e:
+            print(f"❌ Unable to refresh player snapshot: {e}")
+        else:
+            self.updated.set()
+            self.updated = asyncio.Event()
+        finally:
+            self.refreshing = None
+        return self.snapshot
+
+    async def refresh(self, priority=PRIORITY_ROSTER):
+        """Takes a new snapshot, joining a refresh that is already in flight."""
+        if self.refreshing is None:
+            self.refreshing = asyncio.ensure_future(self._refresh(priority))
+        return await asyncio.shield(self.refreshing)
+
+    async def get(self, max_age=None, priority=PRIORITY_ROSTER):
+        """
+        Returns the latest snapshot, refreshing first if it is older than `max_age` seconds.
+        If the refresh fails the previous snapshot is returned; check its age.
+        """
+        if max_age is not None and self.snapshot.age > max_age:
+            return await self.refresh(priority)
+        return self.snapshot
+
+    async def find_untracked(self, steam_id, priority=PRIORITY_ROSTER):
+        """
+        The PlayerRecord of a player the session tracker doesn't have online, straight from the server.
+        Their join may just not be ingested yet. None if the playerlist agrees they're offline.
+        """
+        player_list_response = await self.session.send_command("playerlist", priority=priority)
+        if is_error_response(player_list_response) or steam_id not in parse_player_list(player_list_response):
+            return None
+
+        if self.sessions is not None:
+            self.sessions.request_reconcile()  # Online but unknown; catch the tracker up
+        response = await self.session.send_command("getplayerdata", priority=priority)
+        if not response or is_error_response(response):
+            return None
+        return parse_player_data(response, {steam_id}).get(steam_id)
+
+    async def wait_for_update(self, version):
+        """Waits until a snapshot newer than `version` is available."""
+        while self.snapshot.version <= version:
+            await self.updated.wait()
+        return self.snapshot
+
+    def request_refresh(self, delay=0):
+        """Asks for a refresh in `delay` seconds, and resets the fallback poll to its base interval."""
+        heapq.heappush(self.requested, time.monotonic() + delay)
+        self.interval = self.base_interval
+        self.wakeup.set()
+
+    def _next_refresh_at(self):
+        """When the background loop should refresh next: a due request, or the fallback poll."""
+        due = self.snapshot.taken_at + self.interval
+        if self.requested:
+            due = min(due, max(self.requested[0], self.snapshot.taken_at + self.min_refresh_interval))
+        return max(due, self.retry_at)
+
+    async def run(self):
+        """Refreshes the snapshot when requested, falling back to an adaptive poll."""
+        while True:
+            now = time.monotonic()
+            due = self._next_refresh_at()
+            if due > now:
+                self.wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), due - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            requested = False
+            while self.requested and self.requested[0] <= now:
+                heapq.heappop(self.requested)
+                requested = True
+
+            previous = self.snapshot
+            await self.refresh()
+            if self.snapshot is previous:
+                self.retry_at = time.monotonic() + self.base_interval  # Refresh failed
+            elif not requested:
+                #  A fallback poll: back off while the counts stay the same, snap back if they moved
+                quiet = self.snapshot.alive_counts() == previous.alive_counts()
+                self.interval = min(self.interval * 2, self.max_interval) if quiet else self.base_interval
+
+    def start(self):
+        """Starts background polling, and the session tracker it relies on, if they aren't already running."""
+        if self.sessions is not None:
+            self.sessions.start()
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self.run())
+        return self.task
+
+
+PLAYER_SNAPSHOTS = PlayerSnapshotService(RCON_SESSION, PLAYER_SESSIONS)
@@ -0,0 +1,145 @@
+import time
+import asyncio
+import itertools
+from collections import deque
+from .setup_rcon import setup_rcon
+
+#  Lower runs first: admin commands jump ahead of storage and other player commands,
+#  which jump ahead of roster polling
+PRIORITY_ADMIN = 0
+PRIORITY_STORE = 1
+PRIORITY_ROSTER = 2
+
+LATENCY_SAMPLES = 200  # Recent latencies kept per command for percentiles
+STATS_INTERVAL = 600  # Seconds between latency reports
+
+#  Commands that are safe to send twice. Anything else (announce, kick, ban, ...) may already
+#  have run when the connection broke, so it is never retried blindly
+IDEMPOTENT_COMMANDS = frozenset({"playerlist", "getplayerdata", "serverdetails", "updateplayables"})
+
+
+class CommandStats:
+    """Latency statistics for one RCON command."""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.recent = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, seconds, failed=False):
+        self.count += 1
+        self.errors += int(failed)
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.recent.append(seconds)
+
+    def percentile(self, fraction):
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": self.total_seconds / self.count * 1000 if self.count else 0.0,
+            "p50_ms": self.percentile(0.5) * 1000,
+            "p95_ms": self.percentile(0.95) * 1000,
+            "max_ms": self.max_seconds * 1000,
+        }
+
+
+def is_error_response(response):
+    """True for the error strings AsyncRconClient returns instead of a server response."""
+    return response.startswith(("❌", "⚠️ Timeout"))
+
+
+def is_connection_failure(response):
+    """True if the server couldn't be reached or didn't answer, as opposed to rejecting a command."""
+    return response.startswith(("❌ Cannot send command", "❌ Socket error", "⚠️ Timeout", "❌ RCON error"))
+
+
+class RconSession:
+    """
+    Process-wide RCON session: one authorized connection, with every caller's commands
+    serialized through a priority queue. Reconnects transparently and tracks latency per command.
+    With a supervisor attached, commands fail fast while it reports the server as down.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.queue = asyncio.PriorityQueue()
+        self.sequence = itertools.count()  # FIFO order within a priority
+        self.stats = {}  # command name -> CommandStats
+        self.last_stats_report = time.monotonic()
+        self.supervisor = None  # RconSupervisor, attaches itself
+        self.task = None
+
+    async def send_command(self, command_name, command_data="", priority=PRIORITY_ROSTER, timeout=None):
+        """Queues a command and waits for its response."""
+        if self.supervisor is not None and not self.supervisor.is_available:
+            return self.supervisor.unavailable_response()
+
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((priority, next(self.sequence), command_name, command_data, timeout, future))
+        return await future
+
+    async def _execute(self, command_name, command_data, timeout):
+        response = await self.client.send_command(command_name, command_data, timeout=timeout)
+
+        #  A connection the server dropped while idle fails once; retry reads on a fresh one
+        if response.startswith("❌ Socket error") and command_name in IDEMPOTENT_COMMANDS:
+            response = await self.client.send_command(command_name, command_data, timeout=timeout)
+        return response
+
+    async def run(self):
+        """Executes queued commands one at a time over the shared connection."""
+        while True:
+            _, _, command_name, command_data, timeout, future = await self.queue.get()
+            if future.done():
+                continue  # Caller gave up while the command was queued
+            if self.supervisor is not None and not self.supervisor.is_available:
+                future.set_result(self.supervisor.unavailable_response())
+                continue  # Went down while the command was queued
+
+            started = time.perf_counter()
+            try:
+                response = await self._execute(command_name, command_data, timeout)
+            except Exception as e:
+                response = f"❌ RCON error: {e}"
+
+            stats = self.stats.setdefault(command_name, CommandStats())
+            stats.record(time.perf_counter() - started, is_error_response(response))
+            if self.supervisor is not None:
+                self.supervisor.record(response)
+
+            if not future.done():
+                future.set_result(response)
+            self.report()
+
+    def latency_stats(self):
+        """Per-command latency summary (count, errors, avg/p50/p95/max in ms)."""
+        return {name: stats.summary() for name, stats in self.stats.items()}
+
+    def report(self):
+        """Periodically prints per-command latency."""
+        if time.monotonic() - self.last_stats_report < STATS_INTERVAL:
+            return
+
+        self.last_stats_report = time.monotonic()
+        for name, summary in self.latency_stats().items():
+            print(f"📊 RCON {name}: {summary['count']} calls, {summary['errors']} errors, "
+                  f"p50 {summary['p50_ms']:.0f}ms, p95 {summary['p95_ms']:.0f}ms, max {summary['max_ms']:.0f}ms")
+
+    def start(self):
+        """Starts the command worker if it isn't already running."""
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self.run())
+        return self.task
+
+
+RCON_SESSION = RconSession(setup_rcon())
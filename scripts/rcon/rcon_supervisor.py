@@ -0,0 +1,178 @@
+import time
+import random
+import asyncio
+import datetime
+from zoneinfo import ZoneInfo
+from .rcon_session import RCON_SESSION, PRIORITY_ROSTER, is_connection_failure
+
+HEARTBEAT_INTERVAL = 30  # Seconds without a successful command before serverdetails is sent
+FAILURE_THRESHOLD = 2  # Consecutive connection failures before commands start failing fast
+BASE_BACKOFF = 2  # Seconds before the first reconnect attempt, doubled on every failed attempt
+MAX_BACKOFF = 120
+RESTART_MAX_BACKOFF = 15  # Keep trying often during a scheduled restart, so we're back as soon as the server is
+
+#  Scheduled restarts, announced from 11:50 and 22:50 server time
+SERVER_TIMEZONE = ZoneInfo("America/Chicago")
+RESTART_TIMES = (datetime.time(12, 0), datetime.time(23, 0))
+RESTART_WINDOW_START = datetime.timedelta(minutes=-2)  # Some servers shut down a little early
+RESTART_WINDOW_END = datetime.timedelta(minutes=15)
+
+UNAVAILABLE_RESPONSE = "❌ RCON unavailable"
+
+#  Circuit breaker states
+STATE_CLOSED = "closed"  # Server reachable, commands go through
+STATE_OPEN = "open"  # Server down, commands fail fast until the next reconnect attempt
+STATE_HALF_OPEN = "half_open"  # A reconnect attempt is in flight, commands still fail fast
+
+
+def in_restart_window(now=None):
+    """True around one of the scheduled daily restarts."""
+    now = now or datetime.datetime.now(SERVER_TIMEZONE)
+    for restart_time in RESTART_TIMES:
+        restart = datetime.datetime.combine(now.date(), restart_time, SERVER_TIMEZONE)
+        if restart + RESTART_WINDOW_START <= now < restart + RESTART_WINDOW_END:
+            return True
+    return False
+
+
+class RconSupervisor:
+    """
+    Watches the RCON session's health and acts as its circuit breaker.
+    While the server is reachable a serverdetails heartbeat runs whenever the connection has
+    been idle for `heartbeat_interval`. After `failure_threshold` connection failures in a row
+    (one, during a scheduled restart) the breaker opens: queued and new commands get an
+    immediate "unavailable" response, and only the supervisor tries to reconnect, with
+    exponential backoff and jitter. The first attempt the server accepts closes the breaker
+    and runs the `on_recover` callbacks, so caches and the roster are refreshed right away.
+    """
+
+    def __init__(self, session, heartbeat_interval=HEARTBEAT_INTERVAL, failure_threshold=FAILURE_THRESHOLD,
+                 base_backoff=BASE_BACKOFF, max_backoff=MAX_BACKOFF, clock=time.monotonic):
+        self.session = session
+        self.heartbeat_interval = heartbeat_interval
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.clock = clock
+        self.state = STATE_CLOSED
+        self.failures = 0  # Consecutive connection failures
+        self.attempts = 0  # Failed reconnect attempts since the breaker opened
+        self.retry_at = float("-inf")
+        self.down_since = None
+        self.last_success = float("-inf")
+        self.changed = asyncio.Event()
+        self.on_recover = []  # Called with no arguments when the server is reachable again
+        self.task = None
+        session.supervisor = self
+
+    @property
+    def is_available(self):
+        return self.state == STATE_CLOSED
+
+    @property
+    def is_restarting(self):
+        """True if RCON is down during a scheduled restart."""
+        return not self.is_available and in_restart_window()
+
+    def unavailable_response(self):
+        """The response given to commands while the breaker is open."""
+        reason = "server restarting" if self.is_restarting else "server unreachable"
+        return f"{UNAVAILABLE_RESPONSE}: {reason}"
+
+    def status_message(self):
+        """A user-facing line describing the connection, for commands to reply with."""
+        if self.is_available:
+            return "✅ The server is online."
+        if self.is_restarting:
+            return "🔄 The server is restarting. Try again in a few minutes."
+        retry_in = max(int(self.retry_at - self.clock()), 0)
+        return f"❌ The server isn't responding. Reconnecting in {retry_in}s, try again shortly."
+
+    def record(self, response):
+        """Feeds one command's response into the breaker."""
+        if not is_connection_failure(response):
+            self.failures = 0
+            self.last_success = self.clock()
+            return
+
+        self.failures += 1
+        threshold = 1 if in_restart_window() else self.failure_threshold
+        if self.state == STATE_CLOSED and self.failures >= threshold:
+            self._open()
+
+    def _backoff(self):
+        """Seconds until the next reconnect attempt: exponential, capped, with jitter."""
+        cap = RESTART_MAX_BACKOFF if in_restart_window() else self.max_backoff
+        delay = min(self.base_backoff * 2 ** self.attempts, cap)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def _open(self):
+        if self.state == STATE_CLOSED:
+            self.down_since = self.clock()
+            reason = "scheduled restart" if in_restart_window() else "connection failures"
+            print(f"⚠️ RCON is down ({reason}), failing commands fast until it's back.")
+
+        self.state = STATE_OPEN
+        self.retry_at = self.clock() + self._backoff()
+        self.attempts += 1
+        self.changed.set()
+
+    def _close(self):
+        print(f"✅ RCON is back after {self.clock() - self.down_since:.0f}s.")
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.attempts = 0
+        self.down_since = None
+        self.changed.set()
+
+        for callback in self.on_recover:
+            try:
+                callback()
+            except Exception as e:
+                print(f"❌ Error in RCON recovery callback: {e}")
+
+    async def probe(self):
+        """One reconnect attempt, straight on the client since the session is failing fast."""
+        self.state = STATE_HALF_OPEN
+        response = await self.session.client.send_command("serverdetails")
+        if is_connection_failure(response):
+            self._open()
+            return False
+
+        self.last_success = self.clock()
+        self._close()
+        return True
+
+    async def heartbeat(self):
+        """Checks an idle connection; the session records the outcome."""
+        await self.session.send_command("serverdetails", priority=PRIORITY_ROSTER)
+
+    async def run(self):
+        """Heartbeats while the server is up, and reconnects with backoff while it's down."""
+        while True:
+            try:
+                if self.is_available:
+                    idle = self.clock() - self.last_success
+                    if idle < self.heartbeat_interval:
+                        self.changed.clear()
+                        try:
+                            await asyncio.wait_for(self.changed.wait(), self.heartbeat_interval - idle)
+                        except asyncio.TimeoutError:
+                            pass
+                        continue
+                    await self.heartbeat()
+                else:
+                    await asyncio.sleep(max(self.retry_at - self.clock(), 0))
+                    await self.probe()
+            except Exception as e:
+                print(f"❌ Error in RCON supervisor: {e}")
+                await asyncio.sleep(self.base_backoff)
+
+    def start(self):
+        """Starts the supervisor if it isn't already running."""
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self.run())
+        return self.task
+
+
+RCON_SUPERVISOR = RconSupervisor(RCON_SESSION)
@@ -0,0 +1,217 @@
+import time
+import asyncio
+from utils.timer_wheel import TimerWheel
+from ..ftp.log_events import PlayerJoinEvent, PlayerLeaveEvent, PlayerDeathEvent
+from .rcon_session import PRIORITY_ROSTER, is_error_response
+
+#  Both default to the plain cap check; set them per species for caps that flap
+DEFAULT_HYSTERESIS = 0  # Players below the cap before a disabled species is enabled again
+DEFAULT_MIN_DWELL = 0  # Seconds a disabled species stays disabled before it may be enabled again
+RESYNC_INTERVAL = 900  # Resend an unchanged roster this often, in case the server reset it
+TEMP_UNLOCK_DURATION = 120  # Seconds a temporary unlock lasts
+
+# Log events that change who is playing what
+ROSTER_EVENTS = (PlayerJoinEvent, PlayerLeaveEvent, PlayerDeathEvent)
+SPAWN_FOLLOW_UP = 30  # Joins and deaths are usually followed by a spawn within this many seconds
+
+
+class SpeciesState:
+    """Whether the cap currently allows a species, and since when."""
+    __slots__ = ("enabled", "changed_at")
+
+    def __init__(self, enabled, changed_at):
+        self.enabled = enabled
+        self.changed_at = changed_at
+
+
+class RosterController:
+    """
+    Decides which species are playable and pushes updateplayables only when that set changes.
+    A capped species is disabled as soon as it goes over its cap. Species with a `hysteresis` or
+    `min_dwell` are only enabled again once they have dropped that many players below the cap and
+    stayed disabled that many seconds, so species hovering at their cap don't toggle with every
+    join and death. Without either, a species is enabled again as soon as it is back within its cap.
+    Temporary unlocks expire through a timer wheel that wakes the one roster loop, and
+    player joins, leaves and deaths in the server log trigger a fresh snapshot right away.
+    """
+
+    def __init__(self, session, caps, hysteresis=None, min_dwell=None,
+                 on_change=None, resync_interval=RESYNC_INTERVAL, clock=time.monotonic):
+        self.session = session
+        self.caps = caps  # species -> cap, None for uncapped
+        self.hysteresis = hysteresis or {}  # species -> players, overrides DEFAULT_HYSTERESIS
+        self.min_dwell = min_dwell or {}  # species -> seconds, overrides DEFAULT_MIN_DWELL
+        self.on_change = on_change  # Awaited with (enabled, disabled) after a change is applied
+        self.resync_interval = resync_interval
+        self.clock = clock
+        self.states = {}  # species -> SpeciesState
+        self.unlocks = {}  # species -> who unlocked it, enabled regardless of cap
+        self.expiries = TimerWheel(clock=clock)
+        self.wakeup = asyncio.Event()
+        self.apply_lock = asyncio.Lock()  # One apply() at a time, whether from the loop or a command
+        self.applied = None  # frozenset of species last sent to the server
+        self.applied_at = float("-inf")
+        self.population = {}
+        self.updates_sent = 0
+        self.task = None
+        self.watch_task = None
+
+    def _cap_allows(self, species, count, now):
+        """Cap decision for one capped species, with hysteresis and minimum dwell time."""
+        cap = self.caps[species]
+        state = self.states.get(species)
+        if state is None:
+            self.states[species] = SpeciesState(count <= cap, now)
+            return count <= cap
+
+        if state.enabled:
+            enabled = count <= cap
+        elif now - state.changed_at < self.min_dwell.get(species, DEFAULT_MIN_DWELL):
+            #  Only re-enabling waits out the dwell; going over the cap always disables at once
+            enabled = False
+        else:
+            #  Caps of 0 or below can't drop further below the cap
+            enabled = count <= (max(cap - self.hysteresis.get(species, DEFAULT_HYSTERESIS), 0) if cap >= 0 else cap)
+
+        if enabled != state.enabled:
+            state.enabled = enabled
+            state.changed_at = now
+        return enabled
+
+    def enabled_species(self, population):
+        """The species that should be playable for these per-species alive counts."""
+        now = self.clock()
+        return frozenset(
+            species for species, cap in self.caps.items()
+            if cap is None or species in self.unlocks or self._cap_allows(species, population.get(species, 0), now)
+        )
+
+    def is_unlocked(self, species):
+        return species in self.unlocks
+
+    def unlock(self, species, user=None, duration=TEMP_UNLOCK_DURATION):
+        """
+        Enables a species regardless of its cap for `duration` seconds.
+        Returns False for unknown or already unlocked species. Call apply() to push it right away.
+        """
+        self._expire_unlocks()  # Brings the wheel up to date before scheduling on it
+        if species not in self.caps or species in self.unlocks:
+            return False
+
+        self.unlocks[species] = user
+        self.expiries.schedule(species, duration)
+        self.wakeup.set()
+        return True
+
+    def _expire_unlocks(self):
+        """Drops unlocks whose time is up. Returns the species that expired."""
+        expired = self.expiries.advance()
+        for species in expired:
+            self.unlocks.pop(species, None)
+        return expired
+
+    def resync(self):
+        """Makes the next apply() push the roster even if it hasn't changed, e.g. after a server restart."""
+        self.applied_at = float("-inf")
+        self.wakeup.set()
+
+    async def update(self, population, priority=PRIORITY_ROSTER):
+        """Re-evaluates the roster for new counts; sends RCON only if the enabled set changed."""
+        self.population = population
+        return await self.apply(priority)
+
+    async def apply(self, priority=PRIORITY_ROSTER):
+        """Pushes the roster for the last known counts if it differs from what the server has."""
+        async with self.apply_lock:
+            return await self._apply(priority)
+
+    async def _apply(self, priority):
+        enabled = self.enabled_species(self.population)
+        if enabled == self.applied and self.clock() - self.applied_at < self.resync_interval:
+            return False
+
+        #  Keep the configured order so the roster string is stable
+        roster_string = ",".join(species for species in self.caps if species in enabled)
+        response = await self.session.send_command("updateplayables", roster_string, priority=priority)
+        if is_error_response(response):
+            print(f"❌ Failed to update playable species: {response}")
+            return False
+
+        #  Before the first update every species counts as enabled, so the first one announces what's disabled
+        previous = self.applied if self.applied is not None else frozenset(self.caps)
+        self.applied = enabled
+        self.applied_at = self.clock()
+        self.updates_sent += 1
+
+        #  Only capped species are reported, and temporary unlocks announce themselves
+        order = list(self.caps)
+        newly_enabled = sorted(
+            (species for species in enabled - previous if self.caps[species] is not None and species not in self.unlocks),
+            key=order.index,
+        )
+        newly_disabled = sorted((species for species in previous - enabled if self.caps[species] is not None), key=order.index)
+        if self.on_change and (newly_enabled or newly_disabled):
+            await self.on_change(newly_enabled, newly_disabled)
+        return True
+
+    async def run(self, snapshots):
+        """
+        The roster loop: re-evaluates on every new player snapshot, and wakes up on its own
+        while temporary unlocks are pending so they expire on time.
+        """
+        version = 0
+        next_snapshot = None
+        while True:
+            if next_snapshot is None:
+                next_snapshot = asyncio.ensure_future(snapshots.wait_for_update(version))
+            woken = asyncio.ensure_future(self.wakeup.wait())
+            timeout = self.expiries.tick if len(self.expiries) else None
+
+            try:
+                done, _ = await asyncio.wait({next_snapshot, woken}, timeout=timeout,
+                                             return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                woken.cancel()
+            self.wakeup.clear()
+
+            try:
+                if next_snapshot in done:
+                    snapshot = next_snapshot.result()
+                    next_snapshot = None
+                    version = snapshot.version
+                    self.population = snapshot.alive_counts()
+
+                for species in self._expire_unlocks():
+                    print(f"🔹 Temporary unlock of {species} expired.")
+
+                await self.apply()
+            except Exception as e:
+                print(f"❌ Error in roster loop: {e}")
+                next_snapshot = None
+                await asyncio.sleep(5)  # Retry if something fails
+
+    async def watch_activity(self, ingestion, snapshots):
+        """Asks for a fresh snapshot as soon as the log shows players joining, leaving or dying."""
+        subscription = ingestion.subscribe(*ROSTER_EVENTS)
+        try:
+            while True:
+                batch = await subscription.get_batch()
+                snapshots.request_refresh()
+
+                #  The spawn that follows isn't logged, so look again once it has likely happened
+                if any(not isinstance(event, PlayerLeaveEvent) for event in batch):
+                    snapshots.request_refresh(SPAWN_FOLLOW_UP)
+        finally:
+            subscription.close()
+
+    def start(self, snapshots, ingestion=None):
+        """
+        Starts the roster loop, and the log watcher if an ingestion is given,
+        unless they're already running. Only one of each ever runs.
+        """
+        loop = asyncio.get_running_loop()
+        if ingestion is not None and (self.watch_task is None or self.watch_task.done()):
+            self.watch_task = loop.create_task(self.watch_activity(ingestion, snapshots))
+        if self.task is None or self.task.done():
+            self.task = loop.create_task(self.run(snapshots))
+        return self.task
@@ -1,10 +1,10 @@
 import os
-from prcon import PersistentRconClient
+from arcon import AsyncRconClient
 
 def setup_rcon():
-    """Returns an RconClient instance using environment variables."""
-    return PersistentRconClient(
+    """Returns an AsyncRconClient instance using environment variables."""
+    return AsyncRconClient(
         host=os.getenv("RCON_IP"),
         port=int(os.getenv("RCON_PORT")),
         password=os.getenv("RCON_PASSWORD"),
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,84 @@
+import os
+import json
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# The server configured through .env is always there; others are listed in this file
+SERVERS_CONFIG_FILE = os.getenv("SERVERS_CONFIG", "servers.json")
+DEFAULT_SERVER_NAME = os.getenv("SERVER_NAME", "Main")
+
+#  Keys every extra server must set. Without them the clients would quietly fall back
+#  to the .env credentials and talk to the main server instead.
+REQUIRED_KEYS = ("name", "rcon_host", "rcon_port", "rcon_password",
+                 "ftp_host", "ftp_user", "ftp_password", "ftp_log_path")
+
+
+class ServerConfig:
+    """
+    Connection details and roster settings for one game server.
+    String values may reference environment variables ($NAME), so secrets can stay in .env.
+    """
+
+    def __init__(self, name, rcon_host, rcon_port, rcon_password, ftp_host, ftp_user, ftp_password,
+                 ftp_log_path, ftp_port=21, alerts_channel=None, admin_channel=None,
+                 caps=None, hysteresis=None, min_dwell=None):
+        self.name = name
+        self.rcon_host = rcon_host
+        self.rcon_port = int(rcon_port)
+        self.rcon_password = rcon_password
+        self.ftp_host = ftp_host
+        self.ftp_port = int(ftp_port)
+        self.ftp_user = ftp_user
+        self.ftp_password = ftp_password
+        self.ftp_log_path = ftp_log_path
+        self.alerts_channel = int(alerts_channel) if alerts_channel else None  # Roster changes, main server's if None
+        self.admin_channel = int(admin_channel) if admin_channel else None  # Admin command log, main server's if None
+        self.caps = caps  # species -> cap; the main server's caps if None
+        self.hysteresis = hysteresis or {}
+        self.min_dwell = min_dwell or {}
+
+    @property
+    def slug(self):
+        """Filesystem-safe name, for the server's local log copy and checkpoints."""
+        return "".join(c if c.isalnum() else "_" for c in self.name.lower())
+
+    @classmethod
+    def from_dict(cls, entry):
+        missing = [key for key in REQUIRED_KEYS if not entry.get(key)]
+        if missing:
+            raise ValueError(f"missing {', '.join(missing)}")
+
+        expanded = {key: os.path.expandvars(value) if isinstance(value, str) else value
+                    for key, value in entry.items()}
+        return cls(**expanded)
+
+
+def load_server_configs(path=SERVERS_CONFIG_FILE):
+    """
+    Reads the extra servers from a JSON list of server entries, e.g.
+    [{"name": "Gateway 2", "rcon_host": "1.2.3.4", "rcon_port": 8888, "rcon_password": "$RCON_PASSWORD_2", ...}]
+    A missing file means no extra servers; a broken entry is skipped.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            entries = json.load(file)
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read server config {path}: {e}")
+        return []
+
+    configs = []
+    for entry in entries:
+        try:
+            config = ServerConfig.from_dict(entry)
+        except (TypeError, ValueError) as e:
+            print(f"❌ Skipping server {entry.get('name', '?')} in {path}: {e}")
+            continue
+
+        if config.name == DEFAULT_SERVER_NAME or any(config.name == other.name for other in configs):
+            print(f"❌ Skipping server {config.name} in {path}: duplicate name")
+            continue
+        configs.append(config)
+    return configs
@@ -0,0 +1,206 @@
+import os
+import asyncio
+from arcon import AsyncRconClient
+from aftp import AsyncFTPClient
+from pftp import PersistentFTPClient
+from ..ftp.log_tailer import LogTailer
+from ..ftp.log_checkpoint import CheckpointStore
+from ..ftp.log_ingestion import LogIngestion, LOG_INGESTION, LOCAL_LOG_DIR
+from ..ftp.player_join import PlayerSessions, PLAYER_SESSIONS
+from ..ftp.pairing_service import PAIRING_SERVICE
+from ..ftp.ftp_get_command_logs import get_command_logs, CHANNEL_ID as ADMIN_CHANNEL_ID
+from ..rcon.rcon_session import RconSession, RCON_SESSION, PRIORITY_ADMIN, PRIORITY_STORE
+from ..rcon.rcon_supervisor import RconSupervisor, RCON_SUPERVISOR
+from ..rcon.player_snapshot import PlayerSnapshotService, PLAYER_SNAPSHOTS
+from ..rcon.roster_controller import RosterController
+from ..rcon.rcon_manage_dino_roster import (
+    ROSTER_CONTROLLER, DINO_POPULATION_CAPS, CHANNEL_ID as ALERTS_CHANNEL_ID, notify_dino_changes, unlock_dino_for_temp,
+)
+from .server_config import DEFAULT_SERVER_NAME, load_server_configs
+from .server_targets import SERVER_TARGETS
+from ..workers.remote_server import RemoteServer
+
+SUPERVISE_INTERVAL = 30  # Seconds between checks for crashed worker tasks
+
+#  Run each server's workers in its own process, leaving this one to the Discord gateway and commands
+WORKER_PROCESSES = os.getenv("WORKER_PROCESSES", "0").lower() in ("1", "true", "yes")
+
+
+class ServerGroup:
+    """
+    Everything that works on one game server: its RCON session and supervisor, log ingestion,
+    online-player tracking, player snapshots and roster controller.
+    Groups share the event loop, the Discord bot and the pairing service, and nothing else.
+    """
+
+    def __init__(self, name, session, supervisor, ingestion, sessions, snapshots, roster,
+                 alerts_channel=ALERTS_CHANNEL_ID, admin_channel=ADMIN_CHANNEL_ID):
+        self.name = name
+        self.session = session
+        self.supervisor = supervisor
+        self.ingestion = ingestion
+        self.sessions = sessions
+        self.snapshots = snapshots
+        self.roster = roster
+        self.alerts_channel = alerts_channel
+        self.admin_channel = admin_channel
+        self.label = None  # Server name shown in Discord messages, set when there is more than one
+        self.command_log_task = None
+
+    @classmethod
+    def from_config(cls, config):
+        """Builds a group with its own connections from a ServerConfig."""
+        session = RconSession(AsyncRconClient(config.rcon_host, config.rcon_port, config.rcon_password))
+
+        local_dir = os.path.join(LOCAL_LOG_DIR, config.slug)
+        ftp_client = AsyncFTPClient(PersistentFTPClient(config.ftp_host, config.ftp_port,
+                                                        config.ftp_user, config.ftp_password))
+        ingestion = LogIngestion(
+            LogTailer(ftp_client, config.ftp_log_path, os.path.join(local_dir, "TheIsle-Shipping.log")),
+            CheckpointStore(os.path.join(local_dir, "log_checkpoints.json")),
+        )
+
+        sessions = PlayerSessions(ingestion, session)
+        roster = RosterController(session, config.caps or DINO_POPULATION_CAPS,
+                                  hysteresis=config.hysteresis, min_dwell=config.min_dwell)
+        return cls(config.name, session, RconSupervisor(session), ingestion, sessions,
+                   PlayerSnapshotService(session, sessions), roster,
+                   config.alerts_channel or ALERTS_CHANNEL_ID, config.admin_channel or ADMIN_CHANNEL_ID)
+
+    @property
+    def caps(self):
+        return self.roster.caps
+
+    @property
+    def is_available(self):
+        """False while the server's RCON is down."""
+        return self.supervisor.is_available
+
+    def status_message(self):
+        return self.supervisor.status_message()
+
+    async def send_command(self, command_name, command_data="", priority=PRIORITY_ADMIN):
+        return await self.session.send_command(command_name, command_data, priority=priority)
+
+    async def fetch_player(self, steam_id, max_age, priority=PRIORITY_STORE):
+        """
+        A player's PlayerRecord from a snapshot at most `max_age` seconds old.
+        None if they're offline or no fresh snapshot could be taken.
+        """
+        if self.sessions.is_reconciled and not self.sessions.is_online(steam_id):
+            #  Snapshots only hold players the tracker knows, and their join may not be ingested yet
+            return await self.snapshots.find_untracked(steam_id, priority)
+
+        snapshot = await self.snapshots.get(max_age=max_age, priority=priority)
+        if snapshot.age > max_age:
+            return None  # Refresh failed
+        return snapshot.player(steam_id)
+
+    async def unlock(self, species, user):
+        """Temporarily unlocks a species. False if it's unknown or already unlocked."""
+        return await unlock_dino_for_temp(species, user, self.roster)
+
+    def start_workers(self, on_roster_change):
+        """Starts the RCON, log and roster workers that aren't already running."""
+        self.ingestion.start()
+        self.supervisor.start()
+        self.snapshots.start()
+        self.roster.on_change = on_roster_change
+
+        #  A restarted server has its default roster and nobody online; catch up as soon as RCON is back
+        for callback in (self.roster.resync, self.sessions.request_reconcile, self.snapshots.request_refresh):
+            if callback not in self.supervisor.on_recover:
+                self.supervisor.on_recover.append(callback)
+
+        #  Player joins, leaves and deaths in the server log trigger a re-evaluation right away
+        self.roster.start(self.snapshots, self.ingestion)
+
+    def start(self, bot):
+        """Starts every worker and the admin command relay that aren't already running. Safe to call again."""
+        self.start_workers(lambda enabled, disabled: notify_dino_changes(
+            bot, enabled, disabled, self.alerts_channel, self.label))
+
+        if self.command_log_task is None or self.command_log_task.done():
+            self.command_log_task = asyncio.get_running_loop().create_task(
+                get_command_logs(bot, self.ingestion, self.admin_channel, self.label))
+
+    def tasks(self):
+        """The group's long-running tasks, for supervision."""
+        return [task for task in (self.ingestion.task, self.supervisor.task, self.snapshots.task,
+                                  self.roster.task, self.roster.watch_task, self.command_log_task,
+                                  *self.sessions.tasks) if task is not None]
+
+
+class ServerSupervisor:
+    """
+    Runs one ServerGroup per game server in the bot's event loop, or with `processes`,
+    one worker process per server behind a RemoteServer with the same interface.
+    Adding a server is one entry in the server config; every group is checked periodically
+    and any worker that crashed is restarted, without touching the other servers.
+    """
+
+    def __init__(self, default, configs=(), targets=SERVER_TARGETS, interval=SUPERVISE_INTERVAL, processes=False):
+        groups = [default] + [ServerGroup.from_config(config) for config in configs]
+        if processes:
+            groups = [RemoteServer.for_group(group) for group in groups]
+
+        self.default = groups[0]
+        self.groups = {group.name: group for group in groups}
+
+        if len(self.groups) > 1:
+            for group in self.groups.values():
+                group.label = group.name
+
+        self.targets = targets
+        self.interval = interval
+        self.bot = None
+        self.task = None
+
+    def get(self, name):
+        """A server's group (or RemoteServer) by name, or None."""
+        return self.groups.get(name)
+
+    def target_for(self, discord_id):
+        """The group a user's commands act on: their chosen server, or the main one."""
+        return self.groups.get(self.targets.get(discord_id), self.default)
+
+    def set_target(self, discord_id, name):
+        """Points a user's commands at a server. Returns False for unknown servers."""
+        if name not in self.groups:
+            return False
+        self.targets.set(discord_id, name)
+        return True
+
+    async def supervise(self):
+        """Restarts crashed workers, reporting what went wrong."""
+        while True:
+            await asyncio.sleep(self.interval)
+            for group in self.groups.values():
+                crashed = [task for task in group.tasks() if task.done() and not task.cancelled()]
+                for task in crashed:
+                    print(f"⚠️ Restarting a stopped worker on {group.name}: {task.exception() or 'exited'}")
+
+                if crashed:
+                    try:
+                        group.start(self.bot)
+                    except Exception as e:
+                        print(f"❌ Could not restart workers on {group.name}: {e}")
+
+    def start(self, bot):
+        """Starts every server's workers, the shared pairing watcher and the supervisor."""
+        self.bot = bot
+        for group in self.groups.values():
+            PAIRING_SERVICE.watch(group.ingestion)  # Pair codes may be typed on any server
+            group.start(bot)
+
+        PAIRING_SERVICE.start(bot)
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self.supervise())
+        print(f"🔹 Managing {len(self.groups)} server(s): {', '.join(self.groups)}")
+
+
+#  The server configured through .env keeps the process-wide singletons the rest of the bot already uses
+DEFAULT_SERVER = ServerGroup(DEFAULT_SERVER_NAME, RCON_SESSION, RCON_SUPERVISOR, LOG_INGESTION,
+                             PLAYER_SESSIONS, PLAYER_SNAPSHOTS, ROSTER_CONTROLLER)
+
+SERVERS = ServerSupervisor(DEFAULT_SERVER, load_server_configs(), processes=WORKER_PROCESSES)
@@ -0,0 +1,50 @@
+import os
+import json
+
+SERVER_TARGETS_FILE = os.path.join("data", "server_targets.json")
+
+
+class ServerTargets:
+    """
+    Which game server each Discord user's commands act on, by server name.
+    Kept in memory and written with an atomic replace on every change.
+    """
+
+    def __init__(self, path=SERVER_TARGETS_FILE):
+        self.path = path
+        self.targets = self._load()  # discord_id -> server name
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read server targets, starting fresh: {e}")
+            return {}
+
+    def get(self, discord_id):
+        """The server name a user targets, or None if they never picked one."""
+        return self.targets.get(str(discord_id))
+
+    def set(self, discord_id, server_name):
+        self.targets[str(discord_id)] = server_name
+        self._save()
+
+    def _save(self):
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(self.targets, file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"❌ Could not save server targets: {e}")
+
+
+SERVER_TARGETS = ServerTargets()
@@ -0,0 +1,140 @@
+import hmac
+import pickle
+import asyncio
+import secrets
+from dataclasses import dataclass, field
+
+HEADER_BYTES = 4  # Big-endian length before every frame
+TOKEN_BYTES = 32  # Sent by the worker before anything else
+MAX_FRAME = 64 * 1024 * 1024
+
+
+#  Gateway -> worker
+
+@dataclass(slots=True)
+class Subscribe:
+    """Forward these log event types; durable (checkpointed) if named."""
+    subscription_id: int
+    event_types: tuple
+    name: str | None = None
+
+
+@dataclass(slots=True)
+class Unsubscribe:
+    subscription_id: int
+
+
+@dataclass(slots=True)
+class Ack:
+    """The gateway has processed a durable subscription's events up to this byte offset."""
+    subscription_id: int
+    offset: int
+
+
+@dataclass(slots=True)
+class WorkerCommand:
+    """Base class for requests answered with a Reply carrying the same request_id."""
+    request_id: int
+
+
+@dataclass(slots=True)
+class RconCommand(WorkerCommand):
+    command_name: str
+    command_data: str
+    priority: int
+
+
+@dataclass(slots=True)
+class FetchPlayer(WorkerCommand):
+    steam_id: str
+    max_age: float
+    priority: int
+
+
+@dataclass(slots=True)
+class UnlockSpecies(WorkerCommand):
+    species: str
+    user: str
+
+
+#  Worker -> gateway
+
+@dataclass(slots=True)
+class Reply:
+    """A command's result, or the error that stopped the worker from producing one."""
+    request_id: int
+    result: object
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class EventBatch:
+    subscription_id: int
+    events: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class ServerStatus:
+    """The worker's RCON supervisor state, sent whenever it changes."""
+    available: bool
+    message: str
+
+
+@dataclass(slots=True)
+class RosterChanged:
+    enabled: list
+    disabled: list
+
+
+def new_token():
+    return secrets.token_bytes(TOKEN_BYTES)
+
+
+class IpcChannel:
+    """
+    Length-prefixed pickled messages over an asyncio stream between the gateway and one worker.
+    Only ever connected to a local peer that proved it holds the worker's token.
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host, port, token):
+        """Worker side: connects to the gateway and authenticates."""
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(token)
+        await writer.drain()
+        return cls(reader, writer)
+
+    @classmethod
+    async def accept(cls, reader, writer, token):
+        """Gateway side: returns the channel if the peer sent the right token, otherwise closes it."""
+        try:
+            received = await asyncio.wait_for(reader.readexactly(TOKEN_BYTES), timeout=10)
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+            received = b""
+
+        if not hmac.compare_digest(received, token):
+            writer.close()
+            return None
+        return cls(reader, writer)
+
+    async def send(self, message):
+        data = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+        self.writer.write(len(data).to_bytes(HEADER_BYTES, "big") + data)
+        await self.writer.drain()
+
+    async def receive(self):
+        """The next message. Raises ConnectionError once the peer is gone."""
+        try:
+            length = int.from_bytes(await self.reader.readexactly(HEADER_BYTES), "big")
+            if length > MAX_FRAME:
+                raise ConnectionError(f"IPC frame of {length} bytes is too large")
+            return pickle.loads(await self.reader.readexactly(length))
+        except asyncio.IncompleteReadError as e:
+            raise ConnectionResetError("IPC peer closed the connection") from e
+
+    def close(self):
+        self.writer.close()
@@ -0,0 +1,283 @@
+import os
+import sys
+import time
+import asyncio
+import itertools
+from ..ftp.log_ingestion import LogSubscription
+from ..ftp.ftp_get_command_logs import get_command_logs
+from ..rcon.rcon_session import PRIORITY_ADMIN, PRIORITY_STORE
+from ..rcon.rcon_manage_dino_roster import notify_dino_changes
+from .ipc import (
+    IpcChannel, new_token, Subscribe, Unsubscribe, Ack, RconCommand, FetchPlayer, UnlockSpecies,
+    Reply, EventBatch, ServerStatus, RosterChanged,
+)
+
+WORKER_MODULE = "scripts.workers.server_worker"
+TOKEN_ENV = "WORKER_IPC_TOKEN"
+
+REQUEST_TIMEOUT = 30  # Seconds a command waits for the worker's reply
+CONNECT_TIMEOUT = 60  # Seconds a new worker has to connect back
+RESTART_BACKOFF = 1  # Seconds before restarting a worker that exited, doubled while it keeps exiting
+MAX_RESTART_BACKOFF = 60
+STABLE_UPTIME = 300  # A worker that ran this long resets the backoff
+
+
+class RemoteSubscription(LogSubscription):
+    """
+    A subscription fed by a worker process. Acks are sent back so the worker commits its checkpoint.
+    Batches land in an unbounded inbox and a task of its own moves them into the bounded queue,
+    so a slow consumer never holds up the IPC receive loop and the command replies behind it.
+    """
+
+    def __init__(self, ingestion, subscription_id, event_types, maxsize, name=None):
+        super().__init__(ingestion, event_types, maxsize, name)
+        self.subscription_id = subscription_id
+        self.inbox = asyncio.Queue()  # Lists of events from the worker
+        self.task = None
+
+    def deliver(self, events):
+        """Hands a batch to the forwarding task without waiting."""
+        self.inbox.put_nowait(events)
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self.forward())
+
+    async def forward(self):
+        while True:
+            for event in await self.inbox.get():
+                await self.queue.put(event)
+
+    def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+
+    def ack(self, event):
+        if self.name:
+            self.ingestion.server.post(Ack(self.subscription_id, event.offset))
+
+
+class RemoteIngestion:
+    """
+    Gateway-side view of a worker's LogIngestion, with the same subscribe() API.
+    The worker subscribes on its real ingestion and forwards each batch over IPC.
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self.subscriptions = {}  # subscription_id -> RemoteSubscription
+        self.subscription_ids = itertools.count(1)
+
+    def subscribe(self, *event_types, name=None, maxsize=1000):
+        subscription = RemoteSubscription(self, next(self.subscription_ids), event_types, maxsize, name)
+        self.subscriptions[subscription.subscription_id] = subscription
+        self.server.post(Subscribe(subscription.subscription_id, subscription.event_types, name))
+        return subscription
+
+    def unsubscribe(self, subscription):
+        if self.subscriptions.pop(subscription.subscription_id, None) is not None:
+            subscription.stop()
+            self.server.post(Unsubscribe(subscription.subscription_id))
+
+    def resubscribe(self):
+        """Registers every subscription again with a freshly started worker."""
+        for subscription in self.subscriptions.values():
+            self.server.post(Subscribe(subscription.subscription_id, subscription.event_types, subscription.name))
+
+    def deliver(self, batch):
+        subscription = self.subscriptions.get(batch.subscription_id)
+        if subscription is None:
+            return  # Closed while the batch was in flight
+        subscription.deliver(batch.events)
+
+
+class RemoteServer:
+    """
+    Gateway-side stand-in for a ServerGroup whose workers run in their own process.
+    Commands get the same calls (send_command, fetch_player, unlock, is_available) and
+    consumers the same ingestion subscriptions, all forwarded over IPC. The worker process
+    is started by run() and restarted with backoff whenever it exits, so a crash there
+    never takes down the gateway, and one here takes the worker down with it.
+    """
+
+    def __init__(self, name, caps, alerts_channel, admin_channel):
+        self.name = name
+        self.caps = caps
+        self.alerts_channel = alerts_channel
+        self.admin_channel = admin_channel
+        self.label = None
+        self.ingestion = RemoteIngestion(self)
+        self.channel = None
+        self.outbox = None  # Messages waiting to be written to the connected worker
+        self.requests = {}  # request_id -> future of the Reply
+        self.request_ids = itertools.count(1)
+        self.available = False
+        self.message = "🔄 The server connection is starting. Try again in a moment."
+        self.process = None
+        self.restarts = 0
+        self.bot = None
+        self.task = None
+        self.command_log_task = None
+
+    @classmethod
+    def for_group(cls, group):
+        return cls(group.name, group.caps, group.alerts_channel, group.admin_channel)
+
+    @property
+    def is_available(self):
+        return self.channel is not None and self.available
+
+    def status_message(self):
+        if self.channel is None:
+            return "🔄 The server connection is restarting. Try again in a moment."
+        return self.message
+
+    def post(self, message):
+        """Queues a message for the worker. Dropped while no worker is connected."""
+        if self.outbox is not None:
+            self.outbox.put_nowait(message)
+
+    async def _request(self, command_type, *args):
+        if self.outbox is None:
+            raise ConnectionError("worker not connected")
+
+        request_id = next(self.request_ids)
+        future = asyncio.get_running_loop().create_future()
+        self.requests[request_id] = future
+        self.post(command_type(request_id, *args))
+        try:
+            return await asyncio.wait_for(future, REQUEST_TIMEOUT)
+        finally:
+            self.requests.pop(request_id, None)
+
+    async def send_command(self, command_name, command_data="", priority=PRIORITY_ADMIN):
+        try:
+            return await self._request(RconCommand, command_name, command_data, priority)
+        except (ConnectionError, asyncio.TimeoutError) as e:
+            return f"❌ Cannot send command. Server worker unavailable: {e}"
+
+    async def fetch_player(self, steam_id, max_age, priority=PRIORITY_STORE):
+        try:
+            return await self._request(FetchPlayer, steam_id, max_age, priority)
+        except (ConnectionError, asyncio.TimeoutError):
+            return None
+
+    async def unlock(self, species, user):
+        try:
+            return await self._request(UnlockSpecies, species, str(user))
+        except (ConnectionError, asyncio.TimeoutError):
+            return False
+
+    async def handle(self, message):
+        """Dispatches one message from the worker."""
+        if isinstance(message, Reply):
+            future = self.requests.get(message.request_id)
+            if future is None or future.done():
+                pass
+            elif message.error is not None:
+                future.set_exception(ConnectionError(f"worker error: {message.error}"))
+            else:
+                future.set_result(message.result)
+        elif isinstance(message, EventBatch):
+            self.ingestion.deliver(message)
+        elif isinstance(message, ServerStatus):
+            self.available = message.available
+            self.message = message.message
+        elif isinstance(message, RosterChanged) and self.bot is not None:
+            asyncio.get_running_loop().create_task(notify_dino_changes(
+                self.bot, message.enabled, message.disabled, self.alerts_channel, self.label))
+
+    async def _write(self, channel):
+        while True:
+            await channel.send(await self.outbox.get())
+
+    async def _serve(self, channel):
+        """Exchanges messages with one connected worker until either side goes away."""
+        self.channel = channel
+        self.outbox = asyncio.Queue()
+        self.ingestion.resubscribe()
+        writer = asyncio.get_running_loop().create_task(self._write(channel))
+        try:
+            while True:
+                await self.handle(await channel.receive())
+        finally:
+            writer.cancel()
+            channel.close()
+            self.channel = None
+            self.outbox = None
+            for future in self.requests.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("worker disconnected"))
+
+    async def _run_once(self, port, connected, token):
+        """Starts one worker process and serves it until it exits or disconnects."""
+        self.process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", WORKER_MODULE, self.name, str(port),
+            env={**os.environ, TOKEN_ENV: token.hex()},
+        )
+        loop = asyncio.get_running_loop()
+        exited = loop.create_task(self.process.wait())
+        accepted = loop.create_task(connected.get())
+        try:
+            done, _ = await asyncio.wait({exited, accepted}, timeout=CONNECT_TIMEOUT,
+                                         return_when=asyncio.FIRST_COMPLETED)
+            if accepted in done:
+                serving = loop.create_task(self._serve(accepted.result()))
+                await asyncio.wait({exited, serving}, return_when=asyncio.FIRST_COMPLETED)
+                serving.cancel()
+                await asyncio.wait({serving})  # Lets it clean up, without raising its own error here
+
+                error = None if serving.cancelled() else serving.exception()
+                if isinstance(error, ConnectionError):
+                    print(f"⚠️ Lost the connection to the worker for {self.name}: {error}")
+                elif error is not None:
+                    print(f"❌ Error serving the worker for {self.name}: {error}")
+        finally:
+            accepted.cancel()
+            if not exited.done():
+                self.process.kill()  # Hung or disconnected; a fresh one will take over
+            await exited
+        return self.process.returncode
+
+    async def run(self):
+        """Keeps one worker process running for this server."""
+        token = new_token()
+        connected = asyncio.Queue()
+
+        async def on_connect(reader, writer):
+            channel = await IpcChannel.accept(reader, writer, token)
+            if channel is not None:
+                await connected.put(channel)
+
+        listener = await asyncio.start_server(on_connect, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        backoff = RESTART_BACKOFF
+        try:
+            while True:
+                started = time.monotonic()
+                try:
+                    returncode = await self._run_once(port, connected, token)
+                except OSError as e:
+                    returncode = f"failed to start ({e})"
+
+                if time.monotonic() - started > STABLE_UPTIME:
+                    backoff = RESTART_BACKOFF
+                self.restarts += 1
+                print(f"⚠️ Worker for {self.name} exited ({returncode}), restarting in {backoff}s.")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, MAX_RESTART_BACKOFF)
+        finally:
+            listener.close()
+            if self.process is not None and self.process.returncode is None:
+                self.process.kill()
+
+    def start(self, bot):
+        """Starts the worker process and the admin command relay, unless they're already running."""
+        self.bot = bot
+        loop = asyncio.get_running_loop()
+        if self.task is None or self.task.done():
+            self.task = loop.create_task(self.run())
+        if self.command_log_task is None or self.command_log_task.done():
+            self.command_log_task = loop.create_task(
+                get_command_logs(bot, self.ingestion, self.admin_channel, self.label))
+
+    def tasks(self):
+        return [task for task in (self.task, self.command_log_task) if task is not None]
@@ -0,0 +1,126 @@
+"""
+Runs one game server's workers (log ingestion, RCON, player tracking and roster) in their own
+process for the gateway's multi-process mode, answering the gateway over IPC.
+Started by RemoteServer, one per server:
+    python -m scripts.workers.server_worker <server name> <gateway port>
+with the IPC token in WORKER_IPC_TOKEN. Exits when the gateway goes away.
+"""
+import os
+import sys
+import asyncio
+
+#  This process runs the workers itself, whatever mode the gateway is in
+os.environ["WORKER_PROCESSES"] = "0"
+
+from scripts.servers.server_group import SERVERS
+from scripts.workers.remote_server import TOKEN_ENV
+from scripts.workers.ipc import (
+    IpcChannel, Subscribe, Unsubscribe, Ack, RconCommand, FetchPlayer, UnlockSpecies,
+    Reply, EventBatch, ServerStatus, RosterChanged,
+)
+
+STATUS_INTERVAL = 1  # Seconds between checks of the RCON supervisor state
+
+
+class ServerWorker:
+    """Serves one ServerGroup to the gateway: forwards log events and status, answers commands."""
+
+    def __init__(self, group, channel):
+        self.group = group
+        self.channel = channel
+        self.subscriptions = {}  # subscription_id -> (LogSubscription, forwarding task)
+
+    async def forward(self, subscription_id, subscription):
+        while True:
+            await self.channel.send(EventBatch(subscription_id, await subscription.get_batch()))
+
+    def subscribe(self, message):
+        if message.subscription_id in self.subscriptions:
+            return
+
+        subscription = self.group.ingestion.subscribe(*message.event_types, name=message.name)
+        task = asyncio.get_running_loop().create_task(self.forward(message.subscription_id, subscription))
+        self.subscriptions[message.subscription_id] = (subscription, task)
+
+    def unsubscribe(self, message):
+        subscription, task = self.subscriptions.pop(message.subscription_id, (None, None))
+        if subscription is not None:
+            task.cancel()
+            subscription.close()
+
+    def ack(self, message):
+        """Commits a durable subscription's checkpoint up to the event the gateway acknowledged."""
+        subscription, _ = self.subscriptions.get(message.subscription_id, (None, None))
+        if subscription is None:
+            return
+        for event, _ in subscription.in_flight:
+            if event.offset == message.offset:
+                subscription.ack(event)
+                break
+
+    async def answer(self, message):
+        try:
+            if isinstance(message, RconCommand):
+                result = await self.group.send_command(message.command_name, message.command_data, message.priority)
+            elif isinstance(message, FetchPlayer):
+                result = await self.group.fetch_player(message.steam_id, message.max_age, message.priority)
+            elif isinstance(message, UnlockSpecies):
+                result = await self.group.unlock(message.species, message.user)
+            else:
+                result = None
+        except Exception as e:
+            print(f"❌ Error answering {type(message).__name__}: {e}")
+            if isinstance(message, RconCommand):
+                #  Same shape as an in-process session error, so callers can print or inspect it
+                reply = Reply(message.request_id, f"❌ RCON error: {e}")
+            else:
+                reply = Reply(message.request_id, None, f"{type(e).__name__}: {e}")
+            await self.channel.send(reply)
+            return
+        await self.channel.send(Reply(message.request_id, result))
+
+    async def report_status(self):
+        """Sends the RCON supervisor state to the gateway whenever it changes."""
+        last = None
+        while True:
+            status = ServerStatus(self.group.is_available, self.group.status_message())
+            if status != last:
+                await self.channel.send(status)
+                last = status
+            await asyncio.sleep(STATUS_INTERVAL)
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        self.group.start_workers(lambda enabled, disabled: self.channel.send(RosterChanged(enabled, disabled)))
+        status_task = loop.create_task(self.report_status())
+        try:
+            while True:
+                message = await self.channel.receive()
+                if isinstance(message, Subscribe):
+                    self.subscribe(message)
+                elif isinstance(message, Unsubscribe):
+                    self.unsubscribe(message)
+                elif isinstance(message, Ack):
+                    self.ack(message)
+                else:
+                    loop.create_task(self.answer(message))
+        finally:
+            status_task.cancel()
+
+
+async def main(server_name, port):
+    group = SERVERS.get(server_name)
+    if group is None:
+        print(f"❌ No server named {server_name}")
+        sys.exit(1)
+
+    channel = await IpcChannel.connect("127.0.0.1", port, bytes.fromhex(os.environ[TOKEN_ENV]))
+    print(f"🔹 Worker for {server_name} connected to the gateway.")
+    try:
+        await ServerWorker(group, channel).run()
+    except ConnectionError:
+        print(f"⚠️ Gateway went away, stopping the worker for {server_name}.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1], int(sys.argv[2])))
@@ -0,0 +1,170 @@
+import time
+import asyncio
+import itertools
+from collections import deque
+import discord
+
+MESSAGE_LIMIT = 2000  # Discord's maximum message length
+
+# Discord allows 5 messages per 5 seconds per channel
+RATE_LIMIT_MESSAGES = 5
+RATE_LIMIT_PERIOD = 5.0
+
+STATS_INTERVAL = 60  # Seconds between backlog reports while the queue is non-empty
+RETRY_DELAY = 5  # Seconds before resending a message that failed, doubling up to MAX_RETRY_DELAY
+MAX_RETRY_DELAY = 60
+MAX_SEND_ATTEMPTS = 5  # Transient failures of one message before its lines are dropped
+
+
+def is_permanent_error(error):
+    """True for Discord errors a retry can't fix, e.g. Forbidden or NotFound; 429s and 5xx are transient."""
+    return isinstance(error, discord.HTTPException) and 400 <= error.status < 500 and error.status != 429
+
+
+class ChannelRelay:
+    """
+    Outbound queue for one Discord channel.
+    Consecutive lines are packed into messages of up to 2000 characters and sent
+    no faster than the channel's rate limit. The queue is bounded, and a full queue drops
+    new lines instead of blocking the producer, usually the log ingestion every consumer shares.
+    Lines stay queued until the message carrying them is sent. A failed message is retried
+    up to MAX_SEND_ATTEMPTS times, or dropped at once on a permanent Discord error, so one
+    unusable channel never stalls anything else.
+    """
+
+    def __init__(self, bot, channel_id, maxsize=1000, on_sent=None,
+                 rate=RATE_LIMIT_MESSAGES, period=RATE_LIMIT_PERIOD):
+        self.bot = bot
+        self.channel_id = int(channel_id)
+        self.lines = deque()  # (line, token, enqueued_at), including the message being sent
+        self.maxsize = maxsize
+        self.changed = asyncio.Condition()
+        self.on_sent = on_sent  # Called with the last token of every message sent
+        self.rate = rate
+        self.period = period
+        self.send_times = []  # Monotonic times of recent sends, at most `rate` of them
+        self.sent_messages = 0
+        self.sent_lines = 0
+        self.dropped_lines = 0
+        self.last_lag = 0.0
+        self.last_stats_report = time.monotonic()
+        self.task = None
+
+    async def put(self, line, token=None):
+        """Queues a line. Returns False, dropping it, if the backlog is full."""
+        if len(self.lines) >= self.maxsize:
+            self.dropped_lines += 1
+            self.report()
+            return False
+
+        async with self.changed:
+            self.lines.append((line[:MESSAGE_LIMIT], token, time.monotonic()))
+            self.changed.notify_all()
+        return True
+
+    def stats(self):
+        """Queue depth, age of the oldest queued line, and totals so far."""
+        oldest = self.lines[0][2] if self.lines else None
+        return {
+            "depth": len(self.lines),
+            "oldest_age": time.monotonic() - oldest if oldest else 0.0,
+            "last_lag": self.last_lag,
+            "sent_messages": self.sent_messages,
+            "sent_lines": self.sent_lines,
+            "dropped_lines": self.dropped_lines,
+        }
+
+    async def _wait_for_slot(self):
+        """Sleeps until another message fits in the channel's rate limit window."""
+        now = time.monotonic()
+        self.send_times = [sent for sent in self.send_times if now - sent < self.period]
+        if len(self.send_times) >= self.rate:
+            await asyncio.sleep(self.period - (now - self.send_times[0]))
+
+    def _next_message(self):
+        """Packs the lines at the front of the queue into one message, leaving them queued."""
+        line, token, enqueued_at = self.lines[0]
+        lines = [line]
+        length = len(line)
+
+        for next_line, next_token, _ in itertools.islice(self.lines, 1, None):
+            if length + 1 + len(next_line) > MESSAGE_LIMIT:
+                break
+
+            lines.append(next_line)
+            token = next_token
+            length += 1 + len(next_line)
+
+        return "\n".join(lines), len(lines), token, enqueued_at
+
+    async def _send(self, content):
+        channel = self.bot.get_channel(self.channel_id)
+        if channel is None:
+            channel = await self.bot.fetch_channel(self.channel_id)
+        await channel.send(content)
+
+    def report(self):
+        """Periodically prints the backlog while there is one."""
+        if not self.lines or time.monotonic() - self.last_stats_report < STATS_INTERVAL:
+            return
+
+        self.last_stats_report = time.monotonic()
+        stats = self.stats()
+        print(f"📊 Channel {self.channel_id} relay: {stats['depth']} lines queued, "
+              f"oldest {stats['oldest_age']:.1f}s, last message lag {stats['last_lag']:.1f}s, "
+              f"{stats['dropped_lines']} lines dropped so far")
+
+    async def run(self):
+        """Sends queued lines forever."""
+        retry_delay = RETRY_DELAY
+        attempts = 0
+        while True:
+            async with self.changed:
+                await self.changed.wait_for(lambda: self.lines)
+            await self._wait_for_slot()
+
+            #  Lines that arrived while waiting for a slot go out in the same message
+            content, line_count, token, enqueued_at = self._next_message()
+
+            delivered = True
+            try:
+                await self._send(content)
+            except Exception as e:
+                attempts += 1
+                if not is_permanent_error(e) and attempts < MAX_SEND_ATTEMPTS:
+                    #  Keep the lines and try again; acking later lines would skip past them
+                    print(f"❌ Failed to relay {line_count} lines to channel {self.channel_id}, "
+                          f"retrying in {retry_delay}s: {e}")
+                    await asyncio.sleep(retry_delay)
+                    retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY)
+                    continue
+
+                print(f"❌ Dropping {line_count} lines for channel {self.channel_id} after {attempts} attempt(s): {e}")
+                delivered = False
+            finally:
+                self.send_times.append(time.monotonic())
+
+            retry_delay = RETRY_DELAY
+            attempts = 0
+            async with self.changed:
+                for _ in range(line_count):
+                    self.lines.popleft()
+                self.changed.notify_all()
+
+            if delivered:
+                self.sent_messages += 1
+                self.sent_lines += line_count
+                self.last_lag = time.monotonic() - enqueued_at
+            else:
+                self.dropped_lines += line_count
+
+            #  Dropped lines are acked too: they were given up on, and a replay would only fail again
+            if self.on_sent and token is not None:
+                self.on_sent(token)
+            self.report()
+
+    def start(self):
+        """Starts the sender task if it isn't already running."""
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self.run())
+        return self.task
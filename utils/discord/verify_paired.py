@@ -3,7 +3,7 @@ import asyncio
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from supabase_client import supabase
+from database.pairing_cache import PAIRING_CACHE
 
 async def verify_paired(discord_id):
     """
@@ -14,18 +14,11 @@ async def verify_paired(discord_id):
         - None, error_message (if not paired)
     """
     try:
-        response = (
-            supabase.table("pairings")
-            .select("steam_id, status")
-            .eq("discord_id", discord_id)
-            .execute()
-        )
+        pairing = await PAIRING_CACHE.get(discord_id)
 
-        if not response.data:
+        if not pairing:
             return None, "⚠️ You are not paired. Use `/pair` to link your account."
 
-        pairing = response.data[0]
-
         if pairing["status"] != "completed":
             return None, "⚠️ Your pairing is not completed. Try `/pair` again."
 
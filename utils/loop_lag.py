@@ -0,0 +1,46 @@
+import time
+import asyncio
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop wakes up from a short sleep.
+    Anything blocking the loop (sync I/O, heavy parsing) shows up as lag.
+    """
+
+    def __init__(self, interval=0.5):
+        self.interval = interval
+        self.samples = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+        self.task = None
+
+    async def run(self):
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(time.perf_counter() - started - self.interval, 0.0)
+
+            self.samples += 1
+            self.total_lag += lag
+            self.max_lag = max(self.max_lag, lag)
+
+    def start(self):
+        """Starts sampling if it isn't already running."""
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self.run())
+        return self.task
+
+    def reset(self):
+        """Clears the collected samples."""
+        self.samples = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+
+    def summary(self):
+        """One-line summary for the console."""
+        average = self.total_lag / self.samples if self.samples else 0.0
+        return f"loop lag avg {average * 1000:.1f}ms, max {self.max_lag * 1000:.1f}ms over {self.samples} samples"
+
+
+LOOP_LAG_MONITOR = LoopLagMonitor()
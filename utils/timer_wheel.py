@@ -0,0 +1,60 @@
+import math
+import time
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel: O(1) schedule and cancel for large numbers of timeouts,
+    driven by one ticker calling advance() instead of one sleeping task per timeout.
+    """
+
+    def __init__(self, slots=512, tick=1.0, clock=time.monotonic):
+        self.tick = tick
+        self.clock = clock
+        self.slots = [{} for _ in range(slots)]  # slot -> {key: deadline tick}
+        self.slot_of = {}  # key -> slot index
+        self.current_tick = self._now_tick()
+
+    def _now_tick(self):
+        return int(self.clock() / self.tick)
+
+    def __len__(self):
+        return len(self.slot_of)
+
+    def __contains__(self, key):
+        return key in self.slot_of
+
+    def schedule(self, key, delay):
+        """Fires key after `delay` seconds. Rescheduling an existing key replaces its timer."""
+        self.cancel(key)
+        deadline = self.current_tick + max(1, math.ceil(delay / self.tick))
+        slot = deadline % len(self.slots)
+        self.slots[slot][key] = deadline
+        self.slot_of[key] = slot
+
+    def cancel(self, key):
+        """Removes a pending timer. Returns False if it wasn't scheduled."""
+        slot = self.slot_of.pop(key, None)
+        if slot is None:
+            return False
+        del self.slots[slot][key]
+        return True
+
+    def advance(self):
+        """Moves the wheel up to the current time and returns the keys that expired."""
+        expired = []
+        now_tick = self._now_tick()
+
+        while self.current_tick < now_tick:
+            self.current_tick += 1
+            slot = self.slots[self.current_tick % len(self.slots)]
+            if not slot:
+                continue
+
+            for key, deadline in list(slot.items()):
+                if deadline <= self.current_tick:
+                    del slot[key]
+                    del self.slot_of[key]
+                    expired.append(key)
+
+        return expired